@@ -0,0 +1,131 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple, Sequence
+
+from fastapi import Request, Response, status
+
+from app.repositories.result_types import PostListVersion, PostVersion
+from app.schemas.post import PostSummary, PostSummaryWithFlags
+
+
+class Validators(NamedTuple):
+    """
+    조건부 GET 검증자 (ETag / Last-Modified)
+    """
+    etag: str
+    last_modified: datetime | None = None
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.astimezone(timezone.utc), usegmt=True
+            )
+        return headers
+
+
+def make_etag(*parts, weak: bool = False) -> str:
+    digest = hashlib.sha1(
+        "|".join(str(part) for part in parts).encode()
+    ).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def post_detail_validators(
+    *,
+    post_id: int,
+    user_id: int | None,
+    version: PostVersion
+) -> Validators:
+    """
+    게시글 상세 검증자
+    - liked_by_me가 사용자마다 다르므로 user_id 포함
+    - 조회수는 매 조회마다 바뀌므로 제외하고 약한(W/) ETag 사용
+    """
+    last_modified = max(
+        filter(None, [version.updated_at, version.comments_updated_at])
+    )
+    return Validators(
+        etag=make_etag(post_id, user_id, *version, weak=True),
+        last_modified=last_modified,
+    )
+
+
+def post_list_versions(posts: Sequence[PostSummary]) -> list[PostListVersion]:
+    """
+    조회된 목록에서 행별 버전 정보 추출 (read_post_list_versions와 같은 형태)
+    """
+    return [
+        PostListVersion(
+            p.id, p.updated_at, p.views, p.likes_count, p.comments_count, p.author.nickname,
+            *((p.liked_by_me, p.bookmarked_by_me) if isinstance(p, PostSummaryWithFlags) else ()),
+        )
+        for p in posts
+    ]
+
+
+def post_list_validators(
+    versions: Sequence[PostListVersion],
+    *,
+    has_next_cursor: bool,
+    with_flags: bool
+) -> Validators:
+    """
+    게시글 목록 검증자: 행별 버전 컬럼으로 계산 (직렬화 없이)
+    - 다음 페이지 커서는 마지막 행의 정렬 값 + id로 정해지므로 커서 발급 여부만 포함
+    - 목록에서 빠진 게시글(삭제)은 updated_at 최댓값에 드러나지 않으므로 Last-Modified는 제공하지 않음
+    """
+    parts = [
+        (v.id, v.updated_at.isoformat(), *v[2:])
+        for v in versions
+    ]
+    return Validators(etag=make_etag(has_next_cursor, with_flags, *parts))
+
+
+def has_conditional_headers(request: Request) -> bool:
+    return (
+        "if-none-match" in request.headers
+        or "if-modified-since" in request.headers
+    )
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag.strip().removeprefix("W/")
+
+
+def is_not_modified(
+    request: Request,
+    validators: Validators
+) -> bool:
+    """
+    If-None-Match가 있으면 ETag(약한 비교)로만 판단하고, 없을 때만 If-Modified-Since 확인
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = _opaque_tag(validators.etag)
+        return any(
+            _opaque_tag(tag) == current for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validators.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위이므로 비교 전에 마이크로초 제거
+        return validators.last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def not_modified_response(validators: Validators) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validators.headers(),
+    )
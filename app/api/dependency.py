@@ -1,7 +1,13 @@
+from typing import AsyncIterator
+
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 
+from app.cache.rate_limiter import AuthRateLimiter
+from app.core.enums import UserRole
+from app.core.executor import InFlightLimiter
 from app.core.redis import get_redis
+from app.core.settings import settings
 from app.db.session import async_session_factory
 from app.core.uow import UnitOfWork
 from app.exceptions.types import InvalidTokenException, RuleViolationException
@@ -15,6 +21,8 @@ from app.services.post_service import PostService
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/login")
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/v1/auth/login", auto_error=False)
 
+auth_in_flight = InFlightLimiter(max_in_flight=settings.AUTH_MAX_IN_FLIGHT)
+
 def get_uow() -> UnitOfWork:
     return UnitOfWork(session_factory=async_session_factory)
 
@@ -22,14 +30,30 @@ def get_post_service() -> PostService:
     return PostService(session_factory=async_session_factory, redis_client=get_redis())
 
 def get_comment_service() -> CommentService:
-    return CommentService()
+    return CommentService(redis_client=get_redis())
 
 def get_auth_service() -> AuthService:
-    return AuthService()
+    return AuthService(redis_client=get_redis())
 
 def get_bookmark_service() -> BookmarkService:
     return BookmarkService()
 
+def get_auth_rate_limiter() -> AuthRateLimiter:
+    return AuthRateLimiter(
+        get_redis(),
+        window_seconds=settings.AUTH_RATE_LIMIT_WINDOW_SECONDS,
+        per_ip=settings.AUTH_RATE_LIMIT_PER_IP,
+        per_email=settings.AUTH_RATE_LIMIT_PER_EMAIL,
+        enabled=settings.USE_AUTH_RATE_LIMIT,
+    )
+
+async def limit_auth_in_flight() -> AsyncIterator[None]:
+    """
+    CPU 비용이 큰 인증 엔드포인트의 동시 처리 상한 (초과 시 즉시 503)
+    """
+    async with auth_in_flight.admit():
+        yield
+
 async def get_current_user(
     uow: UnitOfWork = Depends(get_uow),
     token: str = Depends(oauth2_scheme),
@@ -53,11 +77,11 @@ async def get_current_user_optional(
 async def require_admin(
     current_user: UserResponse = Depends(get_current_user),
 ) -> UserResponse:
-    if current_user.role != "admin":        
+    if current_user.role != UserRole.ADMIN:        
         raise RuleViolationException(            
             rule_code="ADMIN_ONLY",
             details={
-                "required_role": "admin",
+                "required_role": UserRole.ADMIN,
                 "current_role": current_user.role,
                 "user_id": current_user.id,
             }
@@ -71,6 +95,8 @@ __all__ = [
     "get_comment_service",
     "get_auth_service",
     "get_bookmark_service",
+    "get_auth_rate_limiter",
+    "limit_auth_in_flight",
     
     "get_current_user",
     "get_current_user_optional",
@@ -0,0 +1,49 @@
+from functools import lru_cache
+from typing import Sequence
+
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_type: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[item_type])
+
+
+def model_response(
+    model: BaseModel,
+    *,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    이미 생성된 응답 모델을 바로 JSON으로 직렬화
+    Response를 반환하면 FastAPI의 response_model 재검증 단계를 건너뜀
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def list_response(
+    items: Sequence[BaseModel],
+    *,
+    item_type: type[BaseModel],
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    응답 모델 목록을 TypeAdapter로 한 번에 JSON 직렬화
+    """
+    return Response(
+        content=_list_adapter(item_type).dump_json(list(items)),
+        status_code=status_code,
+        headers=headers,
+        media_type=JSON_MEDIA_TYPE,
+    )
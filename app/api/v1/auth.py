@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.api.dependency import (
+    get_auth_rate_limiter,
     get_auth_service, 
-    get_uow
+    get_uow,
+    limit_auth_in_flight,
+    require_admin,
 )
+from app.cache.rate_limiter import AuthRateLimiter
+from app.core.security import token_claims_cache
 from app.core.uow import UnitOfWork
 from app.schemas.auth_token import LoginRequest, LogoutRequest, RefreshTokenRequest, TokenResponse
 from app.schemas.user import UserRegister, UserResponse
@@ -15,8 +20,12 @@ router = APIRouter(
     tags=["Auth"]
 )
 
+def _client_ip(request: Request) -> str | None:
+    return request.client.host if request.client else None
+
 @router.post(
     "/login",
+    dependencies=[Depends(limit_auth_in_flight)],
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
     summary="로그인 (JSON)",
@@ -24,9 +33,12 @@ router = APIRouter(
 )
 async def login_json(
     data: LoginRequest,
+    request: Request,
     uow: UnitOfWork = Depends(get_uow),
     svc: AuthService = Depends(get_auth_service),
+    limiter: AuthRateLimiter = Depends(get_auth_rate_limiter),
 ) -> TokenResponse:
+    await limiter.check(ip=_client_ip(request), email=data.email)
     return await svc.login(
         uow, 
         email=data.email,
@@ -35,16 +47,20 @@ async def login_json(
 
 @router.post(
     "/login/form",
+    dependencies=[Depends(limit_auth_in_flight)],
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
     summary="로그인 (Form)",
     description="Swagger UI 등에서 사용하는 OAuth2 Form 데이터(username, password)로 로그인합니다."
 )
 async def login_form(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     uow: UnitOfWork = Depends(get_uow),
     svc: AuthService = Depends(get_auth_service),
+    limiter: AuthRateLimiter = Depends(get_auth_rate_limiter),
 ) -> TokenResponse:
+    await limiter.check(ip=_client_ip(request), email=form_data.username)
     return await svc.login(
         uow,
         email=form_data.username, 
@@ -54,6 +70,7 @@ async def login_form(
 
 @router.post(
     "/refresh",
+    dependencies=[Depends(limit_auth_in_flight)],
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
     summary="토큰 갱신",
@@ -61,9 +78,12 @@ async def login_form(
 )
 async def refresh_token(
     data: RefreshTokenRequest,
+    request: Request,
     uow: UnitOfWork = Depends(get_uow),
     svc: AuthService = Depends(get_auth_service),
+    limiter: AuthRateLimiter = Depends(get_auth_rate_limiter),
 ) -> TokenResponse:
+    await limiter.check(ip=_client_ip(request))
     return await svc.refresh(
         uow, 
         refresh_token=data.refresh_token
@@ -88,6 +108,7 @@ async def logout(
 
 @router.post(
     "/register",
+    dependencies=[Depends(limit_auth_in_flight)],
     response_model=UserResponse,
     status_code=status.HTTP_201_CREATED,
     summary="회원가입",
@@ -95,12 +116,25 @@ async def logout(
 )
 async def register(
     data: UserRegister,
+    request: Request,
     uow: UnitOfWork = Depends(get_uow),
     svc: AuthService = Depends(get_auth_service),
+    limiter: AuthRateLimiter = Depends(get_auth_rate_limiter),
 ) -> UserResponse:
+    await limiter.check(ip=_client_ip(request), email=data.email)
     user = await svc.register(
         uow, 
         data=data
     )
     
-    return user
\ No newline at end of file
+    return user
+
+@router.get(
+    "/admin/token-cache",
+    summary="토큰 디코딩 캐시 통계 (관리자)",
+    description="액세스 토큰 디코딩 메모 캐시의 크기와 히트율을 반환합니다."
+)
+async def token_cache_stats(
+    admin_user: UserResponse = Depends(require_admin),
+) -> dict:
+    return token_claims_cache.stats()
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 from app.api.dependency import (
     get_comment_service, 
     get_uow,
     get_current_user
 )
+from app.api.responses import list_response
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.core.uow import UnitOfWork
 from app.schemas.comment import CommentCreate, CommentPublic, CommentUpdate
 from app.schemas.user import UserResponse
@@ -35,6 +37,32 @@ async def create_comment(
     )    
     return CommentPublic.model_validate(comment)
 
+@router.get(
+    "/{comment_id}/replies",
+    response_model=list[CommentPublic],
+    status_code=status.HTTP_200_OK,
+    summary="대댓글 조회",
+    description=(
+        "comment_id 댓글에 달린 대댓글을 작성순으로 조회합니다. "
+        "다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다."
+    )
+)
+async def read_replies(
+    comment_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="다음 페이지 커서 (X-Next-Cursor)"),
+    uow: UnitOfWork = Depends(get_uow),
+    svc: CommentService = Depends(get_comment_service),
+) -> Response:
+    replies, next_cursor = await svc.read_replies(
+        uow,
+        comment_id=comment_id,
+        limit=limit,
+        cursor=cursor,
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return list_response(replies, item_type=CommentPublic, headers=headers)
+
 @router.patch(
     "/{comment_id}",
     response_model=CommentPublic,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response, status
 
 from app.api.dependency import (
     get_uow,
@@ -7,12 +7,22 @@ from app.api.dependency import (
     get_current_user_optional,
     require_admin,
 )
-from app.core.enums import PostCategory
+from app.api.conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    not_modified_response,
+    post_detail_validators,
+    post_list_validators,
+    post_list_versions,
+)
+from app.api.responses import list_response, model_response
+from app.core.enums import PostCategory, PostSort
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.core.settings import settings
-from app.schemas.comment import CommentPublic
+from app.schemas.comment import CommentPublic, CommentThread
 from app.schemas.error import ErrorResponse
 from app.schemas.like import LikeResult
-from app.schemas.post import PostCreate, PostDetail, PostSummary, PostUpdate, PostDetailCore
+from app.schemas.post import PostCreate, PostDetail, PostSummary, PostSummaryWithFlags, PostUpdate, PostDetailCore
 from app.schemas.user import UserResponse
 from app.core.uow import UnitOfWork
 from app.services.post_service import PostService
@@ -23,64 +33,145 @@ router = APIRouter(
     tags=["Posts"]
 )
 
+@router.get(
+    "/trending",
+    response_model=list[PostSummary],
+    status_code=status.HTTP_200_OK,
+    summary="인기 게시글 조회",
+    description="최근 조회수와 좋아요를 시간 감쇠 점수로 합산한 인기 게시글 목록을 조회합니다."
+)
+async def read_trending_posts(
+    category: PostCategory | None = Query(None, description="카테고리 필터"),
+    limit: int = Query(20, ge=1, le=100),
+    uow: UnitOfWork = Depends(get_uow),
+    svc: PostService = Depends(get_post_service),
+) -> Response:
+    posts = await svc.read_trending_posts(
+        uow,
+        category=category,
+        limit=limit,
+    )
+    return list_response(posts, item_type=PostSummary)
+
 @router.get(
     "/{post_id}",
     response_model=PostDetail,
     status_code=status.HTTP_200_OK,
     summary="게시글 상세 조회",
-    description="post_id로 상세 정보를 조회합니다."
+    description=(
+        "post_id로 상세 정보를 조회합니다. "
+        "ETag / Last-Modified 헤더를 반환하며, If-None-Match / If-Modified-Since가 일치하면 "
+        "본문 없이 304를 반환합니다. (304 응답은 조회수에 포함되지 않음)"
+    )
 )
 async def read_post(
     post_id: int,
+    request: Request,
     background_tasks: BackgroundTasks,
     uow: UnitOfWork = Depends(get_uow),
     request_user: UserResponse | None = Depends(get_current_user_optional),
     svc: PostService = Depends(get_post_service),
-) -> PostDetail:    
+) -> Response:    
     use_cache = settings.USE_VIEWS_COUNTER_CACHE and not settings.TESTING
+    user_id = request_user.id if request_user else None
+
+    # 조건부 요청은 가벼운 버전 조회만으로 먼저 판단
+    if has_conditional_headers(request):
+        version = await svc.read_post_version(
+            uow,
+            post_id=post_id,
+            user_id=user_id,
+            use_like_store=settings.USE_LIKE_WRITE_BEHIND,
+        )
+        validators = post_detail_validators(post_id=post_id, user_id=user_id, version=version)
+        if is_not_modified(request, validators):
+            return not_modified_response(validators)
     
-    post = await svc.read_post_by_id(
+    post, version = await svc.read_post_by_id(
         uow,
         post_id=post_id,
-        user_id=request_user.id if request_user else None,
-        use_views_counter_cache=use_cache   
+        user_id=user_id,
+        use_views_counter_cache=use_cache,
+        use_detail_cache=settings.USE_POST_DETAIL_CACHE,
+        use_comment_cache=settings.USE_COMMENT_PAGE_CACHE,
+        use_like_store=settings.USE_LIKE_WRITE_BEHIND,
     )
 
     if use_cache:
         background_tasks.add_task(
             svc.increment_views_background, 
-            post_id=post_id
+            post_id=post_id,
+            category=post.category,
         )
-        
-    return post
+    
+    validators = post_detail_validators(post_id=post_id, user_id=user_id, version=version)
+    return model_response(post, headers=validators.headers())
 
 @router.get(
     "/",
-    response_model=list[PostSummary],
+    response_model=list[PostSummaryWithFlags] | list[PostSummary],
     status_code=status.HTTP_200_OK,
     summary="게시글 목록 조회",
-    description="카테고리, 제목, 내용, 작성자 필터 및 페이징 처리를 하여 게시글 목록을 조회합니다."
+    description=(
+        "카테고리, 제목, 내용, 작성자 필터 및 페이징 처리를 하여 게시글 목록을 조회합니다. "
+        "sort로 정렬 기준(latest, oldest, popular, most_liked)을 지정합니다. "
+        "다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환하며, cursor를 넘기면 offset 대신 커서 기준으로 조회합니다. (같은 sort에서만 유효) "
+        "q를 넘기면 sort 대신 전문 검색 결과를 관련도순으로 조회합니다. (offset 페이징만 지원) "
+        "ETag 헤더를 반환하며, If-None-Match가 일치하면 본문 없이 304를 반환합니다. "
+        "with_flags를 넘기면 로그인 사용자 기준 liked_by_me / bookmarked_by_me를 함께 반환합니다."
+    )
 )
 async def read_posts_list(
+    request: Request,
     category: PostCategory | None = Query(None, description="카테고리 필터"),
     title: str | None = Query(None, description="제목 검색어"),
     content: str | None = Query(None, description="내용 검색어"),
     author: str | None = Query(None, description="작성자 닉네임"),
-    offset: int = Query(0, ge=0),
+    author_exact: bool = Query(False, description="작성자 닉네임 정확히 일치 여부"),
+    q: str | None = Query(None, description="전문 검색어 (제목+내용, 관련도순 정렬)"),
+    sort: PostSort = Query(PostSort.LATEST, description="정렬 기준"),
+    cursor: str | None = Query(None, description="다음 페이지 커서 (X-Next-Cursor)"),
+    offset: int = Query(0, ge=0, le=settings.POST_LIST_MAX_OFFSET),
     limit: int = Query(20, ge=1, le=100),
+    with_flags: bool = Query(False, description="liked_by_me / bookmarked_by_me 포함 여부"),
     uow: UnitOfWork = Depends(get_uow),
+    request_user: UserResponse | None = Depends(get_current_user_optional),
     svc: PostService = Depends(get_post_service),
-) -> list[PostSummary]:
-    posts = await svc.read_post_list(
-        uow, 
+) -> Response:
+    list_args = dict(
         category=category,
         search_title=title,
         search_content=content,
         author=author,
         offset=offset,
-        limit=limit
+        limit=limit,
+        sort=sort,
+        cursor=cursor,
+        search_query=q,
+        author_exact=author_exact,
+        with_flags=with_flags,
+        viewer_id=request_user.id if request_user else None,
     )
-    return posts
+
+    # 조건부 요청은 가벼운 버전 조회만으로 먼저 판단 (목록 조회 / 직렬화 전에 304)
+    if has_conditional_headers(request):
+        versions, has_next_cursor = await svc.read_post_list_versions(uow, **list_args)
+        validators = post_list_validators(versions, has_next_cursor=has_next_cursor, with_flags=with_flags)
+        if is_not_modified(request, validators):
+            return not_modified_response(validators)
+
+    posts, next_cursor = await svc.read_post_list(uow, **list_args)
+
+    validators = post_list_validators(
+        post_list_versions(posts),
+        has_next_cursor=next_cursor is not None,
+        with_flags=with_flags,
+    )
+    headers = validators.headers()
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    item_type = PostSummaryWithFlags if with_flags else PostSummary
+    return list_response(posts, item_type=item_type, headers=headers)
 
 @router.post(
     "/",
@@ -120,6 +211,23 @@ async def delete_post(
         user_id=request_user.id,
     )
 
+@router.delete(
+    "/admin/{post_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="게시글 강제 삭제 (관리자)",
+    description="관리자가 작성자와 무관하게 게시글을 삭제합니다. (Soft Delete)"
+)
+async def force_delete_post(
+    post_id: int,
+    uow: UnitOfWork = Depends(get_uow),
+    admin_user: UserResponse = Depends(require_admin),
+    svc: PostService = Depends(get_post_service),
+) -> None:
+    await svc.force_delete_post(
+        uow,
+        post_id=post_id,
+    )
+
 @router.get(
     "/admin",
     summary="관리자 테스트용",
@@ -144,6 +252,7 @@ async def toggle_like_post(
         uow,
         post_id=post_id,
         user_id=request_user.id,
+        use_like_store=settings.USE_LIKE_WRITE_BEHIND,
     )
     return LikeResult(liked=liked, likes_count=count)
 
@@ -174,22 +283,59 @@ async def update_post(
     response_model=list[CommentPublic],
     status_code=status.HTTP_200_OK,
     summary="게시글 댓글 조회",
-    description="post_id 게시글에 달린 댓글 목록을 조회합니다."
+    description=(
+        "post_id 게시글에 달린 댓글 목록을 작성순으로 조회합니다. (삭제된 댓글 제외) "
+        "다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환하며, cursor를 넘기면 offset 대신 커서 기준으로 조회합니다."
+    )
 )
 async def read_comments(
     post_id: int,
     limit: int = Query(50, ge=20, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="다음 페이지 커서 (X-Next-Cursor)"),
     uow: UnitOfWork = Depends(get_uow),
     svc: PostService = Depends(get_post_service),
-) -> list[CommentPublic]:
-    comments = await svc.get_comments_for_post(
+) -> Response:
+    comments, next_cursor = await svc.get_comments_for_post(
         uow, 
         post_id=post_id, 
         limit=limit, 
-        offset=offset
+        offset=offset,
+        cursor=cursor,
+        use_comment_cache=settings.USE_COMMENT_PAGE_CACHE,
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return list_response(comments, item_type=CommentPublic, headers=headers)
+
+@router.get(
+    "/{post_id}/comments/tree",
+    response_model=list[CommentThread],
+    status_code=status.HTTP_200_OK,
+    summary="게시글 댓글 트리 조회",
+    description=(
+        "루트 댓글 단위로 페이징하여 댓글 트리를 조회합니다. "
+        "루트마다 앞쪽 replies_limit개의 대댓글과 전체 대댓글 수(reply_count)를 함께 반환하며, "
+        "나머지 대댓글은 GET /v1/comments/{comment_id}/replies로 조회합니다. "
+        "다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다."
+    )
+)
+async def read_comment_tree(
+    post_id: int,
+    limit: int = Query(20, ge=1, le=100, description="루트 댓글 수"),
+    replies_limit: int = Query(3, ge=0, le=20, description="루트별 대댓글 미리보기 수"),
+    cursor: str | None = Query(None, description="다음 페이지 커서 (X-Next-Cursor)"),
+    uow: UnitOfWork = Depends(get_uow),
+    svc: PostService = Depends(get_post_service),
+) -> Response:
+    threads, next_cursor = await svc.read_comment_tree(
+        uow,
+        post_id=post_id,
+        limit=limit,
+        replies_limit=replies_limit,
+        cursor=cursor,
     )
-    return comments
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return list_response(threads, item_type=CommentThread, headers=headers)
 
 @router.post(
     "/{post_id}/bookmark",
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 from app.api.dependency import (
     get_uow,
     get_current_user,
     get_bookmark_service
 )
+from app.api.responses import list_response
 from app.core.uow import UnitOfWork
-from app.schemas.post import PostSummary
+from app.schemas.post import PostSummary, PostSummaryWithFlags
 from app.schemas.user import UserResponse
 from app.services.bookmark_service import BookmarkService
 
@@ -18,22 +19,28 @@ router = APIRouter(
 
 @router.get(
     "/me/bookmarks",
-    response_model=list[PostSummary],
+    response_model=list[PostSummaryWithFlags] | list[PostSummary],
     status_code=status.HTTP_200_OK,
     summary="내 북마크 조회",
-    description="사용자가 북마크한 게시글 목록을 조회합니다."
+    description=(
+        "사용자가 북마크한 게시글 목록을 조회합니다. "
+        "with_flags를 넘기면 liked_by_me / bookmarked_by_me를 함께 반환합니다."
+    )
 )
 async def read_my_bookmarks(
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=20, le=100),    
+    with_flags: bool = Query(False, description="liked_by_me / bookmarked_by_me 포함 여부"),
     uow: UnitOfWork = Depends(get_uow),
     request_user: UserResponse = Depends(get_current_user),
     svc: BookmarkService = Depends(get_bookmark_service),   
-) -> list[PostSummary]:
+) -> Response:
     posts = await svc.read_my_bookmarks(
         uow,
         user_id=request_user.id,
         offset=offset,
-        limit=limit
+        limit=limit,
+        with_flags=with_flags,
     )
-    return posts
\ No newline at end of file
+    item_type = PostSummaryWithFlags if with_flags else PostSummary
+    return list_response(posts, item_type=item_type)
\ No newline at end of file
@@ -0,0 +1,161 @@
+from typing import Callable
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from app.cache.keys import post_comments_gen_key, post_comments_page_key
+from app.schemas.comment import CommentPublic
+
+
+_COMMENTS_ADAPTER = TypeAdapter(list[CommentPublic])
+
+# 동시 수정으로 WATCH가 실패할 때 재시도 횟수 (초과 시 캐시 삭제)
+_MAX_RETRIES = 3
+
+
+class CommentPageCache:
+    """
+    게시글별 댓글 첫 페이지(CommentPublic 목록) 캐시
+
+    다음 페이지 존재 여부를 알 수 있도록 page_size + 1개(capacity)까지 저장한다.
+    댓글 작성/수정/삭제 시 캐시를 무효화하지 않고 WATCH/MULTI로 목록을 직접 고친다.
+    변경마다 세대(gen) 값을 올리고, 조회(miss) 도중 세대가 바뀌었으면 채우지 않아
+    DB 조회 이후 작성된 댓글이 빠진 목록이 저장되지 않는다.
+    """
+    def __init__(self, redis_client: Redis, *, ttl_seconds: int, page_size: int):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.page_size = page_size
+        self.capacity = page_size + 1
+
+    async def get(
+        self,
+        *,
+        post_id: int
+    ) -> tuple[list[CommentPublic] | None, str | None]:
+        """
+        캐시된 첫 페이지와 현재 세대 반환 (miss면 목록은 None)
+        """
+        raw, gen = await self.redis.mget(
+            post_comments_page_key(post_id),
+            post_comments_gen_key(post_id),
+        )
+        if raw is None:
+            return None, gen
+        return _COMMENTS_ADAPTER.validate_json(raw), gen
+
+    async def fill(
+        self,
+        *,
+        post_id: int,
+        comments: list[CommentPublic],
+        gen: str | None
+    ) -> None:
+        """
+        get() 시점의 세대가 그대로일 때만 DB에서 읽은 첫 페이지 저장
+        """
+        gen_key = post_comments_gen_key(post_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                await pipe.watch(gen_key)
+                if await pipe.get(gen_key) != gen:
+                    return
+
+                pipe.multi()
+                pipe.set(
+                    post_comments_page_key(post_id),
+                    _COMMENTS_ADAPTER.dump_json(comments[:self.capacity]),
+                    ex=self.ttl_seconds,
+                )
+                await pipe.execute()
+        except WatchError:
+            pass
+
+    async def append(
+        self,
+        *,
+        comment: CommentPublic
+    ) -> None:
+        """
+        새 댓글을 첫 페이지 끝에 추가 (페이지가 가득 찼으면 첫 페이지는 그대로)
+        커밋 이후의 조회가 이미 이 댓글을 포함해 채웠으면 다시 추가하지 않음
+        """
+        def _append(comments: list[CommentPublic]) -> list[CommentPublic]:
+            if any(c.id == comment.id for c in comments):
+                return comments
+            if len(comments) < self.capacity:
+                comments.append(comment)
+            return comments
+
+        await self._modify(post_id=comment.post_id, update=_append)
+
+    async def replace(
+        self,
+        *,
+        comment: CommentPublic
+    ) -> None:
+        """
+        수정된 댓글이 첫 페이지에 있으면 교체
+        """
+        def _replace(comments: list[CommentPublic]) -> list[CommentPublic]:
+            return [comment if c.id == comment.id else c for c in comments]
+
+        await self._modify(post_id=comment.post_id, update=_replace)
+
+    async def remove(
+        self,
+        *,
+        post_id: int,
+        comment_id: int
+    ) -> None:
+        """
+        삭제된 댓글을 첫 페이지에서 제거
+        페이지가 가득 차 있었다면 뒤에서 채워질 댓글을 알 수 없으므로 캐시 삭제
+        """
+        def _remove(comments: list[CommentPublic]) -> list[CommentPublic] | None:
+            remaining = [c for c in comments if c.id != comment_id]
+            if len(remaining) < len(comments) and len(comments) == self.capacity:
+                return None
+            return remaining
+
+        await self._modify(post_id=post_id, update=_remove)
+
+    async def _modify(
+        self,
+        *,
+        post_id: int,
+        update: Callable[[list[CommentPublic]], list[CommentPublic] | None]
+    ) -> None:
+        """
+        WATCH/MULTI로 캐시된 목록을 읽고-고쳐-쓰기 + 세대 증가
+        update가 None을 반환하면 캐시 삭제
+        """
+        page_key = post_comments_page_key(post_id)
+        gen_key = post_comments_gen_key(post_id)
+
+        for _ in range(_MAX_RETRIES):
+            try:
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    await pipe.watch(page_key)
+                    raw = await pipe.get(page_key)
+
+                    pipe.multi()
+                    if raw is not None:
+                        comments = update(_COMMENTS_ADAPTER.validate_json(raw))
+                        if comments is None:
+                            pipe.delete(page_key)
+                        else:
+                            pipe.set(page_key, _COMMENTS_ADAPTER.dump_json(comments), keepttl=True)
+                    pipe.incr(gen_key)
+                    pipe.expire(gen_key, self.ttl_seconds)
+                    await pipe.execute()
+                    return
+            except WatchError:
+                continue
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(page_key)
+            pipe.incr(gen_key)
+            pipe.expire(gen_key, self.ttl_seconds)
+            await pipe.execute()
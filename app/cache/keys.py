@@ -0,0 +1,52 @@
+def post_views_key(post_id: int) -> str:
+    return f"post:views:{post_id}"
+
+def post_likes_key(post_id: int) -> str:
+    return f"post:likes:{post_id}"
+
+def post_detail_version_key(post_id: int) -> str:
+    return f"post:detail:ver:{post_id}"
+
+def post_detail_key(post_id: int, version: int) -> str:
+    return f"post:detail:{post_id}:{version}"
+
+def post_views_delta_key(post_id: int) -> str:
+    return f"post:views:delta:{post_id}"
+
+POST_VIEWS_DELTA_PREFIX = "post:views:delta:"
+POST_VIEWS_DIRTY_KEY = "post:views:dirty"
+
+def scheduler_lock_key(job_id: str) -> str:
+    return f"scheduler:lock:{job_id}"
+
+def post_likers_key(post_id: int) -> str:
+    return f"post:likers:{post_id}"
+
+def post_likes_pending_key(post_id: int) -> str:
+    return f"post:likes:pending:{post_id}"
+
+def post_likes_category_key(post_id: int) -> str:
+    return f"post:likes:category:{post_id}"
+
+POST_LIKES_PENDING_PREFIX = "post:likes:pending:"
+POST_LIKES_DIRTY_KEY = "post:likes:dirty"
+
+def trending_key(category: str | None = None) -> str:
+    return f"trending:posts:{category or 'all'}"
+
+TRENDING_CATEGORIES_KEY = "trending:categories"
+
+def post_comments_page_key(post_id: int) -> str:
+    return f"post:comments:first:{post_id}"
+
+def post_comments_gen_key(post_id: int) -> str:
+    return f"post:comments:gen:{post_id}"
+
+def user_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+def auth_rate_ip_key(ip: str) -> str:
+    return f"ratelimit:auth:ip:{ip}"
+
+def auth_rate_email_key(email: str) -> str:
+    return f"ratelimit:auth:email:{email.lower()}"
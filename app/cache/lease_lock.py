@@ -0,0 +1,39 @@
+import uuid
+
+from redis.asyncio import Redis
+
+
+# 자신이 잡은 락일 때만 삭제 (다른 워커가 재획득한 락을 지우지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaseLock:
+    """
+    Redis 임대(lease) 락
+    - SET NX PX로 획득, 만료 시간이 지나면 자동 해제되어 워커가 죽어도 락이 남지 않음
+    """
+    def __init__(
+        self,
+        redis_client: Redis,
+        *,
+        key: str,
+        ttl_ms: int
+    ):
+        self.redis = redis_client
+        self.key = key
+        self.ttl_ms = ttl_ms
+        self.token = uuid.uuid4().hex
+        self._release = redis_client.register_script(_RELEASE_SCRIPT)
+
+    async def acquire(self) -> bool:
+        return bool(
+            await self.redis.set(self.key, self.token, nx=True, px=self.ttl_ms)
+        )
+
+    async def release(self) -> None:
+        await self._release(keys=[self.key], args=[self.token])
@@ -0,0 +1,207 @@
+from redis.asyncio import Redis
+
+from app.cache.keys import (
+    POST_LIKES_DIRTY_KEY,
+    POST_LIKES_PENDING_PREFIX,
+    post_likers_key,
+    post_likes_category_key,
+    post_likes_key,
+    post_likes_pending_key,
+)
+from app.core.enums import PostCategory
+
+
+# 좋아요 집합이 적재된 게시글임을 표시하는 멤버 (좋아요 0개인 게시글도 키가 유지되도록)
+_LOADED_MARKER = "0"
+
+# 좋아요 토글 + 좋아요 수 갱신 + 미반영 작업 기록 (원자적 실행)
+# 집합이나 카테고리가 적재되지 않은 게시글이면 nil 반환
+_TOGGLE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local category = redis.call('GET', KEYS[5])
+if not category then
+    return nil
+end
+local liked = 1
+if redis.call('SREM', KEYS[1], ARGV[1]) == 1 then
+    liked = 0
+else
+    redis.call('SADD', KEYS[1], ARGV[1])
+end
+local count = redis.call('SCARD', KEYS[1]) - 1
+redis.call('SET', KEYS[2], count)
+redis.call('HSET', KEYS[3], ARGV[1], liked)
+redis.call('SADD', KEYS[4], ARGV[2])
+return {liked, count, category}
+"""
+
+# 카테고리 기록 + DB의 좋아요 사용자 목록으로 집합 적재 (집합이 이미 적재된 경우 카테고리만 기록)
+_LOAD_SCRIPT = """
+redis.call('SET', KEYS[3], ARGV[1])
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('SADD', KEYS[1], ARGV[2])
+for i = 3, #ARGV, 1000 do
+    redis.call('SADD', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+redis.call('SET', KEYS[2], #ARGV - 2)
+return 1
+"""
+
+# dirty 집합에서 게시글 id를 꺼내고, 각 게시글의 미반영 작업(user_id -> 최종 상태)을 읽으면서 삭제
+_DRAIN_SCRIPT = """
+local ids = redis.call('SPOP', KEYS[1], ARGV[1])
+local result = {}
+for _, id in ipairs(ids) do
+    local key = ARGV[2] .. id
+    local ops = redis.call('HGETALL', key)
+    redis.call('DEL', key)
+    if #ops > 0 then
+        table.insert(result, id)
+        table.insert(result, ops)
+    end
+end
+return result
+"""
+
+
+class LikeStore:
+    """
+    Redis 좋아요 저장소 (Write-Behind)
+
+    - post:likers:{id}: 좋아요한 사용자 id 집합 (적재 표시 멤버 "0" 포함)
+    - post:likes:{id}: 좋아요 수
+    - post:likes:pending:{id}: 아직 DB에 반영되지 않은 작업 (user_id -> 1: 좋아요, 0: 취소)
+    - post:likes:dirty: 미반영 작업이 있는 게시글 id 집합
+    - post:likes:category:{id}: 게시글 카테고리 (토글 시 카테고리 랭킹 반영용)
+
+    같은 사용자의 작업은 최종 상태만 남으므로, 반영 시 삽입/삭제 중 하나만 실행된다.
+    """
+    def __init__(self, redis_client: Redis):
+        self.redis = redis_client
+        self._toggle = redis_client.register_script(_TOGGLE_SCRIPT)
+        self._load = redis_client.register_script(_LOAD_SCRIPT)
+        self._drain = redis_client.register_script(_DRAIN_SCRIPT)
+
+    async def toggle(
+        self,
+        *,
+        post_id: int,
+        user_id: int
+    ) -> tuple[bool, int, PostCategory] | None:
+        """
+        좋아요 토글 후 (좋아요 여부, 좋아요 수, 카테고리) 반환
+        집합이나 카테고리가 적재되지 않은 게시글이면 None 반환
+        """
+        result = await self._toggle(
+            keys=[
+                post_likers_key(post_id),
+                post_likes_key(post_id),
+                post_likes_pending_key(post_id),
+                POST_LIKES_DIRTY_KEY,
+                post_likes_category_key(post_id),
+            ],
+            args=[user_id, post_id],
+        )
+        if result is None:
+            return None
+
+        liked, count, category = result
+        return bool(liked), int(count), PostCategory(category)
+
+    async def load(
+        self,
+        *,
+        post_id: int,
+        category: PostCategory,
+        user_ids: list[int]
+    ) -> None:
+        await self._load(
+            keys=[
+                post_likers_key(post_id),
+                post_likes_key(post_id),
+                post_likes_category_key(post_id),
+            ],
+            args=[category.value, _LOADED_MARKER, *user_ids],
+        )
+
+    async def set_category(
+        self,
+        *,
+        post_id: int,
+        category: PostCategory
+    ) -> None:
+        """
+        게시글 카테고리 변경 반영 (적재된 게시글만)
+        """
+        await self.redis.set(post_likes_category_key(post_id), category.value, xx=True)
+
+    async def get_state(
+        self,
+        *,
+        post_id: int,
+        user_id: int | None
+    ) -> tuple[bool, int] | None:
+        """
+        (liked_by_me, 좋아요 수) 반환
+        집합이 적재되지 않은 게시글이면 None 반환
+        """
+        likers_key = post_likers_key(post_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(likers_key)
+            pipe.sismember(likers_key, user_id or _LOADED_MARKER)
+            pipe.scard(likers_key)
+            loaded, is_member, size = await pipe.execute()
+
+        if not loaded:
+            return None
+        return bool(user_id and is_member), int(size) - 1
+
+    async def forget(
+        self,
+        *,
+        post_id: int
+    ) -> None:
+        """
+        삭제된 게시글의 좋아요 집합 제거 (이후 토글은 DB 확인을 거침)
+        """
+        await self.redis.delete(post_likers_key(post_id), post_likes_category_key(post_id))
+
+    async def drain(
+        self,
+        *,
+        batch_size: int
+    ) -> dict[int, dict[int, bool]]:
+        """
+        최대 batch_size개 게시글의 미반영 작업을 꺼내고 Redis에서 제거
+        """
+        flat = await self._drain(
+            keys=[POST_LIKES_DIRTY_KEY],
+            args=[batch_size, POST_LIKES_PENDING_PREFIX],
+        )
+        return {
+            int(post_id): {
+                int(user_id): state == "1"
+                for user_id, state in zip(ops[::2], ops[1::2])
+            }
+            for post_id, ops in zip(flat[::2], flat[1::2])
+        }
+
+    async def restore(
+        self,
+        *,
+        ops: dict[int, dict[int, bool]]
+    ) -> None:
+        """
+        DB 반영에 실패한 작업을 다시 적재
+        그 사이 새로 기록된 작업이 있으면 새 작업을 유지 (HSETNX)
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for post_id, user_ops in ops.items():
+                for user_id, liked in user_ops.items():
+                    pipe.hsetnx(post_likes_pending_key(post_id), user_id, int(liked))
+                pipe.sadd(POST_LIKES_DIRTY_KEY, post_id)
+            await pipe.execute()
@@ -0,0 +1,67 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+
+V = TypeVar("V")
+
+
+class TTLLRUCache(Generic[V]):
+    """
+    프로세스 내 LRU 캐시 (항목별 만료 시각 지원)
+
+    이벤트 루프 단일 스레드에서만 사용하므로 잠금 없이 동작한다.
+    max_size를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다.
+    get() 결과로 히트/미스를 집계한다 (stats()).
+    """
+    def __init__(self, *, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> V | None:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._items[key]
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, *, ttl_seconds: float | None = None) -> None:
+        """
+        ttl_seconds가 없으면 기본 TTL 사용
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._items[key] = (time.monotonic() + ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,75 @@
+from redis.asyncio import Redis
+
+from app.cache.keys import (
+    post_detail_key,
+    post_detail_version_key,
+    post_likes_key,
+    post_views_key,
+)
+from app.schemas.post import PostDetailCore
+
+
+class PostDetailCache:
+    """
+    게시글 상세(PostDetailCore) Read-through 캐시
+
+    본문 키에 게시글별 버전을 포함시키고, 무효화 시에는 버전만 증가시킨다.
+    조회(miss) 도중 수정이 일어나도 이전 버전으로 저장된 본문은 다시 읽히지 않는다.
+    조회수/좋아요 수는 캐시 본문이 아닌 조회 시점의 카운터 키 값으로 덮어쓴다.
+    """
+    def __init__(self, redis_client: Redis, *, ttl_seconds: int):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    async def get(
+        self,
+        *,
+        post_id: int
+    ) -> tuple[PostDetailCore | None, int]:
+        """
+        캐시된 게시글과 현재 버전 반환
+        본문 또는 카운터 중 하나라도 없으면 miss(None) 처리
+        """
+        version = int(await self.redis.get(post_detail_version_key(post_id)) or 0)
+
+        raw, views, likes_count = await self.redis.mget(
+            post_detail_key(post_id, version),
+            post_views_key(post_id),
+            post_likes_key(post_id),
+        )
+        if raw is None or views is None or likes_count is None:
+            return None, version
+
+        post = PostDetailCore.model_validate_json(raw)
+        post.views = int(views)
+        post.likes_count = int(likes_count)
+        return post, version
+
+    async def set(
+        self,
+        *,
+        post: PostDetailCore,
+        version: int
+    ) -> None:
+        """
+        get() 시점에 읽은 버전으로 본문 저장
+        """
+        version_key = post_detail_version_key(post.id)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(post_detail_key(post.id, version), post.model_dump_json(), ex=self.ttl_seconds)
+            # 버전 키는 본문보다 오래 살아야 버전이 0으로 되돌아가도 이전 본문이 남지 않는다
+            pipe.expire(version_key, self.ttl_seconds * 2)
+            await pipe.execute()
+
+    async def invalidate(
+        self,
+        *,
+        post_id: int
+    ) -> None:
+        version_key = post_detail_version_key(post_id)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.incr(version_key)
+            pipe.expire(version_key, self.ttl_seconds * 2)
+            await pipe.execute()
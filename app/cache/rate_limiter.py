@@ -0,0 +1,90 @@
+import math
+import time
+import uuid
+
+from redis.asyncio import Redis
+
+from app.cache.keys import auth_rate_email_key, auth_rate_ip_key
+from app.exceptions.types import TooManyRequestsException
+
+
+class SlidingWindowLimiter:
+    """
+    Redis ZSET 기반 슬라이딩 윈도 카운터
+
+    키마다 (윈도 밖 항목 제거 -> 이번 요청 추가 -> 개수/가장 오래된 항목 조회)를
+    MULTI/EXEC 한 번으로 처리한다. 거절된 요청도 윈도에 기록되므로 폭주가 계속되면 계속 거절된다.
+    """
+    def __init__(self, redis_client: Redis, *, window_seconds: int):
+        self.redis = redis_client
+        self.window_seconds = window_seconds
+
+    async def hit(self, limits: dict[str, int]) -> None:
+        """
+        limits: {키: 윈도 내 허용 횟수}
+
+        Raises:
+            TooManyRequestsException: 한 키라도 허용 횟수를 넘은 경우 (Retry-After: 가장 오래된 기록이 윈도를 벗어날 때까지)
+        """
+        now = time.time()
+        member = f"{now}:{uuid.uuid4().hex}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for key in limits:
+                pipe.zremrangebyscore(key, 0, now - self.window_seconds)
+                pipe.zadd(key, {member: now})
+                pipe.zcard(key)
+                pipe.zrange(key, 0, 0, withscores=True)
+                pipe.expire(key, self.window_seconds)
+            results = await pipe.execute()
+
+        retry_after = 0
+        for i, limit in enumerate(limits.values()):
+            count, oldest = results[i * 5 + 2], results[i * 5 + 3]
+            if count > limit:
+                oldest_at = oldest[0][1] if oldest else now
+                retry_after = max(retry_after, math.ceil(oldest_at + self.window_seconds - now), 1)
+
+        if retry_after:
+            raise TooManyRequestsException(retry_after_seconds=retry_after)
+
+
+class AuthRateLimiter:
+    """
+    인증 엔드포인트용 IP/이메일별 요청 제한
+    해시 연산 전에 호출해 초과 요청을 빠르게 429로 돌려보낸다.
+    """
+    def __init__(
+        self,
+        redis_client: Redis,
+        *,
+        window_seconds: int,
+        per_ip: int,
+        per_email: int,
+        enabled: bool = True,
+    ):
+        self.limiter = SlidingWindowLimiter(redis_client, window_seconds=window_seconds)
+        self.per_ip = per_ip
+        self.per_email = per_email
+        self.enabled = enabled
+
+    async def check(
+        self,
+        *,
+        ip: str | None,
+        email: str | None = None
+    ) -> None:
+        """
+        Raises:
+            TooManyRequestsException: IP 또는 이메일 기준 허용 횟수를 넘은 경우
+        """
+        if not self.enabled:
+            return
+
+        limits: dict[str, int] = {}
+        if ip:
+            limits[auth_rate_ip_key(ip)] = self.per_ip
+        if email:
+            limits[auth_rate_email_key(email)] = self.per_email
+        if limits:
+            await self.limiter.hit(limits)
@@ -0,0 +1,128 @@
+from redis.asyncio import Redis
+
+from app.cache.keys import TRENDING_CATEGORIES_KEY, trending_key
+from app.core.enums import PostCategory
+
+
+class TrendingBoard:
+    """
+    인기 게시글 랭킹 (Redis Sorted Set)
+
+    - trending:posts:all / trending:posts:{category}: 게시글별 점수
+    - trending:categories: 게시글 id -> 카테고리 (카테고리를 모르는 갱신/삭제용)
+
+    조회/좋아요 시 점수를 가산하고, 스케줄러가 주기적으로 모든 점수에 감쇠 계수를 곱해
+    최근 반응이 많은 게시글이 상위에 오도록 한다. (시간 감쇠)
+    """
+    def __init__(self, redis_client: Redis):
+        self.redis = redis_client
+
+    async def record(
+        self,
+        *,
+        post_id: int,
+        weight: float,
+        category: PostCategory | None = None
+    ) -> None:
+        """
+        게시글 점수 가산 (전체 + 카테고리 랭킹)
+        """
+        if category is None:
+            category = await self._get_category(post_id=post_id)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zincrby(trending_key(), weight, post_id)
+            if category is not None:
+                pipe.zincrby(trending_key(category.value), weight, post_id)
+                pipe.hset(TRENDING_CATEGORIES_KEY, post_id, category.value)
+            await pipe.execute()
+
+    async def move(
+        self,
+        *,
+        post_id: int,
+        category: PostCategory
+    ) -> None:
+        """
+        게시글 카테고리 변경 시 점수를 새 카테고리 랭킹으로 이동
+        """
+        old_category = await self._get_category(post_id=post_id)
+        if old_category is None or old_category == category:
+            return
+
+        score = await self.redis.zscore(trending_key(old_category.value), post_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(trending_key(old_category.value), post_id)
+            if score is not None:
+                pipe.zadd(trending_key(category.value), {post_id: score})
+            pipe.hset(TRENDING_CATEGORIES_KEY, post_id, category.value)
+            await pipe.execute()
+
+    async def remove(
+        self,
+        *,
+        post_ids: list[int]
+    ) -> None:
+        """
+        삭제된 게시글을 모든 랭킹에서 제거
+        """
+        if not post_ids:
+            return
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for category in PostCategory:
+                pipe.zrem(trending_key(category.value), *post_ids)
+            pipe.zrem(trending_key(), *post_ids)
+            pipe.hdel(TRENDING_CATEGORIES_KEY, *post_ids)
+            await pipe.execute()
+
+    async def top(
+        self,
+        *,
+        category: PostCategory | None,
+        limit: int
+    ) -> list[int]:
+        """
+        점수 상위 게시글 id 목록
+        """
+        post_ids = await self.redis.zrevrange(
+            trending_key(category.value if category else None), 0, limit - 1
+        )
+        return [int(post_id) for post_id in post_ids]
+
+    async def decay(
+        self,
+        *,
+        factor: float,
+        min_score: float,
+        max_size: int
+    ) -> int:
+        """
+        모든 랭킹 점수에 감쇠 계수를 곱하고, 점수가 min_score 미만이거나
+        max_size 순위 밖인 게시글 제거
+        제거된 게시글 수 반환
+        """
+        keys = [trending_key()] + [trending_key(category.value) for category in PostCategory]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for key in keys:
+                pipe.zunionstore(key, {key: factor})
+            await pipe.execute()
+
+        # 카테고리 랭킹은 전체 랭킹과 점수가 같으므로 전체 랭킹 기준으로 제거 대상 선정
+        all_key = trending_key()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zrangebyscore(all_key, "-inf", f"({min_score}")
+            pipe.zrange(all_key, 0, -(max_size + 1))
+            low_scores, overflow = await pipe.execute()
+
+        expired = [int(post_id) for post_id in {*low_scores, *overflow}]
+        await self.remove(post_ids=expired)
+        return len(expired)
+
+    async def _get_category(
+        self,
+        *,
+        post_id: int
+    ) -> PostCategory | None:
+        category = await self.redis.hget(TRENDING_CATEGORIES_KEY, post_id)
+        return PostCategory(category) if category else None
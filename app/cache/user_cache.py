@@ -0,0 +1,56 @@
+from redis.asyncio import Redis
+
+from app.cache.keys import user_key
+from app.cache.local_lru import TTLLRUCache
+from app.core.settings import settings
+from app.schemas.user import UserResponse
+
+
+# 프로세스 공유 1차 캐시: 다른 워커의 무효화는 보이지 않으므로 TTL을 짧게 유지
+local_user_cache: TTLLRUCache[UserResponse] = TTLLRUCache(
+    max_size=settings.USER_CACHE_LOCAL_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+)
+
+
+class UserCache:
+    """
+    인증 사용자(UserResponse) 2단 캐시: 프로세스 내 TTL LRU -> Redis
+
+    다른 워커의 프로세스 내 캐시는 로컬 TTL이 지나면 Redis에서 다시 읽는다.
+    """
+    def __init__(
+        self,
+        redis_client: Redis,
+        *,
+        ttl_seconds: int,
+        local: TTLLRUCache[UserResponse] = local_user_cache,
+    ):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.local = local
+
+    async def get(
+        self,
+        *,
+        user_id: int
+    ) -> UserResponse | None:
+        user = self.local.get(user_id)
+        if user is not None:
+            return user
+
+        raw = await self.redis.get(user_key(user_id))
+        if raw is None:
+            return None
+
+        user = UserResponse.model_validate_json(raw)
+        self.local.set(user_id, user)
+        return user
+
+    async def set(
+        self,
+        *,
+        user: UserResponse
+    ) -> None:
+        await self.redis.set(user_key(user.id), user.model_dump_json(), ex=self.ttl_seconds)
+        self.local.set(user.id, user)
@@ -0,0 +1,110 @@
+from redis.asyncio import Redis
+
+from app.cache.keys import (
+    POST_VIEWS_DELTA_PREFIX,
+    POST_VIEWS_DIRTY_KEY,
+    post_views_delta_key,
+    post_views_key,
+)
+
+
+# dirty 집합에서 게시글 id를 꺼내고, 각 게시글의 증가분을 읽으면서 삭제 (원자적 실행)
+_DRAIN_SCRIPT = """
+local ids = redis.call('SPOP', KEYS[1], ARGV[1])
+local result = {}
+for _, id in ipairs(ids) do
+    local delta = redis.call('GETDEL', ARGV[2] .. id)
+    if delta then
+        table.insert(result, id)
+        table.insert(result, delta)
+    end
+end
+return result
+"""
+
+
+class ViewCounter:
+    """
+    조회수 Write-Behind 카운터
+
+    - post:views:{id}: 화면에 보여줄 누적 조회수
+    - post:views:delta:{id}: 아직 DB에 반영되지 않은 증가분
+    - post:views:dirty: 증가분이 쌓인 게시글 id 집합
+
+    DB에는 절대값이 아닌 증가분만 더하므로, 여러 워커가 동시에 반영해도 조회수가 유실되지 않는다.
+    """
+    def __init__(self, redis_client: Redis):
+        self.redis = redis_client
+        self._drain = redis_client.register_script(_DRAIN_SCRIPT)
+
+    async def increment(
+        self,
+        *,
+        post_id: int
+    ) -> int:
+        """
+        조회수 1 증가 후 화면 표시용 조회수 반환
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.incr(post_views_key(post_id))
+            pipe.incr(post_views_delta_key(post_id))
+            pipe.sadd(POST_VIEWS_DIRTY_KEY, post_id)
+            new_views, _, _ = await pipe.execute()
+        return int(new_views)
+
+    async def drain(
+        self,
+        *,
+        batch_size: int
+    ) -> dict[int, int]:
+        """
+        최대 batch_size개 게시글의 증가분을 꺼내고 Redis에서 제거
+        """
+        flat = await self._drain(
+            keys=[POST_VIEWS_DIRTY_KEY],
+            args=[batch_size, POST_VIEWS_DELTA_PREFIX],
+        )
+        return {
+            int(post_id): int(delta)
+            for post_id, delta in zip(flat[::2], flat[1::2])
+        }
+
+    async def restore(
+        self,
+        *,
+        deltas: dict[int, int]
+    ) -> None:
+        """
+        DB 반영에 실패한 증가분을 다시 적재
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for post_id, delta in deltas.items():
+                pipe.incrby(post_views_delta_key(post_id), delta)
+                pipe.sadd(POST_VIEWS_DIRTY_KEY, post_id)
+            await pipe.execute()
+
+    async def requeue_orphans(
+        self,
+        *,
+        scan_count: int
+    ) -> int:
+        """
+        dirty 집합에서 빠진 증가분 키(eviction, 수동 삭제 등)를 SCAN으로 찾아 다시 등록
+        새로 등록된 게시글 수 반환
+        """
+        requeued = 0
+        post_ids: list[str] = []
+
+        async for key in self.redis.scan_iter(
+            match=f"{POST_VIEWS_DELTA_PREFIX}*",
+            count=scan_count,
+        ):
+            post_ids.append(key.removeprefix(POST_VIEWS_DELTA_PREFIX))
+            if len(post_ids) >= scan_count:
+                requeued += await self.redis.sadd(POST_VIEWS_DIRTY_KEY, *post_ids)
+                post_ids.clear()
+
+        if post_ids:
+            requeued += await self.redis.sadd(POST_VIEWS_DIRTY_KEY, *post_ids)
+
+        return requeued
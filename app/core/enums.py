@@ -13,4 +13,20 @@ class PostCategory(str, Enum):
     EVENT = "event"
 
     def __str__(self) -> str:        
-        return self.value
\ No newline at end of file
+        return self.value
+
+class PostSearchField(str, Enum):
+    TITLE = "title"
+    CONTENT = "content"
+
+    def __str__(self) -> str:        
+        return self.value
+
+class PostSort(str, Enum):
+    LATEST = "latest"
+    OLDEST = "oldest"
+    POPULAR = "popular"
+    MOST_LIKED = "most_liked"
+
+    def __str__(self) -> str:
+        return self.value
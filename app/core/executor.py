@@ -0,0 +1,65 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+from app.exceptions.types import ServiceBusyException
+
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    CPU 작업(argon2 등)을 이벤트 루프 밖의 전용 스레드 풀에서 실행
+
+    실행 중 + 대기 중인 작업 수가 max_pending에 도달하면 새 작업은 큐에 쌓지 않고 즉시 거절한다.
+    요청 폭주 시 대기열이 무한히 길어져 모든 요청이 타임아웃되는 대신 일부만 빠르게 503으로 실패한다.
+    """
+    def __init__(self, *, max_workers: int, max_pending: int, name: str):
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Raises:
+            ServiceBusyException: 대기 중인 작업이 max_pending에 도달한 경우
+        """
+        if self.pending >= self.max_pending:
+            raise ServiceBusyException()
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class InFlightLimiter:
+    """
+    동시에 처리 중인 요청 수 상한 (프로세스 단위)
+
+    상한에 도달하면 대기하지 않고 즉시 거절한다.
+    """
+    def __init__(self, *, max_in_flight: int):
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Raises:
+            ServiceBusyException: 처리 중인 요청 수가 max_in_flight에 도달한 경우
+        """
+        if self.in_flight >= self.max_in_flight:
+            raise ServiceBusyException()
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
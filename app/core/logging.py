@@ -105,9 +105,9 @@ def setup_logging():
     timing_logger.addHandler(timing_file)
 
 
-    # --- core.scheduler ---
-    # core/scheduler.py에서 logging.getLogger(__name__)을 쓰면 이름이 "core.scheduler"가 된다니에!
-    scheduler_logic_logger = logging.getLogger("core.scheduler")
+    # --- app.core.scheduler ---
+    # app/core/scheduler.py에서 logging.getLogger(__name__)을 쓰면 이름이 "app.core.scheduler"가 된다
+    scheduler_logic_logger = logging.getLogger("app.core.scheduler")
     scheduler_logic_logger.setLevel(logging.INFO)
     scheduler_logic_logger.handlers.clear()
     scheduler_logic_logger.propagate = False
@@ -0,0 +1,14 @@
+NGRAM_SIZE = 2
+
+def extract_ngrams(text: str) -> set[str]:
+    """
+    검색어를 소문자로 정규화한 뒤 공백 단위 토큰에서 2-gram 추출
+    post_ngrams 테이블을 채우는 SQL(repositories/post_ngram.py)과 같은 규칙을 따른다
+
+    ex) "파이썬 강의" -> {"파이", "이썬", "강의"}
+    """
+    grams: set[str] = set()
+    for token in text.lower().split():
+        for i in range(len(token) - NGRAM_SIZE + 1):
+            grams.add(token[i:i + NGRAM_SIZE])
+    return grams
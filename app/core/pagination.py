@@ -0,0 +1,64 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from app.exceptions.types import InvalidCursorException
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# ----- Keyset Cursor -----
+def encode_cursor(*values: Any) -> str:
+    """
+    마지막 행의 정렬 키 값들을 불투명한(opaque) 커서 문자열로 인코딩
+    """
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, *, size: int) -> list[Any]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 디코딩
+
+    Raises:
+        InvalidCursorException: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise InvalidCursorException(cursor=cursor)
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorException(cursor=cursor)
+    return values
+
+def decode_datetime_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    (created_at, id) 커서 디코딩
+
+    Raises:
+        InvalidCursorException: 커서 형식이 올바르지 않은 경우
+    """
+    created_at, row_id = decode_cursor(cursor, size=2)
+    try:
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError):
+        raise InvalidCursorException(cursor=cursor)
+
+def decode_sort_cursor(cursor: str, *, sort: str) -> tuple[Any, int]:
+    """
+    (정렬 이름, 정렬 키 값, id) 커서 디코딩
+    다른 정렬 옵션으로 발급된 커서면 거부
+
+    Raises:
+        InvalidCursorException: 커서 형식이 올바르지 않거나 정렬 옵션이 다른 경우
+    """
+    cursor_sort, value, row_id = decode_cursor(cursor, size=3)
+    if cursor_sort != sort or value is None or not isinstance(row_id, int):
+        raise InvalidCursorException(cursor=cursor)
+    return value, row_id
@@ -1,34 +1,213 @@
 import logging
+import time
+from datetime import datetime
+from typing import Awaitable, Callable
 
-from app.api.dependency import get_uow
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.cache.keys import scheduler_lock_key
+from app.cache.lease_lock import LeaseLock
+from app.cache.like_store import LikeStore
+from app.cache.trending import TrendingBoard
+from app.cache.view_counter import ViewCounter
 from app.core.redis import get_redis
+from app.core.settings import settings
 from app.core.uow import UnitOfWork
 from app.db.session import async_session_factory
 
 logger = logging.getLogger(__name__)
 
-async def sync_post_views_to_db():
-    redis_client = get_redis()
 
-    async with redis_client:
-        updates = {}
+# ----------------------------------------------------------------
+# Jobs
+# ----------------------------------------------------------------
+async def sync_post_views_to_db(
+    *,
+    batch_size: int = settings.VIEW_SYNC_BATCH_SIZE,
+    max_batches: int = settings.VIEW_SYNC_MAX_BATCHES,
+) -> int:
+    """
+    Redis에 쌓인 조회수 증가분을 배치 단위로 꺼내 DB에 반영
+    반영된 게시글 수 반환
+    """
+    counter = ViewCounter(get_redis())
+    flushed = 0
+
+    for _ in range(max_batches):
+        deltas = await counter.drain(batch_size=batch_size)
+        if not deltas:
+            break
 
-    async for key in redis_client.scan_iter("post:views:*"):
         try:
-            post_id = int(key.split(":")[-1])
-            views = await redis_client.get(key)
-            if views:
-                updates[post_id] = int(views)
+            async with UnitOfWork(async_session_factory) as uow:
+                flushed += await uow.posts.apply_view_deltas(deltas=deltas)
         except Exception as e:
-            logger.error(f"Error parsing redis key {key}: {e}")
+            # 꺼낸 증가분을 되돌려 다음 주기에 다시 반영
+            await counter.restore(deltas=deltas)
+            logger.error(f"Failed to sync views to DB: {e}")
+            break
+
+    return flushed
+
+
+async def flush_like_ops_to_db(
+    *,
+    batch_size: int = settings.LIKE_FLUSH_BATCH_SIZE,
+    max_batches: int = settings.LIKE_FLUSH_MAX_BATCHES,
+) -> int:
+    """
+    Redis에 쌓인 좋아요 작업을 배치 단위로 꺼내 likes / posts.likes_count에 반영
+    반영된 게시글 수 반환
+    """
+    store = LikeStore(get_redis())
+    flushed = 0
 
-        if not updates:
-            return
+    for _ in range(max_batches):
+        ops = await store.drain(batch_size=batch_size)
+        if not ops:
+            break
 
         try:
             async with UnitOfWork(async_session_factory) as uow:
-                for post_id, views in updates.items():
-                    await uow.posts.sync_views(post_id=post_id, views=views)
-
+                flushed += await uow.likes.apply_like_ops(ops=ops)
         except Exception as e:
-            logger.error(f"Failed to sync views to DB: {e}")
\ No newline at end of file
+            # 꺼낸 작업을 되돌려 다음 주기에 다시 반영
+            await store.restore(ops=ops)
+            logger.error(f"Failed to flush likes to DB: {e}")
+            break
+
+    return flushed
+
+
+async def decay_trending_scores(
+    *,
+    factor: float = settings.TRENDING_DECAY_FACTOR,
+    min_score: float = settings.TRENDING_MIN_SCORE,
+    max_size: int = settings.TRENDING_MAX_SIZE,
+) -> int:
+    """
+    인기 게시글 점수 감쇠 + 하위 게시글 정리
+    정리된 게시글 수 반환
+    """
+    board = TrendingBoard(get_redis())
+    return await board.decay(factor=factor, min_score=min_score, max_size=max_size)
+
+
+async def requeue_orphan_view_deltas(
+    *,
+    scan_count: int = settings.VIEW_ORPHAN_SCAN_COUNT,
+) -> int:
+    """
+    dirty 집합에 등록되지 않은 조회수 증가분을 다시 등록
+    """
+    counter = ViewCounter(get_redis())
+    return await counter.requeue_orphans(scan_count=scan_count)
+
+
+async def reconcile_comment_counts(
+    *,
+    batch_size: int = settings.COMMENT_COUNT_RECONCILE_BATCH_SIZE,
+) -> int:
+    """
+    posts.comments_count 카운터 캐시를 실제 댓글 수와 대조해 어긋난 값을 보정
+    배치마다 별도 트랜잭션으로 처리하며, 보정된 게시글 수 반환 (정상이면 0)
+    """
+    fixed = 0
+    after_id = 0
+
+    while True:
+        async with UnitOfWork(async_session_factory) as uow:
+            batch_fixed, after_id = await uow.posts.reconcile_comments_count(
+                after_id=after_id,
+                limit=batch_size,
+            )
+        fixed += batch_fixed
+        if after_id is None:
+            break
+
+    if fixed:
+        logger.warning(f"Reconciled comments_count drift on {fixed} posts")
+    return fixed
+
+
+# ----------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------
+async def run_with_lease(
+    job_id: str,
+    job: Callable[[], Awaitable[int]],
+) -> None:
+    """
+    Redis 임대 락을 잡은 워커 하나만 작업 실행
+    소요 시간과 처리 건수를 로그로 기록
+    """
+    lock = LeaseLock(
+        get_redis(),
+        key=scheduler_lock_key(job_id),
+        ttl_ms=settings.SCHEDULER_LOCK_TTL_SECONDS * 1000,
+    )
+    if not await lock.acquire():
+        return
+
+    start_time = time.perf_counter()
+    try:
+        rows = await job()
+        process_time = time.perf_counter() - start_time
+        logger.info(f"[{job_id}] rows={rows} in {process_time:.4f}s")
+    except Exception as e:
+        logger.exception(f"[{job_id}] failed: {e}")
+    finally:
+        await lock.release()
+
+
+def create_scheduler() -> AsyncIOScheduler:
+    scheduler = AsyncIOScheduler()
+
+    scheduler.add_job(
+        run_with_lease,
+        "interval",
+        seconds=settings.VIEW_SYNC_INTERVAL_SECONDS,
+        args=["sync_post_views", sync_post_views_to_db],
+        id="sync_post_views",
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        run_with_lease,
+        "interval",
+        seconds=settings.TRENDING_DECAY_INTERVAL_SECONDS,
+        args=["decay_trending_scores", decay_trending_scores],
+        id="decay_trending_scores",
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        run_with_lease,
+        "interval",
+        seconds=settings.COMMENT_COUNT_RECONCILE_INTERVAL_SECONDS,
+        args=["reconcile_comment_counts", reconcile_comment_counts],
+        id="reconcile_comment_counts",
+        max_instances=1,
+        coalesce=True,
+    )
+    # 기동 시 1회: 유실된 dirty 등록 복구
+    scheduler.add_job(
+        run_with_lease,
+        "date",
+        run_date=datetime.now(),
+        args=["requeue_orphan_view_deltas", requeue_orphan_view_deltas],
+        id="requeue_orphan_view_deltas",
+    )
+
+    if settings.USE_LIKE_WRITE_BEHIND:
+        scheduler.add_job(
+            run_with_lease,
+            "interval",
+            seconds=settings.LIKE_FLUSH_INTERVAL_SECONDS,
+            args=["flush_like_ops", flush_like_ops_to_db],
+            id="flush_like_ops",
+            max_instances=1,
+            coalesce=True,
+        )
+
+    return scheduler
@@ -1,8 +1,13 @@
+import hashlib
+import hmac
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import ExpiredSignatureError, JWTError, jwt
 from passlib.context import CryptContext
 
+from app.cache.local_lru import TTLLRUCache
+from app.core.executor import BoundedExecutor
 from app.core.settings import settings
 from app.exceptions.types import InvalidTokenException
 from app.schemas.auth_token import TokenPayload
@@ -20,12 +25,40 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
-# ----- Refresh Token Hashing -----
-def hash_refresh_token(token: str) -> str:
-    return pwd_context.hash(token)
+# argon2는 호출당 수십 ms CPU를 쓰므로 요청 처리 경로에서는 전용 풀에서 실행
+password_hasher = BoundedExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    name="argon2",
+)
 
-def verify_refresh_token(token: str, hashed_token: str) -> bool:
-    return pwd_context.verify(token, hashed_token)
+async def hash_password_async(password: str) -> str:
+    """
+    Raises:
+        ServiceBusyException: 해시 작업 대기열이 가득 찬 경우
+    """
+    return await password_hasher.run(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Raises:
+        ServiceBusyException: 해시 작업 대기열이 가득 찬 경우
+    """
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+# ----- Refresh Token Digest -----
+def hash_refresh_token(token: str) -> str:
+    """
+    리프레시 토큰의 HMAC-SHA256 다이제스트 (고유 인덱스 동등 조회용)
+    토큰 자체가 충분한 엔트로피(서명 + jti)를 가지므로 느린 해시(argon2)가 필요 없음
+    """
+    return hmac.new(settings.SECRET_KEY.encode(), token.encode(), hashlib.sha256).hexdigest()
+
+def new_token_family() -> str:
+    """
+    기기(로그인 세션)별 리프레시 토큰 family id 생성
+    """
+    return uuid.uuid4().hex
 
 # ----- JWT 발급 / 파싱 -----
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -42,6 +75,8 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     to_encode = data.copy()
 
     to_encode["type"] = "refresh"
+    # 같은 초에 발급되어도 토큰(다이제스트)이 겹치지 않도록 고유 id 부여
+    to_encode["jti"] = uuid.uuid4().hex
 
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS))
     to_encode.update({"exp": expire})
@@ -60,14 +95,42 @@ def decode_token(token: str) -> TokenPayload:
         raise TokenDecodeException()
 
 # ----- 인증 -----
+
+# 액세스 토큰 디코딩 결과 메모 (키: 토큰 다이제스트, 항목 TTL은 exp까지)
+token_claims_cache: TTLLRUCache[dict] = TTLLRUCache(
+    max_size=settings.TOKEN_CLAIMS_CACHE_MAX_SIZE,
+    ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+def _decode_access_claims(token: str) -> dict:
+    """
+    jwt.decode(서명 검증 + JSON 파싱) 결과를 exp까지 메모
+    검증 실패한 토큰은 캐시하지 않는다.
+
+    Raises:
+        JWTError: 서명이 유효하지 않거나 만료된 경우
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+    claims = token_claims_cache.get(digest)
+    if claims is not None:
+        return claims
+
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    exp = claims.get("exp")
+    if exp is not None:
+        ttl = exp - datetime.now(timezone.utc).timestamp()
+        if ttl > 0:
+            token_claims_cache.set(digest, claims, ttl_seconds=ttl)
+    return claims
+
 def extract_user_id_from_token(token: str) -> int:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_access_claims(token)
         user_id = payload.get("sub")
         if user_id is None:
             raise InvalidTokenException()
         return int(user_id)
-    except JWTError:
+    except (JWTError, ValueError):
         raise InvalidTokenException()
 
 
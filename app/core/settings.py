@@ -19,10 +19,59 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # argon2 해시/검증 전용 스레드 풀 크기와 대기 작업 상한 (초과 시 503)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    TOKEN_CLAIMS_CACHE_MAX_SIZE: int = 10000
+    # 인증 엔드포인트(로그인/회원가입/갱신) 입장 제어: IP/이메일별 슬라이딩 윈도 + 프로세스 동시 처리 상한
+    USE_AUTH_RATE_LIMIT: bool = True
+    AUTH_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    AUTH_RATE_LIMIT_PER_IP: int = 30
+    AUTH_RATE_LIMIT_PER_EMAIL: int = 10
+    AUTH_MAX_IN_FLIGHT: int = 32
 
     # Other
     USE_VIEWS_COUNTER_CACHE: bool = True
 
+    # Cache
+    USE_POST_DETAIL_CACHE: bool = True
+    POST_DETAIL_CACHE_TTL_SECONDS: int = 600
+    USE_COMMENT_PAGE_CACHE: bool = True
+    COMMENT_PAGE_CACHE_TTL_SECONDS: int = 600
+    COMMENT_PAGE_CACHE_SIZE: int = 100
+    USE_USER_CACHE: bool = True
+    USER_CACHE_TTL_SECONDS: int = 300
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 5
+    USER_CACHE_LOCAL_MAX_SIZE: int = 10000
+
+    # Likes
+    # Redis 좋아요 저장소 + DB 일괄 반영 (Redis Lua 스크립트 필요)
+    USE_LIKE_WRITE_BEHIND: bool = False
+
+    # Trending
+    TRENDING_VIEW_WEIGHT: float = 1.0
+    TRENDING_LIKE_WEIGHT: float = 5.0
+    TRENDING_DECAY_FACTOR: float = 0.9
+    TRENDING_MIN_SCORE: float = 0.5
+    TRENDING_MAX_SIZE: int = 1000
+
+    # Scheduler
+    USE_SCHEDULER: bool = True
+    SCHEDULER_LOCK_TTL_SECONDS: int = 30
+    VIEW_SYNC_INTERVAL_SECONDS: int = 10
+    VIEW_ORPHAN_SCAN_COUNT: int = 1000
+    LIKE_FLUSH_INTERVAL_SECONDS: int = 5
+    LIKE_FLUSH_BATCH_SIZE: int = 500
+    LIKE_FLUSH_MAX_BATCHES: int = 100
+    TRENDING_DECAY_INTERVAL_SECONDS: int = 600
+    VIEW_SYNC_BATCH_SIZE: int = 500
+    VIEW_SYNC_MAX_BATCHES: int = 100
+    COMMENT_COUNT_RECONCILE_INTERVAL_SECONDS: int = 3600
+    COMMENT_COUNT_RECONCILE_BATCH_SIZE: int = 500
+
+    # Pagination
+    POST_LIST_MAX_OFFSET: int = 1000
+
 
     model_config = SettingsConfigDict(
         env_file=".env",
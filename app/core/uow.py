@@ -2,6 +2,7 @@ from app.repositories.bookmark import BookmarkRepository
 from app.repositories.comment import CommentRepository
 from app.repositories.like import LikeRepository
 from app.repositories.post import PostRepository
+from app.repositories.post_ngram import PostNgramRepository
 from app.repositories.refresh_token import RefreshTokenRepository
 from app.repositories.user import UserRepository
 
@@ -14,6 +15,7 @@ class UnitOfWork:
     async def __aenter__(self):
         self.session = self.session_factory()
         self.posts = PostRepository(self.session)
+        self.post_ngrams = PostNgramRepository(self.session)
         self.comments = CommentRepository(self.session)
         self.likes = LikeRepository(self.session)
         self.users = UserRepository(self.session)
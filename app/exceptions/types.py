@@ -241,6 +241,45 @@ class RuleViolationException(BaseAppException):
         )
         
 # ---------------------- Common ----------------------
+class InvalidCursorException(BaseAppException):
+    def __init__(
+        self,
+        cursor: str,
+        message: str = "Invalid pagination cursor."
+    ):
+        super().__init__(
+            message=message,
+            code="INVALID_CURSOR",
+            details={"cursor": cursor},
+            status_code=400
+        )
+
+class TooManyRequestsException(BaseAppException):
+    def __init__(
+        self,
+        message: str = "Too many requests. Please try again later.",
+        retry_after_seconds: int = 1,
+    ):
+        super().__init__(
+            message=message,
+            code="TOO_MANY_REQUESTS",
+            status_code=429,
+            headers={"Retry-After": str(retry_after_seconds)}
+        )
+
+class ServiceBusyException(BaseAppException):
+    def __init__(
+        self,
+        message: str = "The server is busy. Please try again shortly.",
+        retry_after_seconds: int = 1,
+    ):
+        super().__init__(
+            message=message,
+            code="SERVICE_BUSY",
+            status_code=503,
+            headers={"Retry-After": str(retry_after_seconds)}
+        )
+
 class InternalServerException(BaseAppException):
     def __init__(
         self,        
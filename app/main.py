@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
@@ -5,6 +7,9 @@ import uvicorn
 from app.core.settings import settings
 from app.api.v1 import auth, comment, post, user
 from app.core.logging import setup_logging
+from app.core.security import password_hasher
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.scheduler import create_scheduler
 from app.exceptions.handlers import register_exception_handlers
 from app.middlewares.access_log import AccessLogMiddleware
 from app.middlewares.timing_log import TimingLogMiddleware
@@ -44,11 +49,25 @@ tags_metadata = [
     },
 ]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    scheduler = None
+    if settings.USE_SCHEDULER and not settings.TESTING:
+        scheduler = create_scheduler()
+        scheduler.start()
+
+    yield
+
+    if scheduler is not None:
+        scheduler.shutdown(wait=False)
+    password_hasher.shutdown()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=description,
     version=settings.VERSION,
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
 )
 
 origins = [
@@ -69,6 +88,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
 )
 # Trace id
 app.add_middleware(TraceIdASGIMiddleware)
@@ -1,6 +1,7 @@
 from app.models.user import User
 from app.models.post import Post
 from app.models.post_history import PostHistory
+from app.models.post_ngram import PostNgram
 from app.models.comment import Comment
 from app.models.like import Like
 from app.models.bookmark import Bookmark
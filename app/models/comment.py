@@ -63,4 +63,28 @@ class Comment(Base):
         Index("ix_comments_user_id", "user_id"),
         Index("ix_comments_parent_id", "parent_id"),
         Index("ix_comments_is_deleted", "is_deleted"),
+        # 댓글 목록: 게시글별 (created_at, id) Keyset 페이징
+        Index(
+            "ix_comments_active_post_created_at_id",
+            post_id,
+            created_at,
+            id,
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # 댓글 트리: 루트 댓글 Keyset 페이징
+        Index(
+            "ix_comments_active_roots",
+            post_id,
+            created_at,
+            id,
+            postgresql_where=text("parent_id IS NULL AND is_deleted = false"),
+        ),
+        # 댓글 트리: 루트별 대댓글 순번/개수 + 대댓글 Keyset 페이징
+        Index(
+            "ix_comments_active_parent_created_at_id",
+            parent_id,
+            created_at,
+            id,
+            postgresql_where=text("is_deleted = false"),
+        ),
     )
\ No newline at end of file
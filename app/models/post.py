@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Index, Integer, String, Text, DateTime, Boolean, ForeignKey, func, text, Enum
+from sqlalchemy import DDL, Column, Index, Integer, String, Text, DateTime, Boolean, ForeignKey, event, func, text, Enum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import relationship
 
 from app.core.enums import PostCategory
 from app.db.base import Base
 
 
+# 한국어는 형태소 분석 사전이 없으므로 공백 단위 토큰화(simple) 사용
+SEARCH_CONFIG = "simple"
+
 class Post(Base):
     __tablename__ = "posts"
 
@@ -42,6 +46,11 @@ class Post(Base):
         server_default=text("0"),
         nullable=False,
     )
+    comments_count = Column(
+        Integer,
+        server_default=text("0"),
+        nullable=False,
+    )
     is_deleted = Column(
         Boolean,
         server_default=text("false"),
@@ -59,6 +68,11 @@ class Post(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # 제목(A) + 내용(B) 가중치 tsvector, trg_posts_search_vector 트리거가 관리
+    search_vector = Column(
+        TSVECTOR,
+        nullable=True,
+    )
 
     # ------------------------
     # Relationships
@@ -75,8 +89,77 @@ class Post(Base):
     __table_args__ = (
         Index("ix_posts_user_id", "user_id"),
         Index("ix_posts_title", "title"),
-        Index("ix_posts_views", "views"),
-        Index("ix_posts_likes_count", "likes_count"),
         Index("ix_posts_is_deleted", "is_deleted"),
         Index("ix_posts_created_at", "created_at"),
+        # Keyset 페이징: (created_at, id) 행 비교 + 정렬을 인덱스 스캔으로 처리
+        Index(
+            "ix_posts_active_created_at_id",
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # 정렬 옵션(sort)별 Keyset 페이징: 카테고리 필터 유무 모두 인덱스 스캔 + 조기 종료
+        # (오래된순은 최신순 인덱스를 역방향으로 스캔)
+        Index(
+            "ix_posts_active_views_id",
+            views.desc(),
+            id.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_posts_active_likes_count_id",
+            likes_count.desc(),
+            id.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_posts_active_category_created_at_id",
+            category,
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_posts_active_category_views_id",
+            category,
+            views.desc(),
+            id.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_posts_active_category_likes_count_id",
+            category,
+            likes_count.desc(),
+            id.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
     )
+
+
+# ------------------------
+# Full Text Search Trigger
+# ------------------------
+event.listen(
+    Post.__table__,
+    "after_create",
+    DDL(f"""
+        CREATE OR REPLACE FUNCTION posts_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.content, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Post.__table__,
+    "after_create",
+    DDL("""
+        CREATE TRIGGER trg_posts_search_vector
+        BEFORE INSERT OR UPDATE OF title, content ON posts
+        FOR EACH ROW EXECUTE FUNCTION posts_search_vector_update()
+    """).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+
+from app.db.base import Base
+
+
+class PostNgram(Base):
+    """
+    한국어 부분 문자열 검색을 위한 게시글 2-gram 색인 테이블
+    (field, gram)으로 후보 게시글을 찾은 뒤 ILIKE로 최종 확인
+    """
+    __tablename__ = "post_ngrams"
+
+    # ------------------------
+    # Columns
+    # ------------------------
+    # 행 수가 많은 색인 테이블이므로 별도 id 없이 (field, gram, post_id)를 PK로 사용
+    field = Column(
+        String(10),
+        primary_key=True,
+    )
+    gram = Column(
+        String(2),
+        primary_key=True,
+    )
+    post_id = Column(
+        Integer,
+        ForeignKey("posts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # ------------------------
+    # Constraints & Indexes
+    # ------------------------
+    __table_args__ = (
+        Index("ix_post_ngrams_post_id", "post_id"),
+    )
@@ -19,10 +19,16 @@ class RefreshToken(Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
+    # 토큰 원문이 아닌 HMAC-SHA256 다이제스트
     token = Column(
         String(512),
         nullable=False,
     )
+    # 기기(로그인 세션)별 토큰 family: 갱신 시 같은 family 안에서만 교체
+    family_id = Column(
+        String(32),
+        nullable=False,
+    )
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -47,5 +53,6 @@ class RefreshToken(Base):
             name="uq_refresh_tokens_token",
         ),        
         Index("ix_refresh_tokens_user_id", "user_id"),
+        Index("ix_refresh_tokens_family_id", "family_id"),
         Index("ix_refresh_tokens_expires_at", "expires_at"),
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Index, Integer, String, Enum as SqlEnum, text
+from sqlalchemy import DDL, Boolean, Column, Index, Integer, String, Enum as SqlEnum, event, text
 from sqlalchemy.orm import relationship
 
 from app.core.enums import UserRole
@@ -83,4 +83,18 @@ class User(Base):
         Index("ix_users_email", "email", unique=True),
         Index("ix_users_nickname", "nickname", unique=True),
         Index("ix_users_is_deleted", "is_deleted"),
-    )
\ No newline at end of file
+        # 작성자 부분 일치 검색(ILIKE '%x%')용 trigram 인덱스
+        Index(
+            "ix_users_nickname_trgm",
+            "nickname",
+            postgresql_using="gin",
+            postgresql_ops={"nickname": "gin_trgm_ops"},
+        ),
+    )
+
+
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
\ No newline at end of file
@@ -1,10 +1,35 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Integer, any_, bindparam, select, delete, text
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.orm import joinedload
 
 from app.models.bookmark import Bookmark
 from app.models.post import Post
+from app.repositories.result_types import RepoResult, RepoStatus
+
+
+# 북마크가 있으면 삭제, 없으면 삽입 (단일 구문)
+# 삭제된 행이 없으면 최종 상태는 '북마크됨' (삽입했거나, 동시 요청이 먼저 삽입해 충돌한 경우)
+TOGGLE_BOOKMARK_SQL = text("""
+    WITH target AS (
+        SELECT id FROM posts WHERE id = :post_id
+    ),
+    removed AS (
+        DELETE FROM bookmarks
+        WHERE post_id = (SELECT id FROM target) AND user_id = :user_id
+        RETURNING id
+    ),
+    added AS (
+        INSERT INTO bookmarks (post_id, user_id)
+        SELECT id, :user_id FROM target
+        WHERE NOT EXISTS (SELECT 1 FROM removed)
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING id
+    )
+    SELECT
+        EXISTS (SELECT 1 FROM target) AS found,
+        NOT EXISTS (SELECT 1 FROM removed) AS bookmarked
+""")
 
 
 class BookmarkRepository:
@@ -31,6 +56,27 @@ class BookmarkRepository:
             )
         ) is not None
 
+    async def get_bookmarked_post_ids(
+        self,
+        *,
+        user_id: int,
+        post_ids: list[int]
+    ) -> set[int]:
+        """
+        post_ids 중 사용자가 북마크한 게시글 id (uq_bookmarks_user_post 인덱스 사용)
+        """
+        if not post_ids:
+            return set()
+
+        result = await self.db.scalars(
+            select(Bookmark.post_id)
+            .where(
+                Bookmark.user_id == user_id,
+                Bookmark.post_id == any_(bindparam("post_ids", post_ids, type_=ARRAY(Integer))),
+            )
+        )
+        return set(result)
+
     async def list_by_user(
             self,
             *,
@@ -60,6 +106,27 @@ class BookmarkRepository:
     # ----------------------------------------------------------------
     # Create / Update Operations
     # ----------------------------------------------------------------
+    async def toggle(
+        self,
+        *,
+        post_id: int,
+        user_id: int
+    ) -> RepoResult:
+        """
+        북마크 토글을 단일 구문으로 실행
+        성공 시 data = 북마크 여부
+        """
+        found, bookmarked = (
+            await self.db.execute(
+                TOGGLE_BOOKMARK_SQL,
+                {"post_id": post_id, "user_id": user_id},
+            )
+        ).one()
+
+        if not found:
+            return RepoResult(RepoStatus.NOT_FOUND)
+        return RepoResult(RepoStatus.SUCCESS, bookmarked)
+
     async def regist(
         self,
         *,
@@ -1,9 +1,10 @@
 from datetime import datetime, timezone
-from sqlalchemy import select, update
+from sqlalchemy import false, func, select, tuple_, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.models.comment import Comment
+from app.models.post import Post
 from app.repositories.result_types import RepoResult, RepoStatus
 
     
@@ -19,19 +20,120 @@ class CommentRepository:
         *, 
         post_id: int,
         limit: int,
-        offset: int
+        offset: int = 0,
+        cursor: tuple[datetime, int] | None = None,
     ) -> list[Comment]:
-        result = await self.db.execute(
+        """
+        게시글 댓글을 (created_at, id) 오름차순으로 조회 (삭제된 댓글 제외)
+        cursor가 주어지면 offset 대신 Keyset 페이징
+        삭제 여부는 부분 인덱스(ix_comments_active_post_created_at_id) 조건에 포함되어 별도 필터 단계 없음
+        """
+        query = (
             select(Comment)
-            .where(Comment.post_id == post_id)
+            .where(Comment.post_id == post_id, Comment.is_deleted == false())
             .options(selectinload(Comment.user))
-            .order_by(Comment.created_at.asc())
+            .order_by(Comment.created_at.asc(), Comment.id.asc())
             .limit(limit)
-            .offset(offset)
         )
-        
+        if cursor:
+            query = query.where(tuple_(Comment.created_at, Comment.id) > tuple_(*cursor))
+        else:
+            query = query.offset(offset)
+
+        result = await self.db.execute(query)
         return result.scalars().all()
         
+    async def get_comment_tree(
+        self,
+        *,
+        post_id: int,
+        roots_limit: int,
+        replies_limit: int,
+        cursor: tuple[datetime, int] | None = None,
+    ) -> list[tuple[Comment, int]]:
+        """
+        루트 댓글 한 페이지와 루트별 앞쪽 replies_limit개의 대댓글을 단일 쿼리로 조회
+        (created_at, id) 오름차순 Keyset 페이징, 삭제된 댓글 제외
+        스레드(루트 + 대댓글) 단위 윈도우 함수로 순번과 대댓글 수를 함께 계산
+
+        Returns:
+            (댓글, 대댓글 수) 목록 - 대댓글 수는 루트 행에서만 의미 있음
+        """
+        root_ids = (
+            select(Comment.id)
+            .where(
+                Comment.post_id == post_id,
+                Comment.parent_id.is_(None),
+                Comment.is_deleted == false(),
+            )
+            .order_by(Comment.created_at.asc(), Comment.id.asc())
+            .limit(roots_limit)
+        )
+        if cursor:
+            root_ids = root_ids.where(tuple_(Comment.created_at, Comment.id) > tuple_(*cursor))
+        root_ids = root_ids.cte("root_ids")
+
+        # 스레드 행: 루트(PK 조인) + 루트별 대댓글(부모 부분 인덱스 조인)
+        # OR 조건 하나로 묶으면 두 인덱스를 쓰지 못하고 활성 댓글 전체를 훑음
+        thread_columns = (Comment.id, Comment.parent_id, Comment.created_at)
+        thread_rows = union_all(
+            select(*thread_columns)
+            .join(root_ids, root_ids.c.id == Comment.id),
+            select(*thread_columns)
+            .join(root_ids, root_ids.c.id == Comment.parent_id)
+            .where(Comment.is_deleted == false()),
+        ).subquery("thread_rows")
+
+        # 스레드 내 순번: 루트가 1번, 이후 대댓글이 작성순
+        thread_id = func.coalesce(thread_rows.c.parent_id, thread_rows.c.id)
+        ranked = (
+            select(
+                thread_rows.c.id,
+                func.row_number().over(
+                    partition_by=thread_id,
+                    order_by=(
+                        thread_rows.c.parent_id.is_not(None),
+                        thread_rows.c.created_at,
+                        thread_rows.c.id,
+                    ),
+                ).label("rn"),
+                (func.count().over(partition_by=thread_id) - 1).label("reply_count"),
+            )
+            .subquery()
+        )
+
+        result = await self.db.execute(
+            select(Comment, ranked.c.reply_count)
+            .join(ranked, ranked.c.id == Comment.id)
+            .where(ranked.c.rn <= replies_limit + 1)
+            .options(joinedload(Comment.user))
+            .order_by(Comment.created_at.asc(), Comment.id.asc())
+        )
+        return [(comment, reply_count) for comment, reply_count in result.all()]
+
+    async def get_replies(
+        self,
+        *,
+        parent_id: int,
+        limit: int,
+        cursor: tuple[datetime, int] | None = None,
+    ) -> list[Comment]:
+        """
+        부모 댓글의 대댓글을 (created_at, id) 오름차순 Keyset 페이징으로 조회 (삭제된 댓글 제외)
+        """
+        query = (
+            select(Comment)
+            .where(Comment.parent_id == parent_id, Comment.is_deleted == false())
+            .options(joinedload(Comment.user))
+            .order_by(Comment.created_at.asc(), Comment.id.asc())
+            .limit(limit)
+        )
+        if cursor:
+            query = query.where(tuple_(Comment.created_at, Comment.id) > tuple_(*cursor))
+
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
     async def get_comment_by_parent_id(
         self,        
         *,
@@ -66,6 +168,13 @@ class CommentRepository:
         self.db.add(comment)
         await self.db.flush()
 
+        # 같은 트랜잭션에서 카운터 캐시 증가 (게시글 수정이 아니므로 updated_at 유지)
+        await self.db.execute(
+            update(Post)
+            .where(Post.id == post_id)
+            .values(comments_count=Post.comments_count + 1, updated_at=Post.updated_at)
+        )
+
         await self.db.refresh(comment, attribute_names=["user"])
 
         return comment
@@ -122,8 +231,11 @@ class CommentRepository:
         comment_id: int,
         user_id: int, 
     ) -> RepoResult:
+        """
+        댓글 삭제 + 게시글 comments_count 감소를 단일 구문으로 처리
+        """
         now = datetime.now(timezone.utc)
-        stmt = (
+        deleted = (
             update(Comment)
             .where(
                 Comment.id == comment_id, 
@@ -134,12 +246,21 @@ class CommentRepository:
                 is_deleted = True,
                 updated_at = now
             )
-            .returning(Comment.id)
+            .returning(Comment.post_id)
+            .cte("deleted")
+        )
+        stmt = (
+            update(Post)
+            .where(Post.id == deleted.c.post_id)
+            .values(comments_count=Post.comments_count - 1, updated_at=Post.updated_at)
+            .returning(Post.id)
+            .execution_options(synchronize_session=False)
         )
         result = await self.db.execute(stmt)
 
-        if result.one_or_none() is not None:
-            return RepoResult(RepoStatus.SUCCESS)
+        post_id = result.scalar_one_or_none()
+        if post_id is not None:
+            return RepoResult(RepoStatus.SUCCESS, post_id)
 
         return await self._analyze_failure(comment_id, user_id)
 
@@ -1,9 +1,52 @@
-from sqlalchemy import select, func, delete, update
-from sqlalchemy.dialects.postgresql import insert
+from collections import Counter
+from sqlalchemy import Integer, any_, bindparam, column, select, func, delete, text, tuple_, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.like import Like
 from app.models.post import Post
+from app.repositories.result_types import RepoResult, RepoStatus
+
+
+# 좋아요가 있으면 삭제, 없으면 삽입한 뒤 likes_count를 ±1 (단일 구문)
+# - 삭제된 행이 없으면 최종 상태는 '좋아요' (삽입했거나, 동시 요청이 먼저 삽입해 충돌한 경우)
+# - 실제로 바뀐 행이 있을 때만 posts 행을 갱신 (카운터 변경이므로 updated_at은 유지)
+TOGGLE_LIKE_SQL = text("""
+    WITH target AS (
+        SELECT id, likes_count, category
+        FROM posts
+        WHERE id = :post_id AND is_deleted = false
+    ),
+    removed AS (
+        DELETE FROM likes
+        WHERE post_id = (SELECT id FROM target) AND user_id = :user_id
+        RETURNING id
+    ),
+    added AS (
+        INSERT INTO likes (post_id, user_id)
+        SELECT id, :user_id FROM target
+        WHERE NOT EXISTS (SELECT 1 FROM removed)
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING id
+    ),
+    counter AS (
+        UPDATE posts
+        SET likes_count = likes_count
+                + (SELECT count(*) FROM added)
+                - (SELECT count(*) FROM removed)
+        WHERE id = (SELECT id FROM target)
+          AND EXISTS (SELECT 1 FROM added UNION ALL SELECT 1 FROM removed)
+        RETURNING likes_count
+    )
+    SELECT
+        EXISTS (SELECT 1 FROM target) AS found,
+        NOT EXISTS (SELECT 1 FROM removed) AS liked,
+        COALESCE(
+            (SELECT likes_count FROM counter),
+            (SELECT likes_count FROM target)
+        ) AS likes_count,
+        (SELECT category FROM target) AS category
+""").columns(category=Post.__table__.c.category.type)
 
 class LikeRepository:
     def __init__(self, db: AsyncSession):
@@ -22,6 +65,40 @@ class LikeRepository:
             select(Like.id).where(Like.post_id == post_id, Like.user_id == user_id)
         ) is not None
     
+    async def get_liker_ids(
+        self,
+        *,
+        post_id: int
+    ) -> list[int]:
+        """
+        게시글에 좋아요한 사용자 id 목록 (Redis 좋아요 집합 적재용)
+        """
+        result = await self.db.scalars(
+            select(Like.user_id).where(Like.post_id == post_id)
+        )
+        return list(result)
+
+    async def get_liked_post_ids(
+        self,
+        *,
+        user_id: int,
+        post_ids: list[int]
+    ) -> set[int]:
+        """
+        post_ids 중 사용자가 좋아요한 게시글 id (uq_likes_user_post 인덱스 사용)
+        """
+        if not post_ids:
+            return set()
+
+        result = await self.db.scalars(
+            select(Like.post_id)
+            .where(
+                Like.user_id == user_id,
+                Like.post_id == any_(bindparam("post_ids", post_ids, type_=ARRAY(Integer))),
+            )
+        )
+        return set(result)
+
     async def get_count_likes(
         self,
         *, 
@@ -43,31 +120,26 @@ class LikeRepository:
     # ----------------------------------------------------------------
     # Create / Update Operations
     # ----------------------------------------------------------------
-    async def like_with_counter_cache(
-        self, 
-        *, 
-        post_id: int, 
+    async def toggle_like(
+        self,
+        *,
+        post_id: int,
         user_id: int
-    ) -> tuple[bool, int]:        
-        ins = (
-            insert(Like)
-            .values(post_id=post_id, user_id=user_id)
-            .on_conflict_do_nothing(index_elements=[Like.post_id, Like.user_id])
-            .returning(Like.id)
-        )
-        
-        created_id = await self.db.scalar(ins)
-        if created_id is None:            
-            return False, await self.get_cached_count_likes(post_id=post_id)
+    ) -> RepoResult:
+        """
+        좋아요 토글 + likes_count ±1을 단일 구문으로 실행
+        성공 시 data = (좋아요 여부, 좋아요 수, 카테고리)
+        """
+        found, liked, likes_count, category = (
+            await self.db.execute(
+                TOGGLE_LIKE_SQL,
+                {"post_id": post_id, "user_id": user_id},
+            )
+        ).one()
 
-        # Post 테이블의 likes_count를 원자적(Atomic)으로 증가시켜 동시성 이슈 방지
-        new_count = await self.db.scalar(
-            update(Post)
-            .where(Post.id == post_id)
-            .values(likes_count=Post.likes_count + 1)
-            .returning(Post.likes_count)
-        )
-        return True, int(new_count)
+        if not found:
+            return RepoResult(RepoStatus.NOT_FOUND)
+        return RepoResult(RepoStatus.SUCCESS, (liked, likes_count, category))
 
     async def like_without_counter_cache(
         self,
@@ -87,34 +159,83 @@ class LikeRepository:
         new_count = await self.get_count_likes(post_id=post_id)
         return created, new_count
 
-    # ----------------------------------------------------------------
-    # Delete Operations
-    # ----------------------------------------------------------------
-    async def unlike_with_counter_cache(
-        self, 
-        *, 
-        post_id: int, 
-        user_id: int
-    ) -> tuple[bool, int]:
-        deleted_id = await self.db.scalar(
-            delete(Like)
-            .where(Like.post_id == post_id, Like.user_id == user_id)
-            .returning(Like.id)
+    async def apply_like_ops(
+        self,
+        *,
+        ops: dict[int, dict[int, bool]]
+    ) -> int:
+        """
+        Redis에 쌓인 좋아요 작업(post_id -> {user_id: 최종 상태})을 일괄 반영
+        - 삽입 1회(INSERT ... SELECT ... ON CONFLICT DO NOTHING), 삭제 1회, likes_count ±증감 1회
+        - 증감은 실제로 삽입/삭제된 행(RETURNING) 기준이라 이미 반영된 작업을 다시 적용해도 변하지 않음
+        좋아요 수가 바뀐 게시글 수 반환
+        """
+        if not ops:
+            return 0
+
+        liked, unliked = [], []
+        for post_id, user_ops in ops.items():
+            for user_id, state in user_ops.items():
+                (liked if state else unliked).append((post_id, user_id))
+
+        deltas: Counter[int] = Counter()
+        if liked:
+            like_rows = (
+                values(
+                    column("post_id", Integer),
+                    column("user_id", Integer),
+                    name="like_ops",
+                )
+                .data(liked)
+            )
+            # 그 사이 완전히 삭제된 게시글의 작업은 건너뜀
+            added = await self.db.scalars(
+                insert(Like)
+                .from_select(
+                    ["post_id", "user_id"],
+                    select(like_rows.c.post_id, like_rows.c.user_id)
+                    .join(Post, Post.id == like_rows.c.post_id)
+                )
+                .on_conflict_do_nothing(index_elements=[Like.post_id, Like.user_id])
+                .returning(Like.post_id)
+            )
+            deltas.update(added)
+
+        if unliked:
+            removed = await self.db.scalars(
+                delete(Like)
+                .where(tuple_(Like.post_id, Like.user_id).in_(unliked))
+                .returning(Like.post_id)
+            )
+            deltas.subtract(removed)
+
+        changed = [(post_id, delta) for post_id, delta in deltas.items() if delta]
+        if not changed:
+            return 0
+
+        delta_rows = (
+            values(
+                column("post_id", Integer),
+                column("delta", Integer),
+                name="like_deltas",
+            )
+            .data(changed)
         )
-        
-        if deleted_id is None:
-            return False, await self.get_cached_count_likes(post_id=post_id)
-        
-        real_count = await self.get_count_likes(post_id=post_id)
-        
-        await self.db.execute(
+        # 카운터 변경이므로 updated_at은 유지 (onupdate 방지)
+        result = await self.db.execute(
             update(Post)
-            .where(Post.id == post_id)
-            .values(likes_count=real_count)
+            .where(Post.id == delta_rows.c.post_id)
+            .values(
+                likes_count=Post.likes_count + delta_rows.c.delta,
+                updated_at=Post.updated_at,
+            )
+            .execution_options(synchronize_session=False)
         )
+        return result.rowcount
 
-        return True, real_count
-    
+    # ----------------------------------------------------------------
+    # Delete Operations
+    # ----------------------------------------------------------------
     async def unlike_without_counter_cache(
         self,
         *, 
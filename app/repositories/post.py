@@ -1,13 +1,113 @@
 from datetime import datetime, timezone
-from typing import Optional
-from sqlalchemy import insert,  select, update
-from sqlalchemy.orm import selectinload, joinedload
+from typing import Any, Optional
+from sqlalchemy import Integer, column, exists, false, func, insert, literal, select, text, tuple_, update, values
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import contains_eager, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.enums import PostCategory
-from app.models.post import Post
+from app.core.enums import PostCategory, PostSearchField, PostSort
+from app.models.comment import Comment
+from app.models.like import Like
+from app.models.post import SEARCH_CONFIG, Post
 from app.models.user import User
-from app.repositories.result_types import RepoResult, RepoStatus
+from app.repositories.post_ngram import ngram_match_subquery
+from app.repositories.result_types import PostListVersion, PostVersion, RepoResult, RepoStatus
+
+
+# 정렬 옵션별 (정렬 컬럼, 내림차순 여부). 동점은 id로 같은 방향 정렬
+# 각 정렬은 (category, <컬럼> DESC, id DESC) WHERE NOT is_deleted 부분 인덱스로 처리
+POST_SORT_KEYS = {
+    PostSort.LATEST: (Post.created_at, True),
+    PostSort.OLDEST: (Post.created_at, False),
+    PostSort.POPULAR: (Post.views, True),
+    PostSort.MOST_LIKED: (Post.likes_count, True),
+}
+
+def _comments_page_json(
+    *,
+    post_id: int,
+    limit: int,
+    offset: int
+):
+    """
+    게시글의 댓글 한 페이지(작성자 포함, 삭제된 댓글 제외)를 JSON 배열로 만드는 스칼라 서브쿼리
+    """
+    page = (
+        select(
+            Comment.id,
+            Comment.post_id,
+            Comment.user_id,
+            Comment.parent_id,
+            Comment.content,
+            Comment.created_at,
+            Comment.updated_at,
+            User.nickname,
+            User.role,
+        )
+        .join(User, User.id == Comment.user_id)
+        .where(Comment.post_id == post_id, Comment.is_deleted == false())
+        .order_by(Comment.created_at.asc(), Comment.id.asc())
+        .limit(limit)
+        .offset(offset)
+        .subquery("comments_page")
+    )
+    comment_json = func.json_build_object(
+        "id", page.c.id,
+        "post_id", page.c.post_id,
+        "user_id", page.c.user_id,
+        "parent_id", page.c.parent_id,
+        "content", page.c.content,
+        "created_at", page.c.created_at,
+        "updated_at", page.c.updated_at,
+        "user", func.json_build_object(
+            "nickname", page.c.nickname,
+            "role", page.c.role,
+        ),
+    )
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(comment_json, page.c.created_at, page.c.id)
+                ),
+                text("'[]'::json"),
+            )
+        )
+        .scalar_subquery()
+    )
+
+
+def _liked_by_me(
+    *,
+    post_id: int,
+    user_id: int | None
+):
+    if user_id is None:
+        return literal(False)
+    return exists().where(Like.post_id == post_id, Like.user_id == user_id)
+
+
+def _version_columns(
+    *,
+    post_id: int,
+    user_id: int | None
+) -> list:
+    """
+    PostVersion 순서의 컬럼 목록 (posts 행 기준)
+    댓글 수는 posts.comments_count 카운터 캐시 사용
+    """
+    comments_updated_at = (
+        select(func.max(Comment.updated_at))
+        .where(Comment.post_id == post_id)
+        .scalar_subquery()
+    )
+    return [
+        Post.updated_at,
+        Post.likes_count,
+        Post.comments_count,
+        comments_updated_at,
+        _liked_by_me(post_id=post_id, user_id=user_id),
+    ]
 
 
 class PostRepository:
@@ -49,6 +149,103 @@ class PostRepository:
             .where(Post.id == post_id, Post.is_deleted.is_(False))
         )
 
+    async def get_posts_by_ids(
+        self,
+        *,
+        post_ids: list[int]
+    ) -> list[Post]:
+        """
+        id 목록의 게시글을 단일 쿼리로 조회 (삭제된 게시글 제외, 순서 보장 안 함)
+        """
+        if not post_ids:
+            return []
+
+        result = await self.db.scalars(
+            select(Post)
+            .options(joinedload(Post.author))
+            .where(Post.id.in_(post_ids), Post.is_deleted.is_(False))
+        )
+        return list(result)
+
+    async def get_post_version(
+        self,
+        *,
+        post_id: int,
+        user_id: int | None
+    ) -> PostVersion | None:
+        """
+        조건부 요청(If-None-Match / If-Modified-Since) 확인용 가벼운 버전 조회
+        """
+        row = (
+            await self.db.execute(
+                select(*_version_columns(post_id=post_id, user_id=user_id))
+                .where(Post.id == post_id, Post.is_deleted.is_(False))
+            )
+        ).first()
+        return PostVersion(*row) if row else None
+
+    async def get_post_detail(
+        self,
+        *,
+        post_id: int,
+        user_id: int | None,
+        comments_limit: int,
+        comments_offset: int
+    ) -> tuple[Post, list[dict], PostVersion] | None:
+        """
+        게시글 + 작성자 + 댓글 첫 페이지 + 버전 정보(liked_by_me 포함)를 단일 쿼리로 조회
+        """
+        row = (
+            await self.db.execute(
+                select(
+                    Post,
+                    _comments_page_json(
+                        post_id=post_id,
+                        limit=comments_limit,
+                        offset=comments_offset,
+                    ),
+                    *_version_columns(post_id=post_id, user_id=user_id),
+                )
+                .options(joinedload(Post.author))
+                .where(Post.id == post_id, Post.is_deleted.is_(False))
+            )
+        ).first()
+        if row is None:
+            return None
+
+        post, comments, *version = row
+        return post, comments, PostVersion(*version)
+
+    async def get_post_detail_extras(
+        self,
+        *,
+        post_id: int,
+        user_id: int | None,
+        comments_limit: int,
+        comments_offset: int
+    ) -> tuple[list[dict], PostVersion] | None:
+        """
+        본문 캐시 적중 시 사용: 댓글 첫 페이지 + 버전 정보를 단일 쿼리로 조회
+        """
+        row = (
+            await self.db.execute(
+                select(
+                    _comments_page_json(
+                        post_id=post_id,
+                        limit=comments_limit,
+                        offset=comments_offset,
+                    ),
+                    *_version_columns(post_id=post_id, user_id=user_id),
+                )
+                .where(Post.id == post_id, Post.is_deleted.is_(False))
+            )
+        ).first()
+        if row is None:
+            return None
+
+        comments, *version = row
+        return comments, PostVersion(*version)
+
     async def get_posts_list(
         self, 
         *,
@@ -57,38 +254,144 @@ class PostRepository:
         search_content: str | None,
         author: str | None,
         offset: int,
-        limit: int
+        limit: int,
+        sort: PostSort = PostSort.LATEST,
+        cursor: tuple[Any, int] | None = None,
+        search_query: str | None = None,
+        author_exact: bool = False,
     ) -> list[Post]:
         """
         필터링 및 페이징 목록 조회
+        sort 기준 (정렬 컬럼, id) 순서로 정렬하며, cursor가 주어지면 offset 대신 Keyset 페이징
+        search_query가 주어지면 전문 검색 후 관련도순 정렬 (offset 페이징만 지원)
+        author_exact면 닉네임 일치 사용자 id를 먼저 찾아 posts.user_id로 필터링
         """
-        query = (
-            select(Post)
-            .options(selectinload(Post.author))
-            .join(User, User.id == Post.user_id)
-            .where(Post.is_deleted.is_(False))
-            .order_by(Post.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+        # 작성자는 같은 쿼리의 JOIN으로 함께 로드 (닉네임 검색도 이 JOIN 사용)
+        query = self._filter_posts_list(
+            select(Post).join(Post.author).options(contains_eager(Post.author)),
+            category=category,
+            search_title=search_title,
+            search_content=search_content,
+            author=author,
+            offset=offset,
+            limit=limit,
+            sort=sort,
+            cursor=cursor,
+            search_query=search_query,
+            author_exact=author_exact,
+        )
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_posts_list_versions(
+        self, 
+        *,
+        category: PostCategory | None,
+        search_title: str | None,
+        search_content: str | None,
+        author: str | None,
+        offset: int,
+        limit: int,
+        sort: PostSort = PostSort.LATEST,
+        cursor: tuple[Any, int] | None = None,
+        search_query: str | None = None,
+        author_exact: bool = False,
+    ) -> list[PostListVersion]:
+        """
+        조건부 요청(If-None-Match) 확인용 가벼운 목록 버전 조회
+        get_posts_list와 같은 필터 / 정렬 / 페이징으로 버전 컬럼만 조회 (본문, 엔티티 로드 없음)
+        """
+        query = self._filter_posts_list(
+            select(
+                Post.id,
+                Post.updated_at,
+                Post.views,
+                Post.likes_count,
+                Post.comments_count,
+                User.nickname,
+            )
+            .select_from(Post)
+            .join(Post.author),
+            category=category,
+            search_title=search_title,
+            search_content=search_content,
+            author=author,
+            offset=offset,
+            limit=limit,
+            sort=sort,
+            cursor=cursor,
+            search_query=search_query,
+            author_exact=author_exact,
         )
+        result = await self.db.execute(query)
+        return [PostListVersion(*row) for row in result.all()]
+
+    def _filter_posts_list(
+        self,
+        query,
+        *,
+        category: PostCategory | None,
+        search_title: str | None,
+        search_content: str | None,
+        author: str | None,
+        offset: int,
+        limit: int,
+        sort: PostSort,
+        cursor: tuple[Any, int] | None,
+        search_query: str | None,
+        author_exact: bool,
+    ):
+        """
+        목록 조회 공통 필터 / 정렬 / 페이징 적용 (posts JOIN users 쿼리 기준)
+        """
+        # 부분 인덱스(WHERE is_deleted = false)를 쓰려면 IS false가 아닌 = false로 비교해야 함
+        query = query.where(Post.is_deleted == false()).limit(limit)
+
+        if search_query:
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, search_query)
+            query = (
+                query
+                .where(Post.search_vector.op("@@")(ts_query))
+                .order_by(func.ts_rank_cd(Post.search_vector, ts_query).desc(), Post.id.desc())
+                .offset(offset)
+            )
+        else:
+            sort_column, descending = POST_SORT_KEYS[sort]
+            if descending:
+                query = query.order_by(sort_column.desc(), Post.id.desc())
+            else:
+                query = query.order_by(sort_column.asc(), Post.id.asc())
+
+            if cursor:
+                keyset = tuple_(sort_column, Post.id)
+                query = query.where(keyset < tuple_(*cursor) if descending else keyset > tuple_(*cursor))
+            else:
+                query = query.offset(offset)
 
         # 카테고리 필터
         if category:
             query = query.where(Post.category == category)
 
-        # 간단한 검색 (검색 데이터가 많아지면 느려질 수 있음)
-        # TODO: TSVector(Full Text Search) 고려
+        # 부분 문자열 검색 (관련도 검색은 search_query 사용)
+        # 2-gram 색인으로 후보를 좁힌 뒤 ILIKE로 최종 확인
         if search_title:
-            query = query.where(Post.title.ilike(f"%{search_title}%"))
+            query = self._where_contains(query, PostSearchField.TITLE, Post.title, search_title)
 
         if search_content:
-            query = query.where(Post.content.ilike(f"%{search_content}%"))
+            query = self._where_contains(query, PostSearchField.CONTENT, Post.content, search_content)
 
-        if author:
+        if author and author_exact:
+            # 고유 인덱스(ix_users_nickname)로 id를 한 번만 조회 -> ix_posts_user_id 사용
+            author_id = (
+                select(User.id)
+                .where(User.nickname == author)
+                .scalar_subquery()
+            )
+            query = query.where(Post.user_id == author_id)
+        elif author:
             query = query.where(User.nickname.ilike(f"%{author}%"))
-            
-        result = await self.db.execute(query)
-        return result.scalars().all()
+
+        return query
 
     # ----------------------------------------------------------------
     # Create / Update Operations
@@ -152,21 +455,79 @@ class PostRepository:
 
         return await self._analyze_failure(post_id, user_id)
 
-    async def sync_views(
+    async def apply_view_deltas(
             self,
             *,
-            post_id: int,
-            views: int
-    ) -> None:
+            deltas: dict[int, int]
+    ) -> int:
         """
-        Redis 조회수 DB 동기화
+        Redis 조회수 증가분을 단일 UPDATE ... FROM (VALUES ...)로 일괄 반영
+        반영된 게시글 수 반환
         """
+        if not deltas:
+            return 0
+
+        delta_rows = (
+            values(
+                column("post_id", Integer),
+                column("delta", Integer),
+                name="view_deltas",
+            )
+            .data(list(deltas.items()))
+        )
         stmt = (
             update(Post)
-            .where(Post.id == post_id)
-            .values(views=views)
+            .where(Post.id == delta_rows.c.post_id)
+            # 조회수 반영은 게시글 수정이 아니므로 updated_at 유지 (ETag / Last-Modified 보존)
+            .values(
+                views=Post.views + delta_rows.c.delta,
+                updated_at=Post.updated_at,
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.rowcount
+
+    async def reconcile_comments_count(
+            self,
+            *,
+            after_id: int,
+            limit: int
+    ) -> tuple[int, int | None]:
+        """
+        id가 after_id보다 큰 게시글 limit개의 comments_count를 실제 댓글 수와 비교해 보정
+        댓글 작성/삭제 중인 게시글은 잠금을 건너뛰고(SKIP LOCKED) 다음 점검에서 확인
+
+        Returns:
+            (보정된 게시글 수, 다음 배치 기준 id) - 더 이상 게시글이 없으면 다음 기준 id는 None
+        """
+        post_ids = (await self.db.scalars(
+            select(Post.id)
+            .where(Post.id > after_id)
+            .order_by(Post.id)
+            .limit(limit)
+        )).all()
+        if not post_ids:
+            return 0, None
+
+        locked_ids = (await self.db.scalars(
+            select(Post.id)
+            .where(Post.id.in_(post_ids))
+            .with_for_update(skip_locked=True)
+        )).all()
+
+        actual_count = (
+            select(func.count())
+            .where(Comment.post_id == Post.id, Comment.is_deleted == false())
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(Post)
+            .where(Post.id.in_(locked_ids), Post.comments_count != actual_count)
+            .values(comments_count=actual_count, updated_at=Post.updated_at)
+            .returning(Post.id)
+            .execution_options(synchronize_session=False)
         )
-        await self.db.execute(stmt)
+        return len(result.all()), post_ids[-1]
 
     async def increment_views_if_exists(self, *, post_id: int) -> int | None:
         """
@@ -175,7 +536,7 @@ class PostRepository:
         stmt = (
             update(Post)
             .where(Post.id == post_id, Post.is_deleted.is_(False))
-            .values(views=Post.views + 1)
+            .values(views=Post.views + 1, updated_at=Post.updated_at)
             .returning(Post.views)
         )
         return await self.db.scalar(stmt)
@@ -228,6 +589,13 @@ class PostRepository:
     # ----------------------------------------------------------------
     # Helper Methods
     # ----------------------------------------------------------------
+    @staticmethod
+    def _where_contains(query, field: PostSearchField, column, keyword: str):
+        candidates = ngram_match_subquery(field=field, keyword=keyword)
+        if candidates is not None:
+            query = query.where(Post.id.in_(candidates))
+        return query.where(column.ilike(f"%{keyword}%"))
+
     async def _analyze_failure(
             self,
             post_id: int,
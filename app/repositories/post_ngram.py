@@ -0,0 +1,84 @@
+from sqlalchemy import String, bindparam, delete, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.enums import PostSearchField
+from app.core.ngram import extract_ngrams
+from app.models.post_ngram import PostNgram
+
+
+# 게시글의 제목/내용을 소문자 + 공백 단위 토큰으로 나눈 뒤 2-gram 생성 (core/ngram.py와 동일 규칙)
+INSERT_NGRAMS_SQL = text("""
+    INSERT INTO post_ngrams (post_id, field, gram)
+    SELECT p.id, f.field, g.gram
+    FROM posts p
+    CROSS JOIN LATERAL (
+        VALUES ('title', p.title), ('content', p.content)
+    ) AS f(field, body)
+    CROSS JOIN LATERAL (
+        SELECT DISTINCT substr(tok, i, 2) AS gram
+        FROM regexp_split_to_table(lower(f.body), '\\s+') AS tok,
+             generate_series(1, char_length(tok) - 1) AS i
+    ) AS g
+    WHERE p.id = :post_id
+      AND f.field = ANY(:fields)
+""").bindparams(bindparam("fields", type_=ARRAY(String)))
+
+
+def ngram_match_subquery(
+    *,
+    field: PostSearchField,
+    keyword: str
+) -> Select | None:
+    """
+    검색어의 2-gram을 모두 포함하는 게시글 id 서브쿼리
+    2-gram을 만들 수 없는 검색어(1글자)는 None 반환
+    """
+    grams = extract_ngrams(keyword)
+    if not grams:
+        return None
+
+    return (
+        select(PostNgram.post_id)
+        .where(
+            PostNgram.field == field.value,
+            PostNgram.gram.in_(grams),
+        )
+        .group_by(PostNgram.post_id)
+        .having(func.count() == len(grams))
+    )
+
+
+class PostNgramRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ----------------------------------------------------------------
+    # Create / Update Operations
+    # ----------------------------------------------------------------
+    async def refresh(
+        self,
+        *,
+        post_id: int,
+        fields: list[PostSearchField],
+    ) -> None:
+        """
+        게시글의 지정된 필드 2-gram 색인 재생성
+        """
+        if not fields:
+            return
+
+        values = [field.value for field in fields]
+
+        await self.db.execute(
+            delete(PostNgram)
+            .where(
+                PostNgram.post_id == post_id,
+                PostNgram.field.in_(values),
+            )
+        )
+        await self.db.execute(
+            INSERT_NGRAMS_SQL,
+            {"post_id": post_id, "fields": values},
+        )
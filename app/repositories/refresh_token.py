@@ -1,5 +1,3 @@
-from typing import Sequence
-
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
 from datetime import datetime, timezone
@@ -22,14 +20,6 @@ class RefreshTokenRepository:
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
-    async def get_all_tokens_by_user(
-            self,
-            user_id: int
-    ) -> Sequence[RefreshToken]:
-        stmt = select(RefreshToken).where(RefreshToken.user_id == user_id)
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
-
     # ----------------------------------------------------------------
     # Create / Update Operations
     # ----------------------------------------------------------------
@@ -38,6 +28,7 @@ class RefreshTokenRepository:
         *,
         user_id: int,
         token: str,
+        family_id: str,
         expires_at: datetime,
     ) -> RefreshToken:
         """
@@ -46,6 +37,7 @@ class RefreshTokenRepository:
         db_token = RefreshToken(
             user_id=user_id,
             token=token,
+            family_id=family_id,
             expires_at=expires_at,
             created_at=datetime.now(timezone.utc),
         )
@@ -56,6 +48,40 @@ class RefreshTokenRepository:
     # ----------------------------------------------------------------
     # Delete Operations
     # ----------------------------------------------------------------
+    async def consume_token(
+        self,
+        *,
+        token: str
+    ) -> RefreshToken | None:
+        """
+        다이제스트로 토큰을 찾아 삭제하고 반환 (고유 인덱스 동등 조회 1회)
+        동시에 같은 토큰으로 갱신해도 한 요청만 행을 받음
+        """
+        stmt = (
+            delete(RefreshToken)
+            .where(RefreshToken.token == token)
+            .returning(RefreshToken)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def delete_family(
+        self,
+        *,
+        user_id: int,
+        family_id: str
+    ) -> int:
+        """
+        한 기기(family)의 Refresh token 모두 삭제
+        삭제된 토큰 수 반환
+        """
+        stmt = delete(RefreshToken).where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.family_id == family_id,
+        )
+        result = await self.db.execute(stmt)
+        return result.rowcount
+
     async def delete_all_token_by_user(
         self, 
         user_id: int
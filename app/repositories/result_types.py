@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum, auto
 from typing import NamedTuple, Any
 
@@ -7,7 +8,32 @@ class RepoStatus(Enum):
     NOT_FOUND = auto()
     FORBIDDEN = auto()
     ALREADY_DELETED = auto()    
+    CONFLICT = auto()
 
 class RepoResult(NamedTuple):
     status: RepoStatus
-    data: Any | None = None
\ No newline at end of file
+    data: Any | None = None
+
+class PostVersion(NamedTuple):
+    """
+    게시글 상세 응답의 변경 여부 판단용 버전 정보 (ETag / Last-Modified)
+    """
+    updated_at: datetime
+    likes_count: int
+    comments_count: int
+    comments_updated_at: datetime | None
+    liked_by_me: bool
+
+class PostListVersion(NamedTuple):
+    """
+    게시글 목록 응답의 변경 여부 판단용 행별 버전 정보 (ETag)
+    - liked_by_me / bookmarked_by_me는 with_flags 조회에서만 채움
+    """
+    id: int
+    updated_at: datetime
+    views: int
+    likes_count: int
+    comments_count: int
+    author_nickname: str
+    liked_by_me: bool = False
+    bookmarked_by_me: bool = False
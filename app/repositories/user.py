@@ -1,8 +1,16 @@
 from typing import Optional
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
+from app.repositories.result_types import RepoResult, RepoStatus
+
+
+# 회원가입 중복 판단에 쓰는 고유 인덱스 (models.user.User.__table_args__)
+USER_EMAIL_INDEX = "ix_users_email"
+USER_NICKNAME_INDEX = "ix_users_nickname"
 
 
 class UserRepository:
@@ -38,28 +46,6 @@ class UserRepository:
             )
         )
     
-    async def is_available_email(
-        self, 
-        *, 
-        email: str
-    ) -> bool:
-        """
-        이메일 중복 체크
-        """
-        existing_user = await self.db.scalar(select(User).where(User.email == email))
-        return existing_user is None
-        
-    async def is_available_nickname(
-        self,
-        *, 
-        nickname: str
-    ) -> bool:
-        """
-        닉네임 중복 체크
-        """
-        existing_user = await self.db.scalar(select(User).where(User.nickname == nickname))
-        return existing_user is None
-
     # ----------------------------------------------------------------
     # Create / Update Operations
     # ----------------------------------------------------------------
@@ -69,12 +55,35 @@ class UserRepository:
         email: str,        
         hashed_password: str,
         nickname: str,
-    ) -> User:
-        user = User(            
-            email=email,            
-            hashed_password=hashed_password,
-            nickname=nickname,
+    ) -> RepoResult:
+        """
+        중복 검사 없이 단일 INSERT로 등록
+        이메일 충돌은 ON CONFLICT DO NOTHING(RETURNING 없음), 닉네임 충돌은 고유 인덱스 위반으로 판단
+
+        닉네임 충돌 시 트랜잭션이 중단되므로 호출 측은 같은 트랜잭션에서 더 진행하지 않아야 한다.
+
+        Returns:
+            RepoResult(SUCCESS, User) | RepoResult(CONFLICT, 위반한 인덱스 이름)
+        """
+        stmt = (
+            insert(User)
+            .values(
+                email=email,
+                hashed_password=hashed_password,
+                nickname=nickname,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
         )
-        self.db.add(user)
-        await self.db.flush()
-        return user
\ No newline at end of file
+
+        try:
+            user = await self.db.scalar(stmt)
+        except IntegrityError as e:
+            constraint = getattr(e.orig.__cause__, "constraint_name", None)
+            if constraint == USER_NICKNAME_INDEX:
+                return RepoResult(RepoStatus.CONFLICT, USER_NICKNAME_INDEX)
+            raise
+
+        if user is None:
+            return RepoResult(RepoStatus.CONFLICT, USER_EMAIL_INDEX)
+        return RepoResult(RepoStatus.SUCCESS, user)
\ No newline at end of file
@@ -13,6 +13,8 @@ class TokenPayload(BaseModel):
     sub: str = Field(..., description="User ID subject")
     type: str = Field(..., description="Token type (access, refresh)")
     exp: datetime = Field(..., description="Expiration time (UTC)")
+    jti: str | None = Field(None, description="Token ID (refresh)")
+    fid: str | None = Field(None, description="Token family ID (refresh, per device)")
     # role: UserRole = Field(..., description="User role (admin, user)")
 
 class LoginRequest(BaseModel):
@@ -15,6 +15,10 @@ class CommentPublic(BaseModel):
     user: UserPublic
     model_config = ConfigDict(from_attributes=True)
 
+class CommentThread(CommentPublic):
+    reply_count: int
+    replies: list[CommentPublic]
+
 class CommentCreate(BaseModel):        
     post_id: int
     parent_id: int | None = None
@@ -13,10 +13,15 @@ class PostSummary(BaseModel):
     category: PostCategory | None = None    
     views: int
     likes_count: int
+    comments_count: int
     updated_at: datetime
     author: UserPublic
     model_config = ConfigDict(from_attributes=True)
 
+class PostSummaryWithFlags(PostSummary):
+    liked_by_me: bool = False
+    bookmarked_by_me: bool = False
+
 class PostDetailCore(BaseModel):
     id: int
     title: str
@@ -31,6 +36,7 @@ class PostDetailCore(BaseModel):
 
 class PostDetail(PostDetailCore):
     comments: list[CommentPublic]    
+    comments_count: int
     liked_by_me: bool
     
 class PostCreate(BaseModel):
@@ -1,6 +1,7 @@
 import string
 from datetime import datetime, timezone, timedelta
 
+from app.cache.user_cache import UserCache
 from app.core.settings import settings
 from app.core.uow import UnitOfWork
 from app.exceptions.types import (
@@ -15,20 +16,28 @@ from app.exceptions.types import (
     UserNotFoundException
 )
 from app.core import security
+from app.repositories.result_types import RepoStatus
+from app.repositories.user import USER_EMAIL_INDEX
 from app.schemas.auth_token import TokenResponse
 from app.schemas.user import UserRegister, UserResponse
 from app.core.security import TokenDecodeException
 
 
 class AuthService:
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.user_cache = UserCache(redis_client, ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
+
     async def authenticate_user(
         self,
         uow: UnitOfWork,
         *,
         token: str,
+        use_user_cache: bool = settings.USE_USER_CACHE,
     ) -> UserResponse:
         """
         액세스 토큰을 검증하고 사용자 정보 반환
+        use_user_cache인 경우 사용자 캐시(프로세스 내 -> Redis)를 먼저 조회하고, 미스일 때만 DB 조회
 
         Raises:
             InvalidTokenException: 토큰 서명이 유효하지 않거나 만료된 경우, 또는 payload에서 user_id를 찾을 수 없는 경우
@@ -37,13 +46,21 @@ class AuthService:
         user_id = security.extract_user_id_from_token(token)
         if not user_id:
             raise InvalidTokenException()
+
+        if use_user_cache:
+            cached_user = await self.user_cache.get(user_id=user_id)
+            if cached_user is not None:
+                return cached_user
         
         async with uow:
             user = await uow.users.get_by_id(user_id=user_id)
             if not user:
                 raise UserNotFoundException(user_id)
 
-        return UserResponse.model_validate(user)
+        user_response = UserResponse.model_validate(user)
+        if use_user_cache:
+            await self.user_cache.set(user=user_response)
+        return user_response
 
     async def login(
         self,
@@ -55,24 +72,31 @@ class AuthService:
         """
         이메일과 비밀번호로 로그인하고 액세스/리프레시 토큰 발급
         로그인 성공 시 기존의 만료된 refresh_token 정리
+        비밀번호 검증(argon2)은 DB 커넥션을 잡지 않은 상태에서 전용 풀로 실행
 
         Raises:
             InvalidCredentialsException: 이메일이 존재하지 않거나 비밀번호가 일치하지 않는 경우
+            ServiceBusyException: 비밀번호 검증 대기열이 가득 찬 경우
         """
         async with uow:
             user = await uow.users.get_by_email(user_email=email)
-            if not user or not security.verify_password(password, user.hashed_password):
-                raise InvalidCredentialsException()
 
+        if not user or not await security.verify_password_async(password, user.hashed_password):
+            raise InvalidCredentialsException()
+
+        async with uow:
             access_token = security.create_access_token(
                 {
                     "sub": str(user.id),
                     "role": user.role
                 }
             )
+            # 로그인마다 새 family(기기) 시작 - 다른 기기의 토큰은 유지
+            family_id = security.new_token_family()
             refresh_token = security.create_refresh_token(
                 {
-                    "sub": str(user.id)
+                    "sub": str(user.id),
+                    "fid": family_id
                 }
             )
             
@@ -83,6 +107,7 @@ class AuthService:
             await uow.refresh_tokens.create_token(
                 user_id=user.id, 
                 token=hashed_refresh_token,
+                family_id=family_id,
                 expires_at=expires_at
             )                
 
@@ -100,73 +125,69 @@ class AuthService:
     ) -> TokenResponse:
         """
         리프레시 토큰을 사용하여 새로운 액세스/리프레시 토큰 발급
-        사용된 리프레시 토큰은 폐기
+        사용된 리프레시 토큰은 폐기하고 같은 family(기기) 안에서 새 토큰으로 교체
+        이미 교체된 토큰이 다시 사용되면 탈취로 보고 해당 family 전체 폐기
 
         Raises:
-            InvalidTokenException: 토큰 형식, 타입이 유효하지 않은 경우
-            TokenPayloadInvalidException: 토큰 페이로드에 사용자 정보가 없는 경우
-            RefreshTokenNotFoundException: 해당 사용자의 리프레시 토큰 기록이 없는 경우
+            InvalidTokenException: 토큰 형식, 타입이 유효하지 않거나 이미 사용된 토큰인 경우
+            TokenPayloadInvalidException: 토큰 페이로드에 사용자 또는 family 정보가 없는 경우
+            RefreshTokenNotFoundException: 저장된 리프레시 토큰 기록이 없는 경우
             RefreshTokenExpiredException: 리프레시 토큰의 유효기간이 만료된 경우
             UserNotFoundException: 토큰은 유효하나, 해당 ID를 가진 사용자가 DB에 존재하지 않는 경우
         """
-        # 토큰 서명/페이로드 검증
-        try:
-            payload = security.decode_token(refresh_token)
-        except TokenDecodeException:
-            raise InvalidTokenException()
-
-        if payload.type != "refresh":
-            raise InvalidTokenException("Not a refresh token")
-
-        user_id = int(payload.sub)
-        if not user_id:
-            raise TokenPayloadInvalidException()
+        user_id, family_id = self._decode_refresh_token(refresh_token)
+        now = datetime.now(timezone.utc)
         
         async with uow:
-            user_tokens = await uow.refresh_tokens.get_all_tokens_by_user(user_id)
-            if not user_tokens:
-                raise RefreshTokenNotFoundException()
-
-            matched_token = None
-            for stored in user_tokens:
-                if security.verify_refresh_token(refresh_token, stored.token):
-                    matched_token = stored
-                    break
+            # 다이제스트 고유 인덱스로 조회 + 삭제 (동시 갱신 시 한 요청만 성공)
+            stored = await uow.refresh_tokens.consume_token(
+                token=security.hash_refresh_token(refresh_token)
+            )
 
-            if not matched_token:
+            if stored is None:
+                # 서명은 유효하지만 저장되어 있지 않음 -> 교체된 토큰의 재사용이면 family 폐기
+                # (폐기를 커밋하기 위해 예외는 트랜잭션 밖에서 발생)
+                reused = await uow.refresh_tokens.delete_family(
+                    user_id=user_id,
+                    family_id=family_id,
+                )
+            elif stored.user_id != user_id:
                 raise InvalidTokenException()
-            
-            # refresh_token 만료 체크
-            if matched_token.expires_at < datetime.now(timezone.utc):
-                await uow.refresh_tokens.delete_all_token_by_user(user_id=user_id)
-                raise RefreshTokenExpiredException()
-
-            user = await uow.users.get_by_id(user_id=user_id)
-            if not user:
-                raise UserNotFoundException(user_id)
-
-            await uow.refresh_tokens.delete_all_token_by_user(user_id=user_id)
+            elif stored.expires_at >= now:
+                user = await uow.users.get_by_id(user_id=user_id)
+                if not user:
+                    raise UserNotFoundException(user_id)
+
+                new_access_token = security.create_access_token(
+                    {
+                        "sub": str(user_id),
+                        "role": user.role
+                    }
+                )
+                new_refresh_token = security.create_refresh_token(
+                    {
+                        "sub": str(user_id),
+                        "fid": stored.family_id
+                    }
+                )
+                
+                new_hashed_refresh_token = security.hash_refresh_token(new_refresh_token)
+                expires_at = now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+                            
+                await uow.refresh_tokens.create_token(
+                    user_id=user_id, 
+                    token=new_hashed_refresh_token,
+                    family_id=stored.family_id,
+                    expires_at=expires_at
+                )
 
-            new_access_token = security.create_access_token(
-                {
-                    "sub": str(user_id),
-                    "role": user.role
-                }
-            )
-            new_refresh_token = security.create_refresh_token(
-                {
-                    "sub": str(user_id)
-                }
-            )
-            
-            new_hashed_refresh_token = security.hash_refresh_token(new_refresh_token)
-            expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-                        
-            await uow.refresh_tokens.create_token(
-                user_id=user_id, 
-                token=new_hashed_refresh_token,
-                expires_at=expires_at
-            )
+        if stored is None:
+            if reused:
+                raise InvalidTokenException("Refresh token reuse detected.")
+            raise RefreshTokenNotFoundException()
+        # 만료된 토큰은 삭제된 상태로 커밋
+        if stored.expires_at < now:
+            raise RefreshTokenExpiredException()
 
         return TokenResponse(
             access_token=new_access_token, 
@@ -181,26 +202,17 @@ class AuthService:
         refresh_token: str
     ) -> None:
         """
-        사용자의 리프레시 토큰을 DB에서 삭제하여 로그아웃 처리
+        리프레시 토큰이 속한 family(기기)의 토큰을 DB에서 삭제하여 로그아웃 처리
+        다른 기기의 로그인은 유지
 
         Raises:
             InvalidTokenException: 토큰 형식, 타입이 유효하지 않은 경우
-            TokenPayloadInvalidException: 토큰 페이로드에 사용자 정보가 없는 경우
+            TokenPayloadInvalidException: 토큰 페이로드에 사용자 또는 family 정보가 없는 경우
         """
-        try:
-            payload = security.decode_token(refresh_token)
-        except TokenDecodeException:
-             raise InvalidTokenException()
-
-        if payload.type != "refresh":
-            raise InvalidTokenException("Not a refresh token")
-
-        user_id = int(payload.sub)
-        if not user_id:
-            raise TokenPayloadInvalidException()
+        user_id, family_id = self._decode_refresh_token(refresh_token)
 
         async with uow:
-            await uow.refresh_tokens.delete_all_token_by_user(user_id=user_id)
+            await uow.refresh_tokens.delete_family(user_id=user_id, family_id=family_id)
 
     async def register(
         self,
@@ -215,26 +227,51 @@ class AuthService:
             UserExistEmailException: 이미 가입된 이메일인 경우
             UserExistNicknameException: 이미 존재하는 닉네임인 경우
             PasswordValidationException: 비밀번호가 정책을 만족하지 못하는 경우
+            ServiceBusyException: 비밀번호 해시 대기열이 가득 찬 경우
         """
-        # 중복 검사
+        self._validate_password_strength(data.password)
+
+        # 해시는 DB 커넥션을 잡기 전에 계산
+        hashed_password = await security.hash_password_async(data.password)
+
+        # 중복 검사 + 삽입을 단일 INSERT ... ON CONFLICT로 처리
         async with uow:
-            if not await uow.users.is_available_email(email=data.email):
-                raise UserExistEmailException(email=data.email)
+            result = await uow.users.register_user(
+                email=data.email,
+                hashed_password=hashed_password,
+                nickname=data.nickname
+            )
 
-            if not await uow.users.is_available_nickname(nickname=data.nickname):
+            if result.status == RepoStatus.CONFLICT:
+                if result.data == USER_EMAIL_INDEX:
+                    raise UserExistEmailException(email=data.email)
                 raise UserExistNicknameException(nickname=data.nickname)
-        
-            self._validate_password_strength(data.password)
 
-            hashed_password = security.hash_password(data.password)
+        return UserResponse.model_validate(result.data)
 
-            user = await uow.users.register_user(
-                    email=data.email,
-                    hashed_password=hashed_password,
-                    nickname=data.nickname
-                )
+    def _decode_refresh_token(
+        self,
+        refresh_token: str
+    ) -> tuple[int, str]:
+        """
+        리프레시 토큰 서명/타입 검증 후 (user_id, family_id) 반환
+
+        Raises:
+            InvalidTokenException: 토큰 형식, 타입이 유효하지 않은 경우
+            TokenPayloadInvalidException: 토큰 페이로드에 사용자 또는 family 정보가 없는 경우
+        """
+        try:
+            payload = security.decode_token(refresh_token)
+        except TokenDecodeException:
+            raise InvalidTokenException()
 
-        return UserResponse.model_validate(user)
+        if payload.type != "refresh":
+            raise InvalidTokenException("Not a refresh token")
+
+        user_id = int(payload.sub)
+        if not user_id or not payload.fid:
+            raise TokenPayloadInvalidException()
+        return user_id, payload.fid
 
     def _validate_password_strength(
         self,
@@ -1,5 +1,5 @@
 from app.core.uow import UnitOfWork
-from app.schemas.post import PostSummary
+from app.schemas.post import PostSummary, PostSummaryWithFlags
 
 
 class BookmarkService:
@@ -9,10 +9,12 @@ class BookmarkService:
         *,
         user_id: int,
         offset: int,
-        limit: int              
+        limit: int,
+        with_flags: bool = False,
     ) -> list[PostSummary]:
         """
         사용자가 북마크한 게시글 목록 조회
+        with_flags면 liked_by_me / bookmarked_by_me 포함 (PostSummaryWithFlags, 좋아요 쿼리 1회 추가)
         """
         async with uow:
             bookmarks_post = await uow.bookmarks.list_by_user(
@@ -21,4 +23,19 @@ class BookmarkService:
                 limit=limit
             )
 
-            return [PostSummary.model_validate(bookmark_post) for bookmark_post in bookmarks_post]
\ No newline at end of file
+            posts = [PostSummary.model_validate(bookmark_post) for bookmark_post in bookmarks_post]
+            if not with_flags:
+                return posts
+
+            liked_ids = await uow.likes.get_liked_post_ids(
+                user_id=user_id,
+                post_ids=[post.id for post in posts],
+            )
+            return [
+                PostSummaryWithFlags.model_construct(
+                    **dict(post),
+                    liked_by_me=post.id in liked_ids,
+                    bookmarked_by_me=True,
+                )
+                for post in posts
+            ]
\ No newline at end of file
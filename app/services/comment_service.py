@@ -1,10 +1,21 @@
+from app.cache.comment_page import CommentPageCache
+from app.core.pagination import decode_datetime_cursor, encode_cursor
+from app.core.settings import settings
 from app.core.uow import UnitOfWork
 from app.exceptions.types import CommentNotFoundException, CommentPostMismatchException, InternalServerException, ReplyDepthLimitExceededException, RuleViolationException, UserMismatchException
 from app.repositories.result_types import RepoStatus
 from app.schemas.comment import CommentCreate, CommentUpdate, CommentPublic
 
 
-class CommentService:    
+class CommentService:
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.page_cache = CommentPageCache(
+            redis_client,
+            ttl_seconds=settings.COMMENT_PAGE_CACHE_TTL_SECONDS,
+            page_size=settings.COMMENT_PAGE_CACHE_SIZE,
+        )
+
     async def register_comment(
         self,
         uow: UnitOfWork,
@@ -15,6 +26,7 @@ class CommentService:
         """
         게시글에 댓글 등록
         parent_id가 존재하면 대댓글로 등록
+        커밋 후 캐시된 댓글 첫 페이지에 새 댓글 추가
 
         Raises:
             CommentNotFoundException: 대댓글 작성 시, 지정한 부모 댓글(parent_id)이 존재하지 않는 경우
@@ -44,9 +56,47 @@ class CommentService:
                 user_id=user_id,
                 content=data.content,
             )
+            comment = CommentPublic.model_validate(created_comment)
 
-            return CommentPublic.model_validate(created_comment)
+        await self.page_cache.append(comment=comment)
+        return comment
                       
+    async def read_replies(
+        self,
+        uow: UnitOfWork,
+        *,
+        comment_id: int,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[CommentPublic], str | None]:
+        """
+        댓글에 달린 대댓글 목록과 다음 페이지 커서 조회 (작성순)
+
+        Raises:
+            CommentNotFoundException: 부모 댓글이 존재하지 않거나 삭제된 경우
+            InvalidCursorException: 커서 형식이 올바르지 않은 경우
+        """
+        decoded_cursor = decode_datetime_cursor(cursor) if cursor else None
+
+        async with uow:
+            parent = await uow.comments.get_comment_by_parent_id(parent_id=comment_id)
+            if parent is None:
+                raise CommentNotFoundException(comment_id=comment_id)
+
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+            replies = await uow.comments.get_replies(
+                parent_id=comment_id,
+                limit=limit + 1,
+                cursor=decoded_cursor,
+            )
+
+            next_cursor = None
+            if len(replies) > limit:
+                replies = replies[:limit]
+                next_cursor = encode_cursor(replies[-1].created_at, replies[-1].id)
+
+            return [CommentPublic.model_validate(reply) for reply in replies], next_cursor
+
     async def update_comment(
         self,
         uow: UnitOfWork,
@@ -57,6 +107,7 @@ class CommentService:
     ) -> CommentPublic:
         """
         기존 댓글의 내용 수정
+        커밋 후 캐시된 댓글 첫 페이지의 해당 댓글 교체
 
         Raises:
             CommentNotFoundException: 해당 댓글이 존재하지 않거나 이미 삭제된 경우
@@ -71,7 +122,9 @@ class CommentService:
             )
 
         if result.status == RepoStatus.SUCCESS:
-            return CommentPublic.model_validate(result.data)
+            comment = CommentPublic.model_validate(result.data)
+            await self.page_cache.replace(comment=comment)
+            return comment
         if result.status == RepoStatus.NOT_FOUND:
             raise CommentNotFoundException(comment_id=comment_id)
         if result.status == RepoStatus.FORBIDDEN:
@@ -87,6 +140,7 @@ class CommentService:
     ) -> None:
         """
         댓글 삭제 처리(Soft Delete)
+        커밋 후 캐시된 댓글 첫 페이지에서 해당 댓글 제거
 
         Raises:
             CommentNotFoundException: 해당 댓글이 존재하지 않거나 이미 삭제된 상태인 경우
@@ -100,6 +154,7 @@ class CommentService:
             )
 
         if result.status == RepoStatus.SUCCESS:
+            await self.page_cache.remove(post_id=result.data, comment_id=comment_id)
             return
         if result.status in (RepoStatus.NOT_FOUND, RepoStatus.ALREADY_DELETED):
             raise CommentNotFoundException(comment_id=comment_id)
@@ -1,17 +1,39 @@
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 
-from app.core.enums import PostCategory
+from app.cache.comment_page import CommentPageCache
+from app.cache.keys import post_likes_key, post_views_key
+from app.cache.like_store import LikeStore
+from app.cache.post_detail import PostDetailCache
+from app.cache.trending import TrendingBoard
+from app.cache.view_counter import ViewCounter
+from app.core.enums import PostCategory, PostSearchField, PostSort
+from app.core.pagination import decode_datetime_cursor, decode_sort_cursor, encode_cursor
+from app.core.settings import settings
 from app.core.uow import UnitOfWork
-from app.exceptions.types import InternalServerException, PostNotFoundException, UserMismatchException
-from app.repositories.post import RepoStatus
-from app.schemas.comment import CommentPublic
-from app.schemas.post import PostCreate, PostDetailCore, PostUpdate, PostDetail, PostSummary
+from app.exceptions.types import InternalServerException, InvalidCursorException, PostNotFoundException, UserMismatchException
+from app.repositories.post import POST_SORT_KEYS, RepoStatus
+from app.repositories.result_types import PostListVersion, PostVersion
+from app.schemas.comment import CommentPublic, CommentThread
+from app.schemas.post import PostCreate, PostDetailCore, PostUpdate, PostDetail, PostSummary, PostSummaryWithFlags
 
 
 class PostService:
     def __init__(self, session_factory, redis_client):
         self.session_factory = session_factory
         self.redis = redis_client
+        self.detail_cache = PostDetailCache(
+            redis_client,
+            ttl_seconds=settings.POST_DETAIL_CACHE_TTL_SECONDS
+        )
+        self.comment_cache = CommentPageCache(
+            redis_client,
+            ttl_seconds=settings.COMMENT_PAGE_CACHE_TTL_SECONDS,
+            page_size=settings.COMMENT_PAGE_CACHE_SIZE,
+        )
+        self.view_counter = ViewCounter(redis_client)
+        self.like_store = LikeStore(redis_client)
+        self.trending = TrendingBoard(redis_client)
         
     async def read_post_by_id(
         self,
@@ -22,72 +44,195 @@ class PostService:
         comments_limit: int = 100,
         comments_offset: int = 0,        
         use_views_counter_cache: bool = True,
-    ) -> PostDetail:
+        use_detail_cache: bool = True,
+        use_comment_cache: bool = False,
+        use_like_store: bool = False,
+    ) -> tuple[PostDetail, PostVersion]:
         """
-        게시글 상세 정보 조회
+        게시글 상세 정보와 버전 정보(ETag / Last-Modified 계산용) 조회
+        게시글 + 작성자 + 댓글 첫 페이지 + liked_by_me는 단일 쿼리로 조회하고,
+        use_detail_cache인 경우 게시글 본문은 Redis 캐시에서 먼저 조회
+        use_comment_cache인 경우 댓글 첫 페이지는 Redis 캐시에서 먼저 조회 (적중 시 댓글 쿼리 생략)
 
         Raises:
             PostNotFoundException: 해당 ID의 게시글이 존재하지 않는 경우
         """
+        use_comment_cache = (
+            use_comment_cache
+            and comments_offset == 0
+            and comments_limit <= self.comment_cache.page_size
+        )
+        cached_comments, comments_gen = None, None
+        if use_comment_cache:
+            cached_comments, comments_gen = await self.comment_cache.get(post_id=post_id)
+
+        # 캐시 적중이면 댓글 서브쿼리는 LIMIT 0으로 건너뛰고, 미스면 캐시 용량만큼 조회해 채움
+        if cached_comments is not None:
+            comments_limit_for_query = 0
+        elif use_comment_cache:
+            comments_limit_for_query = self.comment_cache.capacity
+        else:
+            comments_limit_for_query = comments_limit
+
+        detail_args = dict(
+            post_id=post_id,
+            user_id=user_id,
+            comments_limit=comments_limit_for_query,
+            comments_offset=comments_offset,
+        )
+
         async with uow:
-            if use_views_counter_cache:                
-                post = await uow.posts.get_post_with_user(post_id=post_id)
-                if not post:
-                    raise PostNotFoundException(post_id=post_id)
-                
-                post_dto = PostDetailCore.model_validate(post)
-                
-                cache_key = f"post:views:{post_id}"
-                cached_views = await self.redis.get(cache_key)
+            if use_views_counter_cache:
+                post_dto = None
+                if use_detail_cache:
+                    post_dto, cache_version = await self.detail_cache.get(post_id=post_id)
+
+                if post_dto is not None:
+                    extras = await uow.posts.get_post_detail_extras(**detail_args)
+                    if extras is None:
+                        raise PostNotFoundException(post_id=post_id)
+
+                    comments, version = extras
+                else:
+                    detail = await uow.posts.get_post_detail(**detail_args)
+                    if detail is None:
+                        raise PostNotFoundException(post_id=post_id)
+                    
+                    post, comments, version = detail
+                    post_dto = PostDetailCore.model_validate(post)
+                    if use_detail_cache:
+                        await self.detail_cache.set(post=post_dto, version=cache_version)
+                    
+                    # 조회수/좋아요 수 키는 없을 때만 적재하고 현재값을 읽음 (단일 왕복)
+                    views_key = post_views_key(post_id)
+                    likes_key = post_likes_key(post_id)
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        pipe.set(views_key, post_dto.views, nx=True)
+                        pipe.set(likes_key, post_dto.likes_count, nx=True)
+                        pipe.mget(views_key, likes_key)
+                        _, _, (cached_views, cached_likes) = await pipe.execute()
 
-                if cached_views is not None:
-                    # uow.session.expunge(post)   # 세션에서 객체 분리, 자동 커밋 방지
                     post_dto.views = int(cached_views)
-                else:                    
-                    await self.redis.set(cache_key, post_dto.views)
+                    post_dto.likes_count = int(cached_likes)
             
             else:                
                 new_views = await uow.posts.increment_views_if_exists(post_id=post_id)
                 if new_views is None:
                     raise PostNotFoundException(post_id=post_id)
                                 
-                post = await uow.posts.get_post_with_user(post_id=post_id)
-                
+                detail = await uow.posts.get_post_detail(**detail_args)
+                if detail is None:
+                    raise PostNotFoundException(post_id=post_id)
+
+                post, comments, version = detail
                 post_dto = PostDetailCore.model_validate(post)
                 post_dto.views = new_views
-            
-            comments = await uow.comments.get_comments(
-                post_id=post_id,
-                limit=comments_limit,
-                offset=comments_offset,
+
+        if use_like_store:
+            version = await self._overlay_like_state(
+                post_id=post_id, user_id=user_id, version=version
             )
-            
-            liked_by_me = False
-            if user_id:
-                liked_by_me = await uow.likes.exists_like(
-                    post_id=post_id,
-                    user_id=user_id,
-                )
+            post_dto.likes_count = version.likes_count
+
+        if cached_comments is None:
+            comments_page = [CommentPublic.model_validate(c) for c in comments]
+            if use_comment_cache:
+                await self.comment_cache.fill(post_id=post_id, comments=comments_page, gen=comments_gen)
+        else:
+            comments_page = cached_comments
 
-            return PostDetail(
-                **PostDetailCore.model_validate(post_dto).model_dump(),
-                comments=[CommentPublic.model_validate(c) for c in comments],
-                liked_by_me=liked_by_me
+        # post_dto는 이미 검증된 모델이므로 재검증 없이 필드만 옮김
+        post_detail = PostDetail.model_construct(
+            **dict(post_dto),
+            comments=comments_page[:comments_limit],
+            comments_count=version.comments_count,
+            liked_by_me=version.liked_by_me
+        )
+        return post_detail, version
+
+    async def read_post_version(
+        self,
+        uow: UnitOfWork,
+        *,
+        post_id: int,
+        user_id: Optional[int] = None,
+        use_like_store: bool = False,
+    ) -> PostVersion:
+        """
+        조건부 요청 확인용 게시글 버전 정보 조회 (상세 조회 없이)
+
+        Raises:
+            PostNotFoundException: 해당 ID의 게시글이 존재하지 않는 경우
+        """
+        async with uow:
+            version = await uow.posts.get_post_version(post_id=post_id, user_id=user_id)
+            if version is None:
+                raise PostNotFoundException(post_id=post_id)
+
+        if use_like_store:
+            version = await self._overlay_like_state(
+                post_id=post_id, user_id=user_id, version=version
             )
+        return version
+
+    async def _overlay_like_state(
+        self,
+        *,
+        post_id: int,
+        user_id: Optional[int],
+        version: PostVersion,
+    ) -> PostVersion:
+        """
+        DB 반영 전인 Redis 좋아요 상태(좋아요 수, liked_by_me)로 덮어쓰기
+        """
+        state = await self.like_store.get_state(post_id=post_id, user_id=user_id)
+        if state is None:
+            return version
+
+        liked_by_me, likes_count = state
+        return version._replace(liked_by_me=liked_by_me, likes_count=likes_count)
     
     async def increment_views_background(
             self,
             *,
-            post_id: int
+            post_id: int,
+            category: PostCategory | None = None
     ) -> None:
         """
-        [Background Task] Redis에 저장된 조회수를 증가시키고, 일정 주기로 DB에 동기화
+        [Background Task] Redis에 저장된 조회수를 증가하고 인기 게시글 점수 가산
+        DB 반영은 스케줄러(sync_post_views_to_db)가 증가분을 모아 일괄 처리
+        """
+        await self.view_counter.increment(post_id=post_id)
+        await self.trending.record(
+            post_id=post_id,
+            weight=settings.TRENDING_VIEW_WEIGHT,
+            category=category,
+        )
+
+    async def read_trending_posts(
+        self,
+        uow: UnitOfWork,
+        *,
+        category: PostCategory | None,
+        limit: int,
+    ) -> list[PostSummary]:
+        """
+        인기 게시글 목록 조회
+        랭킹 상위 id를 단일 IN 쿼리로 조회한 뒤 랭킹 순서대로 정렬
         """
-        cache_key = f"post:views:{post_id}"
-        new_views = await self.redis.incr(cache_key)
-        if new_views % 10 == 0: 
-            async with UnitOfWork(self.session_factory) as uow:
-                await uow.posts.sync_views(post_id=post_id, views=new_views)
+        post_ids = await self.trending.top(category=category, limit=limit)
+        if not post_ids:
+            return []
+
+        async with uow:
+            posts = await uow.posts.get_posts_by_ids(post_ids=post_ids)
+
+        posts_by_id = {post.id: post for post in posts}
+        return [
+            PostSummary.model_validate(posts_by_id[post_id])
+            for post_id in post_ids
+            if post_id in posts_by_id
+        ]
             
     async def read_post_list(
         self,
@@ -99,20 +244,166 @@ class PostService:
         author: str | None,
         offset: int,
         limit: int,
-    ) -> list[PostSummary]:
+        sort: PostSort = PostSort.LATEST,
+        cursor: str | None = None,
+        search_query: str | None = None,
+        author_exact: bool = False,
+        with_flags: bool = False,
+        viewer_id: int | None = None,
+    ) -> tuple[list[PostSummary], str | None]:
         """
-        검색 조건에 맞는 게시글 목록 조회
+        검색 조건에 맞는 게시글 목록과 다음 페이지 커서 조회
+        sort 순서로 정렬하며, cursor가 주어지면 offset은 무시 (커서는 발급된 sort에서만 유효)
+        search_query(전문 검색)가 주어지면 sort 대신 관련도순으로 정렬하며 커서를 반환하지 않음
+        with_flags면 viewer_id 기준 liked_by_me / bookmarked_by_me 포함 (PostSummaryWithFlags)
+
+        Raises:
+            InvalidCursorException: 커서 형식이 올바르지 않거나, 전문 검색과 함께 사용된 경우
         """
+        if search_query and cursor:
+            raise InvalidCursorException(
+                cursor=cursor,
+                message="Cursor pagination is not supported with full-text search."
+            )
+
+        decoded_cursor = self._decode_list_cursor(cursor, sort=sort) if cursor else None
+
         async with uow:
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
             posts = await uow.posts.get_posts_list(
                 category=category,
                 search_title=search_title,
                 search_content=search_content,
                 author=author,
                 offset=offset,
-                limit=limit,
+                limit=limit + 1,
+                sort=sort,
+                cursor=decoded_cursor,
+                search_query=search_query,
+                author_exact=author_exact,
             )
-            return [PostSummary.model_validate(post) for post in posts]
+
+            next_cursor = None
+            if len(posts) > limit:
+                posts = posts[:limit]
+                if not search_query:
+                    sort_column, _ = POST_SORT_KEYS[sort]
+                    last = posts[-1]
+                    next_cursor = encode_cursor(sort.value, getattr(last, sort_column.key), last.id)
+
+            summaries = [PostSummary.model_validate(post) for post in posts]
+            if with_flags:
+                summaries = await self._attach_viewer_flags(
+                    uow, posts=summaries, viewer_id=viewer_id
+                )
+
+        return summaries, next_cursor
+
+    async def read_post_list_versions(
+        self,
+        uow: UnitOfWork,
+        *,
+        category: PostCategory | None,
+        search_title: str | None,
+        search_content: str | None,
+        author: str | None,
+        offset: int,
+        limit: int,
+        sort: PostSort = PostSort.LATEST,
+        cursor: str | None = None,
+        search_query: str | None = None,
+        author_exact: bool = False,
+        with_flags: bool = False,
+        viewer_id: int | None = None,
+    ) -> tuple[list[PostListVersion], bool]:
+        """
+        조건부 요청 확인용 목록 버전 정보와 다음 페이지 커서 발급 여부 조회 (목록 조회 없이)
+        read_post_list와 같은 조건으로 같은 행을 고름 (전문 검색은 커서를 발급하지 않음)
+
+        Raises:
+            InvalidCursorException: 커서 형식이 올바르지 않거나, 전문 검색과 함께 사용된 경우
+        """
+        if search_query and cursor:
+            raise InvalidCursorException(
+                cursor=cursor,
+                message="Cursor pagination is not supported with full-text search."
+            )
+
+        decoded_cursor = self._decode_list_cursor(cursor, sort=sort) if cursor else None
+
+        async with uow:
+            versions = await uow.posts.get_posts_list_versions(
+                category=category,
+                search_title=search_title,
+                search_content=search_content,
+                author=author,
+                offset=offset,
+                limit=limit + 1,
+                sort=sort,
+                cursor=decoded_cursor,
+                search_query=search_query,
+                author_exact=author_exact,
+            )
+            has_next_cursor = len(versions) > limit and not search_query
+            versions = versions[:limit]
+
+            if with_flags and viewer_id is not None:
+                post_ids = [version.id for version in versions]
+                liked_ids = await uow.likes.get_liked_post_ids(user_id=viewer_id, post_ids=post_ids)
+                bookmarked_ids = await uow.bookmarks.get_bookmarked_post_ids(user_id=viewer_id, post_ids=post_ids)
+                versions = [
+                    version._replace(
+                        liked_by_me=version.id in liked_ids,
+                        bookmarked_by_me=version.id in bookmarked_ids,
+                    )
+                    for version in versions
+                ]
+
+        return versions, has_next_cursor
+
+    @staticmethod
+    def _decode_list_cursor(cursor: str, *, sort: PostSort) -> tuple[Any, int]:
+        """
+        목록 커서를 sort 정렬 컬럼 타입에 맞는 (값, id)로 디코딩
+
+        Raises:
+            InvalidCursorException: 커서 형식이 올바르지 않거나 다른 sort로 발급된 경우
+        """
+        value, row_id = decode_sort_cursor(cursor, sort=sort.value)
+        try:
+            if sort in (PostSort.LATEST, PostSort.OLDEST):
+                return datetime.fromisoformat(value), row_id
+            if isinstance(value, int):
+                return value, row_id
+        except (TypeError, ValueError):
+            pass
+        raise InvalidCursorException(cursor=cursor)
+
+    async def _attach_viewer_flags(
+        self,
+        uow: UnitOfWork,
+        *,
+        posts: list[PostSummary],
+        viewer_id: int | None,
+    ) -> list[PostSummaryWithFlags]:
+        """
+        목록 전체의 liked_by_me / bookmarked_by_me를 테이블별 쿼리 1회로 조회
+        """
+        liked_ids: set[int] = set()
+        bookmarked_ids: set[int] = set()
+        if viewer_id is not None:
+            post_ids = [post.id for post in posts]
+            liked_ids = await uow.likes.get_liked_post_ids(user_id=viewer_id, post_ids=post_ids)
+            bookmarked_ids = await uow.bookmarks.get_bookmarked_post_ids(user_id=viewer_id, post_ids=post_ids)
+
+        return [
+            PostSummaryWithFlags.model_construct(
+                **dict(post),
+                liked_by_me=post.id in liked_ids,
+                bookmarked_by_me=post.id in bookmarked_ids,
+            )
+            for post in posts
+        ]
     
     
     async def create_post(
@@ -132,6 +423,10 @@ class PostService:
                 content=data.content,
                 category=data.category
             )
+            await uow.post_ngrams.refresh(
+                post_id=post.id,
+                fields=[PostSearchField.TITLE, PostSearchField.CONTENT]
+            )
             return PostSummary.model_validate(post)
 
     
@@ -142,42 +437,93 @@ class PostService:
         post_id: int,
         user_id: int,
         use_counter_cache: bool = True,
+        use_like_store: bool = False,
     ) -> tuple[bool, int]:
         """
         게시글에 좋아요를 누르거나 취소 (Toggle)
+        use_like_store인 경우 Redis에서 토글하고 DB 반영은 스케줄러(flush_like_ops_to_db)가 일괄 처리
 
         Raises:
             PostNotFoundException: 해당 게시글이 존재하지 않는 경우
         """
-        async with uow:
-            if not await uow.posts.get_post(post_id=post_id):
-                raise PostNotFoundException(post_id=post_id)
-
-            exists = await uow.likes.exists_like(
-                post_id=post_id,
-                user_id=user_id,
+        if use_like_store:
+            is_liked, count, category = await self._toggle_like_in_store(
+                uow, post_id=post_id, user_id=user_id
             )
+            await self._record_like_trending(post_id=post_id, liked=is_liked, category=category)
+            return is_liked, count
 
-            if exists:                
-                # like -> unlike
-                method = (
-                    uow.likes.unlike_with_counter_cache 
-                    if use_counter_cache 
-                    else uow.likes.unlike_without_counter_cache
-                )
-                is_liked = False
+        async with uow:
+            if use_counter_cache:
+                # 존재 확인 + 삽입/삭제 + likes_count ±1을 단일 구문으로 처리
+                result = await uow.likes.toggle_like(post_id=post_id, user_id=user_id)
+                if result.status == RepoStatus.NOT_FOUND:
+                    raise PostNotFoundException(post_id=post_id)
+                is_liked, count, category = result.data
             else:
-                # unlike -> like
-                method = (
-                    uow.likes.like_with_counter_cache 
-                    if use_counter_cache 
-                    else uow.likes.like_without_counter_cache
+                post = await uow.posts.get_post(post_id=post_id)
+                if not post:
+                    raise PostNotFoundException(post_id=post_id)
+                category = post.category
+
+                exists = await uow.likes.exists_like(
+                    post_id=post_id,
+                    user_id=user_id,
                 )
-                is_liked = True
-                
-            _, count = await method(post_id=post_id, user_id=user_id)
 
-            return is_liked, count
+                if exists:
+                    # like -> unlike
+                    _, count = await uow.likes.unlike_without_counter_cache(
+                        post_id=post_id, user_id=user_id
+                    )
+                    is_liked = False
+                else:
+                    # unlike -> like
+                    _, count = await uow.likes.like_without_counter_cache(
+                        post_id=post_id, user_id=user_id
+                    )
+                    is_liked = True
+
+        # 상세 캐시 본문 대신 조회 시점에 덮어쓰는 좋아요 수
+        await self.redis.set(post_likes_key(post_id), count)
+        await self._record_like_trending(post_id=post_id, liked=is_liked, category=category)
+
+        return is_liked, count
+
+    async def _record_like_trending(
+        self,
+        *,
+        post_id: int,
+        liked: bool,
+        category: PostCategory | None = None,
+    ) -> None:
+        weight = settings.TRENDING_LIKE_WEIGHT
+        await self.trending.record(
+            post_id=post_id,
+            weight=weight if liked else -weight,
+            category=category,
+        )
+
+    async def _toggle_like_in_store(
+        self,
+        uow: UnitOfWork,
+        *,
+        post_id: int,
+        user_id: int,
+    ) -> tuple[bool, int, PostCategory]:
+        result = await self.like_store.toggle(post_id=post_id, user_id=user_id)
+        if result is not None:
+            return result
+
+        # 좋아요 집합이 없는 게시글: DB에서 적재 후 다시 토글
+        async with uow:
+            post = await uow.posts.get_post(post_id=post_id)
+            if not post:
+                raise PostNotFoundException(post_id=post_id)
+            liker_ids = await uow.likes.get_liker_ids(post_id=post_id)
+
+        await self.like_store.load(post_id=post_id, category=post.category, user_ids=liker_ids)
+        return await self.like_store.toggle(post_id=post_id, user_id=user_id)
         
         
     async def soft_delete_post(
@@ -201,6 +547,9 @@ class PostService:
             )
 
         if result.status == RepoStatus.SUCCESS:
+            await self.detail_cache.invalidate(post_id=post_id)
+            await self.like_store.forget(post_id=post_id)
+            await self.trending.remove(post_ids=[post_id])
             return
 
         if result.status in (RepoStatus.NOT_FOUND, RepoStatus.ALREADY_DELETED):
@@ -209,6 +558,27 @@ class PostService:
             raise UserMismatchException()        
         raise InternalServerException()
 
+    async def force_delete_post(
+        self,
+        uow: UnitOfWork,
+        *,
+        post_id: int,
+    ) -> None:
+        """
+        관리자용 게시글 강제 삭제 (Soft Delete)
+
+        Raises:
+            PostNotFoundException: 게시글이 없거나 이미 삭제된 경우
+        """
+        async with uow:
+            if not await uow.posts.get_post(post_id=post_id):
+                raise PostNotFoundException(post_id=post_id)
+
+            await uow.posts.soft_delete_post(post_id=post_id)
+
+        await self.detail_cache.invalidate(post_id=post_id)
+        await self.like_store.forget(post_id=post_id)
+        await self.trending.remove(post_ids=[post_id])
     
     async def update_post_core(
         self,
@@ -235,7 +605,22 @@ class PostService:
                 category=data.category
             )
 
+            if result.status == RepoStatus.SUCCESS:
+                changed_fields = [
+                    field
+                    for field, value in (
+                        (PostSearchField.TITLE, data.title),
+                        (PostSearchField.CONTENT, data.content),
+                    )
+                    if value is not None
+                ]
+                await uow.post_ngrams.refresh(post_id=post_id, fields=changed_fields)
+
         if result.status == RepoStatus.SUCCESS:
+            await self.detail_cache.invalidate(post_id=post_id)
+            if data.category is not None:
+                await self.trending.move(post_id=post_id, category=data.category)
+                await self.like_store.set_category(post_id=post_id, category=data.category)
             return PostDetailCore.model_validate(result.data)
 
         if result.status == RepoStatus.NOT_FOUND:
@@ -251,23 +636,110 @@ class PostService:
         post_id: int,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[CommentPublic]:
+        cursor: str | None = None,
+        use_comment_cache: bool = False,
+    ) -> tuple[list[CommentPublic], str | None]:
+        """
+        특정 게시글에 달린 댓글 목록과 다음 페이지 커서 조회 (삭제된 댓글 제외)
+        cursor가 주어지면 offset은 무시
+        use_comment_cache인 경우 첫 페이지는 Redis 캐시에서 먼저 조회 (적중 시 DB 조회 없음)
+
+        Raises:
+            PostNotFoundException: 게시글이 존재하지 않는 경우
+            InvalidCursorException: 커서 형식이 올바르지 않은 경우
+        """
+        decoded_cursor = decode_datetime_cursor(cursor) if cursor else None
+
+        use_comment_cache = (
+            use_comment_cache
+            and decoded_cursor is None
+            and offset == 0
+            and limit <= self.comment_cache.page_size
+        )
+        cached_comments, comments_gen = None, None
+        if use_comment_cache:
+            cached_comments, comments_gen = await self.comment_cache.get(post_id=post_id)
+
+        if cached_comments is None:
+            async with uow:
+                if not await uow.posts.exists(post_id=post_id):
+                    raise PostNotFoundException(post_id=post_id)
+
+                # 다음 페이지 존재 여부 확인을 위해 1개 더 조회 (캐시를 채울 때는 캐시 용량만큼)
+                rows = await uow.comments.get_comments(
+                    post_id=post_id,
+                    limit=self.comment_cache.capacity if use_comment_cache else limit + 1,
+                    offset=offset,
+                    cursor=decoded_cursor,
+                )
+                comments = [CommentPublic.model_validate(comment) for comment in rows]
+
+            if use_comment_cache:
+                await self.comment_cache.fill(post_id=post_id, comments=comments, gen=comments_gen)
+        else:
+            comments = cached_comments
+
+        next_cursor = None
+        if len(comments) > limit:
+            comments = comments[:limit]
+            next_cursor = encode_cursor(comments[-1].created_at, comments[-1].id)
+
+        return comments, next_cursor
+
+    async def read_comment_tree(
+        self,
+        uow: UnitOfWork,
+        *,
+        post_id: int,
+        limit: int,
+        replies_limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[CommentThread], str | None]:
         """
-        특정 게시글에 달린 댓글 목록 조회
+        루트 댓글 단위 페이징 댓글 트리와 다음 페이지 커서 조회
+        루트마다 앞쪽 replies_limit개의 대댓글과 전체 대댓글 수(reply_count) 포함
+        조회 행 수는 최대 (limit + 1) * (replies_limit + 1)로 제한
 
         Raises:
             PostNotFoundException: 게시글이 존재하지 않는 경우
+            InvalidCursorException: 커서 형식이 올바르지 않은 경우
         """
+        decoded_cursor = decode_datetime_cursor(cursor) if cursor else None
+
         async with uow:
             if not await uow.posts.exists(post_id=post_id):
                 raise PostNotFoundException(post_id=post_id)
 
-            comments = await uow.comments.get_comments(
+            # 다음 페이지 존재 여부 확인을 위해 루트 1개 더 조회
+            rows = await uow.comments.get_comment_tree(
                 post_id=post_id,
-                limit=limit,
-                offset=offset
+                roots_limit=limit + 1,
+                replies_limit=replies_limit,
+                cursor=decoded_cursor,
+            )
+
+        roots = [(comment, reply_count) for comment, reply_count in rows if comment.parent_id is None]
+        replies: dict[int, list[CommentPublic]] = {}
+        for comment, _ in rows:
+            if comment.parent_id is not None:
+                replies.setdefault(comment.parent_id, []).append(CommentPublic.model_validate(comment))
+
+        next_cursor = None
+        if len(roots) > limit:
+            roots = roots[:limit]
+            last = roots[-1][0]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        # 루트는 CommentPublic으로 한 번만 검증하고 필드를 그대로 옮김 (dump 후 재검증 없이)
+        threads = [
+            CommentThread.model_construct(
+                **dict(CommentPublic.model_validate(root)),
+                reply_count=reply_count,
+                replies=replies.get(root.id, []),
             )
-            return [CommentPublic.model_validate(comment) for comment in comments]
+            for root, reply_count in roots
+        ]
+        return threads, next_cursor
 
     async def toggle_bookmark_to_post(
         self,
@@ -275,29 +747,19 @@ class PostService:
         *,
         post_id: int,
         user_id: int,        
-    ) -> None:
+    ) -> bool:
         """
         게시글을 북마크에 추가하거나 제거 (Toggle)
+        존재 확인 + 삽입/삭제를 단일 구문으로 처리하고 최종 북마크 여부 반환
 
         Raises:
             PostNotFoundException: 게시글이 존재하지 않는 경우
         """
         async with uow:
-            if not await uow.posts.exists(post_id=post_id):
-                raise PostNotFoundException(post_id=post_id)
-            
-            exists = await uow.bookmarks.exists(
+            result = await uow.bookmarks.toggle(
                 post_id=post_id,
                 user_id=user_id,
             )
-            
-            if exists:
-                await uow.bookmarks.remove(
-                    post_id=post_id,
-                    user_id=user_id,
-                )
-            else:
-                await uow.bookmarks.regist(
-                    post_id=post_id,
-                    user_id=user_id,
-                )
\ No newline at end of file
+            if result.status == RepoStatus.NOT_FOUND:
+                raise PostNotFoundException(post_id=post_id)
+            return result.data
\ No newline at end of file
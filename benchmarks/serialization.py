@@ -0,0 +1,80 @@
+"""
+게시글 목록(100건) 응답 직렬화 비용 비교
+
+- response_model: FastAPI 기본 경로 (response_model 재검증 + jsonable 변환 + JSONResponse)
+- list_response: 이미 생성된 모델을 TypeAdapter.dump_json으로 바로 직렬화
+
+실행: python -m benchmarks.serialization
+"""
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.responses import list_response
+from app.core.enums import PostCategory, UserRole
+from app.schemas.post import PostSummary
+from app.schemas.user import UserPublic
+
+
+ITEMS = 100
+ROUNDS = 2000
+
+
+def build_posts() -> list[PostSummary]:
+    now = datetime.now(timezone.utc)
+    return [
+        PostSummary(
+            id=i,
+            title=f"게시글 제목 {i}",
+            category=PostCategory.GENERAL,
+            views=i * 10,
+            likes_count=i,
+            comments_count=i % 7,
+            updated_at=now,
+            author=UserPublic(nickname=f"user{i}", role=UserRole.USER),
+        )
+        for i in range(ITEMS)
+    ]
+
+
+def main() -> None:
+    posts = build_posts()
+    field = create_model_field(name="Response", type_=list[PostSummary], mode="serialization")
+
+    async def response_model_path() -> bytes:
+        content = await serialize_response(field=field, response_content=posts)
+        return JSONResponse(content).body
+
+    async def list_response_path() -> bytes:
+        return list_response(posts, item_type=PostSummary).body
+
+    async def measure(fn) -> float:
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                await fn()
+            best = min(best, time.perf_counter() - start)
+        return best / ROUNDS
+
+    async def run() -> None:
+        # 두 경로의 응답 본문이 동일한지 먼저 확인
+        assert json.loads(await response_model_path()) == json.loads(await list_response_path())
+
+        for name, fn in [
+            ("response_model", response_model_path),
+            ("list_response", list_response_path),
+        ]:
+            elapsed = await measure(fn)
+            print(f"{name:>15}: {elapsed * 1_000_000:8.1f} us/request")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""add posts keyset index
+
+Revision ID: 3f1c9a2d8b47
+Revises: 7a835f944b09
+Create Date: 2026-10-17 10:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a2d8b47'
+down_revision: Union[str, Sequence[str], None] = '7a835f944b09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_posts_active_created_at_id',
+            'posts',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_posts_active_created_at_id',
+            table_name='posts',
+            postgresql_concurrently=True,
+        )
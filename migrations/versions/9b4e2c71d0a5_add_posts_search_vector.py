@@ -0,0 +1,93 @@
+"""add posts search vector
+
+Revision ID: 9b4e2c71d0a5
+Revises: 3f1c9a2d8b47
+Create Date: 2026-10-17 11:03:19.772604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e2c71d0a5'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a2d8b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+SEARCH_VECTOR_EXPR = (
+    "setweight(to_tsvector('simple', coalesce({row}.title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}.content, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GENERATED 컬럼은 추가 시 테이블 전체를 재작성하므로, 트리거 관리 컬럼 + 배치 백필로 대체
+    op.add_column('posts', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION posts_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_EXPR.format(row='NEW')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_posts_search_vector
+        BEFORE INSERT OR UPDATE OF title, content ON posts
+        FOR EACH ROW EXECUTE FUNCTION posts_search_vector_update()
+    """)
+
+    # 배치마다 커밋하여 장시간 행 잠금 방지
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        last_id = 0
+        while True:
+            last_id = conn.execute(
+                sa.text(f"""
+                    WITH batch AS (
+                        SELECT id FROM posts
+                        WHERE id > :last_id
+                        ORDER BY id
+                        LIMIT :batch_size
+                    ), updated AS (
+                        UPDATE posts p
+                        SET search_vector = {SEARCH_VECTOR_EXPR.format(row='p')}
+                        FROM batch
+                        WHERE p.id = batch.id
+                        RETURNING p.id
+                    )
+                    SELECT max(id) FROM updated
+                """),
+                {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+            ).scalar()
+            if last_id is None:
+                break
+
+        op.create_index(
+            'ix_posts_search_vector',
+            'posts',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_posts_search_vector',
+            table_name='posts',
+            postgresql_concurrently=True,
+        )
+    op.execute("DROP TRIGGER IF EXISTS trg_posts_search_vector ON posts")
+    op.execute("DROP FUNCTION IF EXISTS posts_search_vector_update()")
+    op.drop_column('posts', 'search_vector')
@@ -0,0 +1,42 @@
+"""add comments keyset index
+
+Revision ID: b9e1f4c07d52
+Revises: a6d3e9f27c15
+Create Date: 2026-10-17 17:58:12.640271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e1f4c07d52'
+down_revision: Union[str, Sequence[str], None] = 'a6d3e9f27c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_active_post_created_at_id',
+            'comments',
+            ['post_id', 'created_at', 'id'],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comments_active_post_created_at_id',
+            table_name='comments',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,34 @@
+"""refresh token digest and family
+
+Revision ID: c3f8a1d6e720
+Revises: b9e1f4c07d52
+Create Date: 2026-10-17 18:44:27.315064
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a1d6e720'
+down_revision: Union[str, Sequence[str], None] = 'b9e1f4c07d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 argon2 해시는 다이제스트로 변환할 수 없으므로 폐기 (사용자는 다시 로그인)
+    op.execute("DELETE FROM refresh_tokens")
+    op.add_column('refresh_tokens', sa.Column('family_id', sa.String(length=32), nullable=False))
+    op.create_index('ix_refresh_tokens_family_id', 'refresh_tokens', ['family_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 다이제스트는 이전 argon2 검증과 호환되지 않으므로 폐기
+    op.execute("DELETE FROM refresh_tokens")
+    op.drop_index('ix_refresh_tokens_family_id', table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'family_id')
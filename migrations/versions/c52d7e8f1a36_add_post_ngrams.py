@@ -0,0 +1,72 @@
+"""add post ngrams
+
+Revision ID: c52d7e8f1a36
+Revises: 9b4e2c71d0a5
+Create Date: 2026-10-17 13:27:52.110947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52d7e8f1a36'
+down_revision: Union[str, Sequence[str], None] = '9b4e2c71d0a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('post_ngrams',
+    sa.Column('field', sa.String(length=10), nullable=False),
+    sa.Column('gram', sa.String(length=2), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('field', 'gram', 'post_id')
+    )
+    op.create_index('ix_post_ngrams_post_id', 'post_ngrams', ['post_id'], unique=False)
+
+    # 게시글 id 구간별로 커밋하며 2-gram 백필
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        last_id = 0
+        while True:
+            last_id = conn.execute(
+                sa.text("""
+                    WITH batch AS (
+                        SELECT id FROM posts
+                        WHERE id > :last_id
+                        ORDER BY id
+                        LIMIT :batch_size
+                    ), inserted AS (
+                        INSERT INTO post_ngrams (post_id, field, gram)
+                        SELECT p.id, f.field, g.gram
+                        FROM posts p
+                        JOIN batch ON batch.id = p.id
+                        CROSS JOIN LATERAL (
+                            VALUES ('title', p.title), ('content', p.content)
+                        ) AS f(field, body)
+                        CROSS JOIN LATERAL (
+                            SELECT DISTINCT substr(tok, i, 2) AS gram
+                            FROM regexp_split_to_table(lower(f.body), '\\s+') AS tok,
+                                 generate_series(1, char_length(tok) - 1) AS i
+                        ) AS g
+                        ON CONFLICT DO NOTHING
+                    )
+                    SELECT max(id) FROM batch
+                """),
+                {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+            ).scalar()
+            if last_id is None:
+                break
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_post_ngrams_post_id', table_name='post_ngrams')
+    op.drop_table('post_ngrams')
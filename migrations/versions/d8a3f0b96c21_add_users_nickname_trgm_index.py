@@ -0,0 +1,53 @@
+"""add users nickname trgm index
+
+Revision ID: d8a3f0b96c21
+Revises: c52d7e8f1a36
+Create Date: 2026-10-17 14:02:36.384519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a3f0b96c21'
+down_revision: Union[str, Sequence[str], None] = 'c52d7e8f1a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        # 모델에는 있으나 초기 마이그레이션에서 누락된 고유 인덱스
+        op.create_index(
+            'ix_users_nickname',
+            'users',
+            ['nickname'],
+            unique=True,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_nickname_trgm',
+            'users',
+            ['nickname'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'nickname': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_nickname_trgm',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
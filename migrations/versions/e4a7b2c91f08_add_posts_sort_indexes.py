@@ -0,0 +1,55 @@
+"""add posts sort indexes
+
+Revision ID: e4a7b2c91f08
+Revises: d8a3f0b96c21
+Create Date: 2026-10-17 16:02:37.418925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7b2c91f08'
+down_revision: Union[str, Sequence[str], None] = 'd8a3f0b96c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스 이름, 선행 컬럼 목록) - 모두 (..., id DESC) WHERE is_deleted = false
+SORT_INDEXES = [
+    ('ix_posts_active_views_id', ['views DESC']),
+    ('ix_posts_active_likes_count_id', ['likes_count DESC']),
+    ('ix_posts_active_category_created_at_id', ['category', 'created_at DESC']),
+    ('ix_posts_active_category_views_id', ['category', 'views DESC']),
+    ('ix_posts_active_category_likes_count_id', ['category', 'likes_count DESC']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for name, columns in SORT_INDEXES:
+            op.create_index(
+                name,
+                'posts',
+                [sa.text(c) for c in columns] + [sa.text('id DESC')],
+                unique=False,
+                postgresql_where=sa.text('is_deleted = false'),
+                postgresql_concurrently=True,
+            )
+        # 부분 복합 인덱스로 대체된 단일 컬럼 인덱스 제거
+        op.drop_index('ix_posts_views', table_name='posts', postgresql_concurrently=True)
+        op.drop_index('ix_posts_likes_count', table_name='posts', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_posts_likes_count', 'posts', ['likes_count'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_posts_views', 'posts', ['views'], unique=False, postgresql_concurrently=True)
+        for name, _ in reversed(SORT_INDEXES):
+            op.drop_index(name, table_name='posts', postgresql_concurrently=True)
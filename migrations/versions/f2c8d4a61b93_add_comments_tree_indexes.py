@@ -0,0 +1,55 @@
+"""add comments tree indexes
+
+Revision ID: f2c8d4a61b93
+Revises: e4a7b2c91f08
+Create Date: 2026-10-17 16:48:05.127364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8d4a61b93'
+down_revision: Union[str, Sequence[str], None] = 'e4a7b2c91f08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_active_roots',
+            'comments',
+            ['post_id', 'created_at', 'id'],
+            unique=False,
+            postgresql_where=sa.text('parent_id IS NULL AND is_deleted = false'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_comments_active_parent_created_at_id',
+            'comments',
+            ['parent_id', 'created_at', 'id'],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comments_active_parent_created_at_id',
+            table_name='comments',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_comments_active_roots',
+            table_name='comments',
+            postgresql_concurrently=True,
+        )
@@ -1,9 +1,16 @@
+import asyncio
+import threading
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
 from httpx import AsyncClient
 from datetime import datetime, timedelta, timezone
 
+from app.api.dependency import auth_in_flight, get_auth_rate_limiter
+from app.cache.keys import auth_rate_email_key
+from app.cache.rate_limiter import AuthRateLimiter
 from app.core import security
+from app.core.executor import BoundedExecutor
+from app.exceptions.types import ServiceBusyException
 from app.models.user import User
 from app.models.refresh_token import RefreshToken
 
@@ -39,23 +46,46 @@ async def test_register_test_user(
 @pytest.mark.asyncio
 async def test_register_duplicate_email_and_nickname(
         async_client: AsyncClient,
-        registered_test_user
+        registered_test_user,
+        async_engine
 ):
+    statements = []
+    def count_statement(*args):
+        statements.append(args[2])
+
     payload={
         "email": registered_test_user["email"],
         "password": test_user_pwd,
         "nickname": "코로네22"
     }
-    response = await async_client.post("/v1/auth/register", json=payload)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        response = await async_client.post("/v1/auth/register", json=payload)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
     assert response.status_code == 409
+    assert response.json()["code"] == "EMAIL_EXISTS"
+    # 중복 검사 SELECT 없이 INSERT 1회
+    assert [s.split()[0] for s in statements if "users" in s] == ["INSERT"]
     
     payload={
-        "email": test_user_email,
+        "email": "nickname-taken@test.com",
         "password": test_user_pwd,
         "nickname": registered_test_user["nickname"]
     }
     response = await async_client.post("/v1/auth/register", json=payload)
-    assert response.status_code == 409    
+    assert response.status_code == 409
+    assert response.json()["code"] == "NICKNAME_EXISTS"
+
+    # 둘 다 중복이면 이메일 우선
+    payload={
+        "email": registered_test_user["email"],
+        "password": test_user_pwd,
+        "nickname": registered_test_user["nickname"]
+    }
+    response = await async_client.post("/v1/auth/register", json=payload)
+    assert response.status_code == 409
+    assert response.json()["code"] == "EMAIL_EXISTS"    
 
 @pytest.mark.asyncio
 async def test_login(
@@ -90,23 +120,25 @@ async def test_login_cleans_up_expired_tokens(
     now = datetime.now(timezone.utc)
 
     # 만료된 토큰
-    expired_token_str = security.create_refresh_token({"sub": str(user.id)})
+    expired_token_str = security.create_refresh_token({"sub": str(user.id), "fid": "expired-device"})
     expired_token_hash = security.hash_refresh_token(expired_token_str)
 
     expired_token = RefreshToken(
         user_id=user.id,
         token=expired_token_hash,
+        family_id="expired-device",
         expires_at=now - timedelta(days=1),
         created_at=now - timedelta(days=7)
     )
 
     # 아직 유효한 토큰
-    valid_token_str = security.create_refresh_token({"sub": str(user.id)})
+    valid_token_str = security.create_refresh_token({"sub": str(user.id), "fid": "other-device"})
     valid_token_hash = security.hash_refresh_token(valid_token_str)
 
     valid_old_token = RefreshToken(
         user_id=user.id,
         token=valid_token_hash,
+        family_id="other-device",
         expires_at=now + timedelta(days=3),
         created_at=now - timedelta(hours=1)
     )
@@ -142,4 +174,74 @@ async def test_login_fail_wrong_password(async_client: AsyncClient):
     }
     response = await async_client.post("/v1/auth/login", json=payload)
 
-    assert response.status_code == 401
\ No newline at end of file
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_queue_full():
+    """
+    전용 풀의 대기 작업이 상한에 도달하면 큐에 쌓지 않고 즉시 거절
+    """
+    release = threading.Event()
+    pool = BoundedExecutor(max_workers=1, max_pending=1, name="test-hash")
+    try:
+        running = asyncio.create_task(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ServiceBusyException):
+            await pool.run(security.hash_password, "password")
+
+        release.set()
+        assert await running is True
+        assert pool.pending == 0
+    finally:
+        release.set()
+        pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_auth_admission_control(
+        async_client: AsyncClient,
+        app_instance,
+        test_redis_client,
+        registered_test_user,
+        monkeypatch
+):
+    """
+    이메일별 상한 초과 시 해시 검증 없이 429, 동시 처리 상한 도달 시 503
+    """
+    await test_redis_client.delete(auth_rate_email_key(registered_test_user["email"]))
+    default_override = app_instance.dependency_overrides[get_auth_rate_limiter]
+    app_instance.dependency_overrides[get_auth_rate_limiter] = lambda: AuthRateLimiter(
+        test_redis_client, window_seconds=60, per_ip=100, per_email=2
+    )
+
+    verified = 0
+    verify_password_async = security.verify_password_async
+
+    async def counting_verify(*args):
+        nonlocal verified
+        verified += 1
+        return await verify_password_async(*args)
+
+    monkeypatch.setattr(security, "verify_password_async", counting_verify)
+    try:
+        payload = {"email": registered_test_user["email"], "password": "wrongpassword"}
+        statuses = [
+            (await async_client.post("/v1/auth/login", json=payload)).status_code
+            for _ in range(3)
+        ]
+        assert statuses == [401, 401, 429]
+
+        response = await async_client.post("/v1/auth/login/form", data={
+            "username": payload["email"], "password": payload["password"]
+        })
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert verified == 2, "초과 요청은 비밀번호 검증 전에 거절"
+    finally:
+        app_instance.dependency_overrides[get_auth_rate_limiter] = default_override
+
+    # 동시 처리 상한
+    monkeypatch.setattr(auth_in_flight, "in_flight", auth_in_flight.max_in_flight)
+    response = await async_client.post("/v1/auth/refresh", json={"refresh_token": "x"})
+    assert response.status_code == 503
+    assert response.json()["code"] == "SERVICE_BUSY"
@@ -1,12 +1,17 @@
 import asyncio
-from sqlalchemy import select
+from sqlalchemy import event, select
 from httpx import AsyncClient
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import pytest
 
+from app.cache.keys import user_key
+from app.cache.user_cache import local_user_cache
 from app.core import security
+from app.core.security import token_claims_cache
+from app.exceptions.types import InvalidTokenException
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
+from app.schemas.user import UserResponse
 
 
 @pytest.mark.asyncio
@@ -39,13 +44,16 @@ async def test_refresh(
     user_result = await db_session.execute(user_query)
     user = user_result.scalar_one()
     
-    token_query = select(RefreshToken).where(RefreshToken.user_id == user.id)
+    # 다이제스트 고유 인덱스로 조회
+    token_query = select(RefreshToken).where(
+        RefreshToken.token == security.hash_refresh_token(new_refresh_token)
+    )
     token_result = await db_session.execute(token_query)
     stored_token_obj = token_result.scalar_one_or_none()
     
-    assert stored_token_obj is not None, "DB에 refresh_token 누락"
-    is_valid = security.verify_password(new_refresh_token, stored_token_obj.token)
-    assert is_valid is True, "새로 발급받은 토큰과 DB에 저장된 해시값 일치x"
+    assert stored_token_obj is not None, "새로 발급받은 토큰의 다이제스트가 DB에 없음"
+    assert stored_token_obj.user_id == user.id
+    assert stored_token_obj.family_id == security.decode_token(refresh_token).fid, "같은 family로 교체되지 않음"
         
     assert stored_token_obj.expires_at > datetime.now(timezone.utc), "db에 저장된 토큰 만료 상태"
 
@@ -66,4 +74,104 @@ async def test_logout(
 
     # 로그아웃 후 해당 refresh_token으로 갱신 시도 -> 실패
     refresh_response = await authorized_client.post("/v1/auth/refresh", json=payload)
-    assert refresh_response.status_code in [401, 403, 404], "실패 기대"
\ No newline at end of file
+    assert refresh_response.status_code in [401, 403, 404], "실패 기대"
+
+@pytest.mark.asyncio
+async def test_refresh_token_families_and_reuse_detection(
+        async_client: AsyncClient,
+        registered_test_user
+):
+    """
+    기기(family)별 토큰 교체 + 교체된 토큰 재사용 시 해당 family만 폐기
+    """
+    login_payload = {
+        "email": registered_test_user["email"],
+        "password": registered_test_user["password"],
+    }
+    device_a = (await async_client.post("/v1/auth/login", json=login_payload)).json()["refresh_token"]
+    device_b = (await async_client.post("/v1/auth/login", json=login_payload)).json()["refresh_token"]
+
+    response = await async_client.post("/v1/auth/refresh", json={"refresh_token": device_a})
+    assert response.status_code == 200
+    rotated_a = response.json()["refresh_token"]
+
+    # 이미 교체된 토큰 재사용 -> 거부 + 기기 A family 폐기
+    response = await async_client.post("/v1/auth/refresh", json={"refresh_token": device_a})
+    assert response.status_code == 401
+    response = await async_client.post("/v1/auth/refresh", json={"refresh_token": rotated_a})
+    assert response.status_code == 401
+
+    # 기기 B는 영향 없음
+    response = await async_client.post("/v1/auth/refresh", json={"refresh_token": device_b})
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_authenticated_user_cache(
+        authorized_client: AsyncClient,
+        async_engine,
+        test_redis_client,
+        test_user_payload
+):
+    me = security.decode_token(authorized_client.headers["Authorization"].split(" ")[1])
+    user_id = int(me.sub)
+    local_user_cache.delete(user_id)
+    await test_redis_client.delete(user_key(user_id))
+
+    statements: list[str] = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+    async def user_lookups() -> int:
+        statements.clear()
+        event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+        try:
+            response = await authorized_client.get("/v1/users/me/bookmarks")
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+        assert response.status_code == 200
+        return sum("FROM users" in s for s in statements)
+
+    # 미스: DB 조회 후 프로세스 내 + Redis에 적재
+    assert await user_lookups() == 1
+    cached = await test_redis_client.get(user_key(user_id))
+    assert UserResponse.model_validate_json(cached).email == test_user_payload["email"]
+
+    # 히트: 사용자 조회 쿼리 없음
+    assert await user_lookups() == 0
+
+    # 프로세스 내 캐시가 비어도 Redis에서 복원
+    local_user_cache.delete(user_id)
+    assert await user_lookups() == 0
+
+    # 두 단계가 모두 비면 다시 DB 조회
+    local_user_cache.delete(user_id)
+    await test_redis_client.delete(user_key(user_id))
+    assert await user_lookups() == 1
+
+@pytest.mark.asyncio
+async def test_token_claims_cache(authorized_client: AsyncClient):
+    token_claims_cache.clear()
+    hits, misses = token_claims_cache.hits, token_claims_cache.misses
+
+    token = security.create_access_token({"sub": "42"})
+    assert security.extract_user_id_from_token(token) == 42
+    assert security.extract_user_id_from_token(token) == 42
+    assert (token_claims_cache.hits - hits, token_claims_cache.misses - misses) == (1, 1)
+    assert token_claims_cache.stats()["size"] == 1
+
+    # 검증 실패 토큰은 캐시하지 않음
+    with pytest.raises(InvalidTokenException):
+        security.extract_user_id_from_token(token[:-2] + "xx")
+    assert token_claims_cache.stats()["size"] == 1
+
+    # exp 이후에는 캐시 히트 없이 만료 처리
+    short_token = security.create_access_token({"sub": "42"}, expires_delta=timedelta(seconds=1))
+    assert security.extract_user_id_from_token(short_token) == 42
+    await asyncio.sleep(2.5)
+    with pytest.raises(InvalidTokenException):
+        security.extract_user_id_from_token(short_token)
+
+    # 통계 엔드포인트는 관리자 전용
+    response = await authorized_client.get("/v1/auth/admin/token-cache")
+    assert response.status_code == 403
@@ -1,8 +1,17 @@
+from datetime import datetime, timezone
+
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import select, update
 
+from app.cache.comment_page import CommentPageCache
+from app.cache.keys import post_comments_page_key
+from app.core.enums import UserRole
 from app.models.comment import Comment
+from app.models.post import Post
+from app.repositories.post import PostRepository
+from app.schemas.comment import CommentPublic
+from app.schemas.user import UserPublic
 
 
 @pytest.mark.asyncio
@@ -102,4 +111,238 @@ async def test_reply_depth_limit(authorized_client: AsyncClient, test_post_id):
     }
     response = await authorized_client.post("/v1/comments/", json=payload)
 
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_read_comment_tree(authorized_client: AsyncClient, test_post_id):
+    """
+    루트 댓글 단위 페이징 + 루트별 대댓글 미리보기/개수 + 대댓글 커서 조회 테스트
+    """
+    root_ids = []
+    for i in range(3):
+        response = await authorized_client.post("/v1/comments/", json={
+            "post_id": test_post_id, "parent_id": None, "content": f"댓글 {i}"
+        })
+        root_ids.append(response.json()["id"])
+
+    reply_ids = []
+    for i in range(5):
+        response = await authorized_client.post("/v1/comments/", json={
+            "post_id": test_post_id, "parent_id": root_ids[0], "content": f"대댓글 {i}"
+        })
+        reply_ids.append(response.json()["id"])
+
+    # 삭제된 대댓글은 제외
+    await authorized_client.delete(f"/v1/comments/{reply_ids[1]}")
+    live_reply_ids = [reply_ids[0]] + reply_ids[2:]
+
+    response = await authorized_client.get(
+        f"/v1/posts/{test_post_id}/comments/tree?limit=2&replies_limit=2"
+    )
+    assert response.status_code == 200
+    threads = response.json()
+    assert [t["id"] for t in threads] == root_ids[:2]
+    assert threads[0]["reply_count"] == 4
+    assert [r["id"] for r in threads[0]["replies"]] == live_reply_ids[:2]
+    assert threads[1]["reply_count"] == 0
+    assert threads[1]["replies"] == []
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = await authorized_client.get(
+        f"/v1/posts/{test_post_id}/comments/tree?limit=2&cursor={cursor}"
+    )
+    assert [t["id"] for t in response.json()] == root_ids[2:]
+    assert "X-Next-Cursor" not in response.headers
+
+    # 나머지 대댓글은 대댓글 커서 API로 조회
+    response = await authorized_client.get(f"/v1/comments/{root_ids[0]}/replies?limit=3")
+    assert response.status_code == 200
+    page_1 = [r["id"] for r in response.json()]
+    cursor = response.headers["X-Next-Cursor"]
+    response = await authorized_client.get(f"/v1/comments/{root_ids[0]}/replies?limit=3&cursor={cursor}")
+    assert page_1 + [r["id"] for r in response.json()] == live_reply_ids
+    assert "X-Next-Cursor" not in response.headers
+
+    response = await authorized_client.get("/v1/comments/999999/replies")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_comment_tree_uses_partial_indexes(
+        authorized_client: AsyncClient,
+        test_post_id,
+        explain_queries
+):
+    """
+    루트 페이징은 ix_comments_active_roots, 대댓글 조회는 ix_comments_active_parent_created_at_id 사용
+    """
+    response = await authorized_client.post("/v1/comments/", json={
+        "post_id": test_post_id, "parent_id": None, "content": "루트"
+    })
+    root_id = response.json()["id"]
+    for i in range(3):
+        await authorized_client.post("/v1/comments/", json={
+            "post_id": test_post_id, "parent_id": root_id, "content": f"대댓글 {i}"
+        })
+
+    async def read_tree():
+        response = await authorized_client.get(f"/v1/posts/{test_post_id}/comments/tree")
+        assert response.status_code == 200
+
+    async def read_replies():
+        response = await authorized_client.get(f"/v1/comments/{root_id}/replies")
+        assert response.status_code == 200
+
+    tree_plans = await explain_queries(read_tree, match="FROM comments")
+    assert any("ix_comments_active_roots" in plan for plan in tree_plans), tree_plans
+    assert any("ix_comments_active_parent_created_at_id" in plan for plan in tree_plans), tree_plans
+
+    reply_plans = await explain_queries(read_replies, match="parent_id")
+    assert any("ix_comments_active_parent_created_at_id" in plan for plan in reply_plans), reply_plans
+
+
+@pytest.mark.asyncio
+async def test_comments_count_counter_cache(authorized_client: AsyncClient, test_post_id, db_session):
+    """
+    댓글 작성/삭제 시 posts.comments_count 유지 + 주기 점검 보정 테스트
+    """
+    comment_ids = []
+    for i in range(2):
+        response = await authorized_client.post("/v1/comments/", json={
+            "post_id": test_post_id, "parent_id": None, "content": f"댓글 {i}"
+        })
+        comment_ids.append(response.json()["id"])
+
+    response = await authorized_client.delete(f"/v1/comments/{comment_ids[0]}")
+    assert response.status_code == 204
+    # 이미 삭제된 댓글은 다시 감소시키지 않음
+    response = await authorized_client.delete(f"/v1/comments/{comment_ids[0]}")
+    assert response.status_code == 404
+
+    response = await authorized_client.get("/v1/posts/?limit=100")
+    post = next(p for p in response.json() if p["id"] == test_post_id)
+    assert post["comments_count"] == 1
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert response.json()["comments_count"] == 1
+
+    # 어긋난 카운터는 점검에서 보정되며, 정상 게시글은 건드리지 않음
+    await db_session.execute(
+        update(Post).where(Post.id == test_post_id).values(comments_count=10, updated_at=Post.updated_at)
+    )
+    await db_session.commit()
+
+    repo = PostRepository(db_session)
+    fixed, next_id = await repo.reconcile_comments_count(after_id=test_post_id - 1, limit=1)
+    assert (fixed, next_id) == (1, test_post_id)
+    assert await repo.reconcile_comments_count(after_id=test_post_id - 1, limit=1) == (0, test_post_id)
+    await db_session.commit()
+
+    comments_count = await db_session.scalar(select(Post.comments_count).where(Post.id == test_post_id))
+    assert comments_count == 1
+
+
+@pytest.mark.asyncio
+async def test_read_comments_cursor_pagination(authorized_client: AsyncClient, test_post_id):
+    """
+    댓글 목록 커서 페이징 테스트 (삭제된 댓글 제외)
+    """
+    comment_ids = []
+    for i in range(22):
+        response = await authorized_client.post("/v1/comments/", json={
+            "post_id": test_post_id, "parent_id": None, "content": f"댓글 {i}"
+        })
+        comment_ids.append(response.json()["id"])
+
+    await authorized_client.delete(f"/v1/comments/{comment_ids[3]}")
+    live_ids = comment_ids[:3] + comment_ids[4:]
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}/comments?limit=20")
+    assert response.status_code == 200
+    page_1 = [c["id"] for c in response.json()]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}/comments?limit=20&cursor={cursor}")
+    assert response.status_code == 200
+    assert page_1 + [c["id"] for c in response.json()] == live_ids
+    assert "X-Next-Cursor" not in response.headers
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}/comments?cursor=invalid")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_comment_page_cache(authorized_client: AsyncClient, test_post_id, test_redis_client, db_session):
+    """
+    댓글 첫 페이지 캐시: 작성 시 추가, 수정 시 교체, 삭제 시 제거
+    """
+    comment_ids = []
+    for i in range(2):
+        response = await authorized_client.post("/v1/comments/", json={
+            "post_id": test_post_id, "parent_id": None, "content": f"댓글 {i}"
+        })
+        comment_ids.append(response.json()["id"])
+
+    # 첫 조회에서 캐시 적재
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}/comments")
+    assert [c["id"] for c in response.json()] == comment_ids
+    assert await test_redis_client.exists(post_comments_page_key(test_post_id))
+
+    response = await authorized_client.post("/v1/comments/", json={
+        "post_id": test_post_id, "parent_id": None, "content": "댓글 2"
+    })
+    comment_ids.append(response.json()["id"])
+    await authorized_client.patch(f"/v1/comments/{comment_ids[0]}", json={"content": "수정된 댓글"})
+    await authorized_client.delete(f"/v1/comments/{comment_ids[1]}")
+
+    # DB를 직접 바꿔도 응답이 그대로면 캐시에서 읽은 것
+    await db_session.execute(update(Comment).where(Comment.id == comment_ids[2]).values(content="DB only"))
+    await db_session.commit()
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}/comments")
+    comments = response.json()
+    assert [c["id"] for c in comments] == [comment_ids[0], comment_ids[2]]
+    assert [c["content"] for c in comments] == ["수정된 댓글", "댓글 2"]
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert [c["content"] for c in response.json()["comments"]] == ["수정된 댓글", "댓글 2"]
+
+
+@pytest.mark.asyncio
+async def test_comment_page_cache_skips_stale_fill(test_redis_client):
+    """
+    조회(miss) 이후 댓글이 바뀌었으면 DB에서 읽은 목록을 저장하지 않음
+    """
+    cache = CommentPageCache(test_redis_client, ttl_seconds=60, page_size=10)
+    post_id = 987654
+
+    cached, gen = await cache.get(post_id=post_id)
+    assert cached is None
+
+    await cache.remove(post_id=post_id, comment_id=1)
+    await cache.fill(post_id=post_id, comments=[], gen=gen)
+    assert (await cache.get(post_id=post_id))[0] is None
+
+    _, gen = await cache.get(post_id=post_id)
+    await cache.fill(post_id=post_id, comments=[], gen=gen)
+    assert (await cache.get(post_id=post_id))[0] == []
+
+@pytest.mark.asyncio
+async def test_comment_page_cache_append_is_idempotent(test_redis_client):
+    """
+    작성 커밋 이후의 조회가 새 댓글을 포함해 채웠으면 append가 중복 추가하지 않음
+    """
+    cache = CommentPageCache(test_redis_client, ttl_seconds=60, page_size=10)
+    post_id = 987655
+    now = datetime.now(timezone.utc)
+    comment = CommentPublic(
+        id=1, post_id=post_id, user_id=1, parent_id=None, content="새 댓글",
+        created_at=now, updated_at=now, user=UserPublic(nickname="writer", role=UserRole.USER),
+    )
+
+    _, gen = await cache.get(post_id=post_id)
+    await cache.fill(post_id=post_id, comments=[comment], gen=gen)
+    await cache.append(comment=comment)
+
+    cached, _ = await cache.get(post_id=post_id)
+    assert [c.id for c in cached] == [comment.id]
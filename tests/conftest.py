@@ -6,13 +6,22 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
-from sqlalchemy import text
+from sqlalchemy import event, text
 from fakeredis import aioredis
 
 from app.core.enums import PostCategory
 from app.db.base import Base
-from app.api.dependency import get_post_service, get_uow
+from app.api.dependency import (
+    get_auth_rate_limiter,
+    get_auth_service,
+    get_comment_service,
+    get_post_service,
+    get_uow,
+)
+from app.cache.rate_limiter import AuthRateLimiter
 from app.core.uow import UnitOfWork
+from app.services.auth_service import AuthService
+from app.services.comment_service import CommentService
 from app.services.post_service import PostService
 
 
@@ -87,8 +96,21 @@ async def override_dependencies(session_factory, app_instance, test_redis_client
             redis_client=test_redis_client
         )
 
+    def override_get_comment_service():
+        return CommentService(redis_client=test_redis_client)
+
+    def override_get_auth_service():
+        return AuthService(redis_client=test_redis_client)
+
+    def override_get_auth_rate_limiter():
+        # 테스트 전체가 같은 IP/계정으로 로그인하므로 상한을 넉넉히
+        return AuthRateLimiter(test_redis_client, window_seconds=60, per_ip=10_000, per_email=10_000)
+
     app_instance.dependency_overrides[get_uow] = override_get_uow
     app_instance.dependency_overrides[get_post_service] = override_get_post_service
+    app_instance.dependency_overrides[get_comment_service] = override_get_comment_service
+    app_instance.dependency_overrides[get_auth_service] = override_get_auth_service
+    app_instance.dependency_overrides[get_auth_rate_limiter] = override_get_auth_rate_limiter
 
     yield
     app_instance.dependency_overrides.clear()
@@ -111,6 +133,38 @@ async def db_session(session_factory):
         yield session
 
 
+@pytest.fixture
+def explain_queries(async_engine):
+    """
+    run() 실행 중 match를 포함한 SQL을 수집해 실행 계획(EXPLAIN) 반환
+    테스트 데이터가 적어 순차 스캔이 선택되지 않도록 enable_seqscan = off로 확인 (인덱스 사용 가능 여부 검증용)
+    """
+    async def explain(run, *, match: str) -> list[str]:
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if match in statement:
+                captured.append((statement, parameters))
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            await run()
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", capture)
+
+        plans = []
+        async with async_engine.connect() as conn:
+            # 통계 갱신 시점(autovacuum)에 따라 계획이 흔들리지 않도록
+            await conn.exec_driver_sql("ANALYZE")
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+            for statement, parameters in captured:
+                rows = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                plans.append("\n".join(row[0] for row in rows))
+        return plans
+
+    return explain
+
+
 # ================================================================
 # Test Data Fixtures (User, Auth, Posts)
 # ================================================================
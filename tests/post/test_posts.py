@@ -1,10 +1,28 @@
 import asyncio
 import pytest
 from httpx import AsyncClient, Response
-from sqlalchemy import select
-
+from sqlalchemy import event, func, select, update
+
+from app.cache.keys import (
+    POST_LIKES_DIRTY_KEY,
+    POST_VIEWS_DIRTY_KEY,
+    TRENDING_CATEGORIES_KEY,
+    post_detail_key,
+    post_likes_pending_key,
+    post_views_delta_key,
+    trending_key,
+)
+from app.cache.like_store import LikeStore
+from app.cache.trending import TrendingBoard
+from app.cache.view_counter import ViewCounter
+from app.core import scheduler
 from app.core.enums import PostCategory
+from app.core.settings import settings
+from app.models.like import Like
 from app.models.post import Post
+from app.models.user import User
+from app.repositories.like import LikeRepository
+from app.repositories.post import PostRepository
 
 
 @pytest.mark.asyncio
@@ -68,7 +86,8 @@ async def test_read_post_and_views(
     
 @pytest.mark.asyncio
 async def test_like_unlike_flow(
-        authorized_client: AsyncClient
+        authorized_client: AsyncClient,
+        db_session
 ):
     payload = {
         "title": "좋아요 테스트",
@@ -79,6 +98,7 @@ async def test_like_unlike_flow(
     assert response.status_code == 201
     
     post_id = response.json()["id"]
+    updated_at = await db_session.scalar(select(Post.updated_at).where(Post.id == post_id))
 
     # 좋아요
     like = await authorized_client.put(f"/v1/posts/{post_id}/like")
@@ -95,6 +115,9 @@ async def test_like_unlike_flow(
     unlike_data = unlike.json()
     assert "liked" in unlike_data and unlike_data["liked"] is False
     assert "likes_count" in unlike_data and unlike_data["likes_count"] <= 0
+
+    # 좋아요 수 변경은 수정 시각을 바꾸지 않음
+    assert await db_session.scalar(select(Post.updated_at).where(Post.id == post_id)) == updated_at
     
     # 재조회 후 좋아요 수 확인
     post = await authorized_client.get(f"/v1/posts/{post_id}")
@@ -248,4 +271,738 @@ async def test_read_posts_list_search_and_filter(
     # 작성자 검색
     response_author = await authorized_client.get("/v1/posts/?author=코로네")
     assert response_author.status_code == 200
-    assert len(response_author.json()) == 15
\ No newline at end of file
+    assert len(response_author.json()) == 15
+
+@pytest.mark.asyncio
+async def test_read_post_detail_cache_invalidation(
+        authorized_client: AsyncClient,
+        test_post_id,
+        test_redis_client
+):
+    # 최초 조회로 상세 캐시 적재
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert response.status_code == 200
+    assert await test_redis_client.exists(post_detail_key(test_post_id, 0))
+
+    # 수정 후 재조회 -> 캐시 무효화 확인
+    payload = {"title": "캐시 무효화", "content": "수정 후"}
+    response = await authorized_client.patch(f"/v1/posts/{test_post_id}", json=payload)
+    assert response.status_code == 200
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert response.status_code == 200
+    assert response.json()["title"] == payload["title"]
+
+    # 좋아요 수는 캐시 본문이 아닌 카운터로 반영
+    like = await authorized_client.put(f"/v1/posts/{test_post_id}/like")
+    assert like.status_code == 200
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert response.json()["likes_count"] == like.json()["likes_count"]
+
+    # 삭제 후 재조회 -> 404
+    response = await authorized_client.delete(f"/v1/posts/{test_post_id}")
+    assert response.status_code == 204
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_read_post_detail_cache_hit(
+        authorized_client: AsyncClient,
+        test_post_id,
+        test_redis_client,
+        db_session
+):
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert response.status_code == 200
+    title = response.json()["title"]
+
+    # 본문은 캐시 세대(정수) 키에만 적재
+    keys = [key async for key in test_redis_client.scan_iter(match=f"post:detail:{test_post_id}:*")]
+    assert keys == [post_detail_key(test_post_id, 0)]
+
+    # 무효화 없이 DB만 바뀌면 재조회는 캐시 본문을 사용
+    await db_session.execute(update(Post).where(Post.id == test_post_id).values(title="캐시 밖 변경"))
+    await db_session.commit()
+
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert response.status_code == 200
+    assert response.json()["title"] == title
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_cursor_pagination(
+        authorized_client: AsyncClient,
+        create_dummy_posts,
+):
+    """
+    커서 기반 페이징 테스트
+    총 게시글: 15개
+    """
+    response_page_1 = await authorized_client.get("/v1/posts/?limit=10")
+    assert response_page_1.status_code == 200
+    assert len(response_page_1.json()) == 10
+
+    next_cursor = response_page_1.headers.get("X-Next-Cursor")
+    assert next_cursor is not None
+
+    response_page_2 = await authorized_client.get(f"/v1/posts/?limit=10&cursor={next_cursor}")
+    assert response_page_2.status_code == 200
+
+    data_page_2 = response_page_2.json()
+    assert len(data_page_2) == 5
+    assert "X-Next-Cursor" not in response_page_2.headers
+
+    # 페이지 간 중복 없음
+    ids_page_1 = {item["id"] for item in response_page_1.json()}
+    assert ids_page_1.isdisjoint({item["id"] for item in data_page_2})
+
+    # 잘못된 커서 -> 400
+    response_invalid = await authorized_client.get("/v1/posts/?cursor=invalid")
+    assert response_invalid.status_code == 400
+
+    # offset 상한 초과 -> 422
+    response_deep = await authorized_client.get("/v1/posts/?offset=100000")
+    assert response_deep.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_keyset_uses_partial_index(
+        authorized_client: AsyncClient,
+        create_dummy_posts,
+        explain_queries,
+):
+    """
+    is_deleted 조건이 부분 인덱스 술어(is_deleted = false)와 일치해야 Keyset 인덱스를 사용
+    """
+    response = await authorized_client.get("/v1/posts/?limit=5")
+    cursor = response.headers["X-Next-Cursor"]
+
+    async def run():
+        for url in ("/v1/posts/?limit=5", f"/v1/posts/?limit=5&cursor={cursor}"):
+            assert (await authorized_client.get(url)).status_code == 200
+
+    plans = await explain_queries(run, match="FROM posts")
+    assert len(plans) == 2
+    assert all("ix_posts_active_created_at_id" in plan for plan in plans), plans
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_sort_options(
+        authorized_client: AsyncClient,
+        create_dummy_posts,
+        db_session,
+):
+    """
+    정렬 옵션별 Keyset 페이징 테스트 (동점은 id로 정렬)
+    """
+    await db_session.execute(update(Post).values(views=Post.id % 4, likes_count=Post.id % 3))
+    await db_session.commit()
+
+    async def collect(query: str) -> list[dict]:
+        items, cursor = [], None
+        while True:
+            url = f"/v1/posts/?limit=4&{query}" + (f"&cursor={cursor}" if cursor else "")
+            response = await authorized_client.get(url)
+            assert response.status_code == 200
+            items += response.json()
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                return items
+
+    latest = await collect("sort=latest")
+    assert len(latest) == create_dummy_posts
+
+    oldest = await collect("sort=oldest")
+    assert [p["id"] for p in oldest] == [p["id"] for p in reversed(latest)]
+
+    popular = await collect("sort=popular")
+    assert [p["id"] for p in popular] == [
+        p["id"] for p in sorted(latest, key=lambda p: (p["views"], p["id"]), reverse=True)
+    ]
+
+    most_liked = await collect("sort=most_liked&category=general")
+    general = [p for p in latest if p["category"] == "general"]
+    assert [p["id"] for p in most_liked] == [
+        p["id"] for p in sorted(general, key=lambda p: (p["likes_count"], p["id"]), reverse=True)
+    ]
+
+    # 다른 정렬로 발급된 커서 -> 400
+    response = await authorized_client.get("/v1/posts/?limit=4&sort=latest")
+    cursor = response.headers["X-Next-Cursor"]
+    response = await authorized_client.get(f"/v1/posts/?sort=popular&cursor={cursor}")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_sort_uses_partial_indexes(
+        authorized_client: AsyncClient,
+        create_dummy_posts,
+        db_session,
+        explain_queries,
+):
+    """
+    정렬/카테고리 조합마다 대응하는 부분 인덱스(ix_posts_active_*)로 Keyset 페이징
+    """
+    await db_session.execute(update(Post).values(views=Post.id % 4, likes_count=Post.id % 3))
+    await db_session.commit()
+
+    cases = {
+        "sort=popular": "ix_posts_active_views_id",
+        "sort=most_liked": "ix_posts_active_likes_count_id",
+        "sort=oldest": "ix_posts_active_created_at_id",
+        "sort=latest&category=general": "ix_posts_active_category_created_at_id",
+        "sort=popular&category=general": "ix_posts_active_category_views_id",
+        "sort=most_liked&category=general": "ix_posts_active_category_likes_count_id",
+    }
+    for query, index_name in cases.items():
+        response = await authorized_client.get(f"/v1/posts/?limit=2&{query}")
+        cursor = response.headers["X-Next-Cursor"]
+
+        async def run():
+            response = await authorized_client.get(f"/v1/posts/?limit=2&{query}&cursor={cursor}")
+            assert response.status_code == 200
+
+        plans = await explain_queries(run, match="FROM posts")
+        assert len(plans) == 1
+        assert index_name in plans[0], (query, plans[0])
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_full_text_search(
+        authorized_client: AsyncClient,
+        create_dummy_posts,
+):
+    """
+    전문 검색(q) 테스트
+    """
+    response = await authorized_client.get("/v1/posts/?q=python")
+    assert response.status_code == 200
+    assert len(response.json()) == 10
+
+    response = await authorized_client.get("/v1/posts/?q=youtube&category=general")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert len(data) == 5
+    assert all("Hololive" in item["title"] for item in data)
+
+    response = await authorized_client.get("/v1/posts/?q=Game")
+    assert response.status_code == 200
+    assert len(response.json()) == 0
+
+    # 전문 검색 + 커서 -> 400
+    cursor_response = await authorized_client.get("/v1/posts/?limit=1")
+    cursor = cursor_response.headers["X-Next-Cursor"]
+    response = await authorized_client.get(f"/v1/posts/?q=python&cursor={cursor}")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_korean_substring_search(
+        authorized_client: AsyncClient,
+        create_dummy_posts,
+):
+    """
+    2-gram 색인 기반 한국어 부분 문자열 검색 테스트
+    """
+    # 2글자 한국어 검색어
+    response = await authorized_client.get("/v1/posts/?title=제목")
+    assert response.status_code == 200
+    assert len(response.json()) == 15
+
+    # 2-gram을 만들 수 없는 토큰이 섞인 검색어 (내용 1, 내용 10)
+    response = await authorized_client.get("/v1/posts/?content=FastAPI 내용 1")
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+    # 수정 후 색인 갱신 확인
+    post_id = response.json()[0]["id"]
+    payload = {"title": "코로네 방송 일정", "content": "수정된 본문"}
+    response = await authorized_client.patch(f"/v1/posts/{post_id}", json=payload)
+    assert response.status_code == 200
+
+    response = await authorized_client.get("/v1/posts/?title=방송")
+    assert [item["id"] for item in response.json()] == [post_id]
+
+    response = await authorized_client.get("/v1/posts/?content=FastAPI 내용 1")
+    assert len(response.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_author_filter(
+        authorized_client: AsyncClient,
+        create_dummy_posts,
+):
+    """
+    작성자 부분 일치 / 정확히 일치 검색 테스트
+    """
+    response = await authorized_client.get("/v1/posts/?author=로네")
+    assert response.status_code == 200
+    assert len(response.json()) == 15
+
+    response = await authorized_client.get("/v1/posts/?author=코로네&author_exact=true")
+    assert response.status_code == 200
+    assert len(response.json()) == 15
+
+    response = await authorized_client.get("/v1/posts/?author=로네&author_exact=true")
+    assert response.status_code == 200
+    assert len(response.json()) == 0
+
+
+@pytest.mark.asyncio
+async def test_view_deltas_flush(
+        authorized_client: AsyncClient,
+        test_post_id,
+        test_redis_client,
+        db_session
+):
+    for _ in range(3):
+        response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+        assert response.status_code == 200
+    await asyncio.sleep(0.5)
+
+    # 증가분과 dirty 집합 적재 확인
+    delta = int(await test_redis_client.get(post_views_delta_key(test_post_id)))
+    assert delta == 3
+    assert await test_redis_client.sismember(POST_VIEWS_DIRTY_KEY, test_post_id)
+
+    # 증가분은 절대값이 아닌 덧셈으로 반영
+    repo = PostRepository(db_session)
+    assert await repo.apply_view_deltas(deltas={test_post_id: delta}) == 1
+    assert await repo.apply_view_deltas(deltas={test_post_id: delta}) == 1
+    await db_session.commit()
+
+    post_db = await db_session.get(Post, test_post_id)
+    assert post_db.views == delta * 2
+
+
+@pytest.mark.asyncio
+async def test_view_deltas_requeue_orphans(test_redis_client):
+    # dirty 집합에서 빠진 증가분 키 복구
+    orphan_id = 987654
+    await test_redis_client.set(post_views_delta_key(orphan_id), 5)
+    await test_redis_client.srem(POST_VIEWS_DIRTY_KEY, orphan_id)
+
+    counter = ViewCounter(test_redis_client)
+    assert await counter.requeue_orphans(scan_count=100) >= 1
+    assert await test_redis_client.sismember(POST_VIEWS_DIRTY_KEY, orphan_id)
+
+    await test_redis_client.delete(post_views_delta_key(orphan_id))
+    await test_redis_client.srem(POST_VIEWS_DIRTY_KEY, orphan_id)
+
+
+@pytest.fixture
+def scheduler_env(monkeypatch, test_redis_client, session_factory):
+    """스케줄러 작업이 테스트용 Redis / DB를 사용하도록 교체"""
+    monkeypatch.setattr(scheduler, "get_redis", lambda: test_redis_client)
+    monkeypatch.setattr(scheduler, "async_session_factory", session_factory)
+
+
+@pytest.mark.asyncio
+async def test_view_deltas_drain_and_restore(
+        authorized_client: AsyncClient,
+        test_post_id,
+        test_redis_client,
+        db_session,
+        scheduler_env,
+        monkeypatch
+):
+    for _ in range(3):
+        response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+        assert response.status_code == 200
+    await asyncio.sleep(0.5)
+
+    async def views_in_db() -> int:
+        return await db_session.scalar(select(Post.views).where(Post.id == test_post_id))
+
+    views_before = await views_in_db()
+
+    # DB 반영 실패 -> 꺼낸 증가분을 되돌림
+    apply_view_deltas = PostRepository.apply_view_deltas
+    async def failing_apply(self, *, deltas):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(PostRepository, "apply_view_deltas", failing_apply)
+    assert await scheduler.sync_post_views_to_db(batch_size=1000, max_batches=1) == 0
+    assert int(await test_redis_client.get(post_views_delta_key(test_post_id))) == 3
+    assert await test_redis_client.sismember(POST_VIEWS_DIRTY_KEY, test_post_id)
+    assert await views_in_db() == views_before
+
+    # 정상 반영 -> 증가분 키와 dirty 등록 제거, DB에 덧셈 반영
+    monkeypatch.setattr(PostRepository, "apply_view_deltas", apply_view_deltas)
+    assert await scheduler.sync_post_views_to_db(batch_size=1000, max_batches=10) >= 1
+    assert await test_redis_client.get(post_views_delta_key(test_post_id)) is None
+    assert not await test_redis_client.sismember(POST_VIEWS_DIRTY_KEY, test_post_id)
+    assert await views_in_db() == views_before + 3
+
+
+@pytest.mark.asyncio
+async def test_read_post_detail_with_comments_and_like(
+        authorized_client: AsyncClient,
+        test_post_id,
+        test_user_payload
+):
+    for content in ["첫 댓글", "둘째 댓글"]:
+        response = await authorized_client.post(
+            "/v1/comments/",
+            json={"post_id": test_post_id, "content": content}
+        )
+        assert response.status_code == 201
+
+    like = await authorized_client.put(f"/v1/posts/{test_post_id}/like")
+    assert like.status_code == 200
+
+    # 본문 캐시 미스 / 적중 모두 동일한 댓글, liked_by_me 반환
+    for _ in range(2):
+        response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["liked_by_me"] is True
+        assert [c["content"] for c in data["comments"]] == ["첫 댓글", "둘째 댓글"]
+        assert data["comments"][0]["user"]["nickname"] == test_user_payload["nickname"]
+
+
+@pytest.mark.asyncio
+async def test_read_post_conditional_get(
+        authorized_client: AsyncClient,
+        test_post_id
+):
+    response = await authorized_client.get(f"/v1/posts/{test_post_id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    # 변경 없음 -> 304 (본문 없음)
+    response = await authorized_client.get(
+        f"/v1/posts/{test_post_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = await authorized_client.get(
+        f"/v1/posts/{test_post_id}", headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    # 좋아요 변경 -> 새 ETag로 200
+    like = await authorized_client.put(f"/v1/posts/{test_post_id}/like")
+    assert like.status_code == 200
+
+    response = await authorized_client.get(
+        f"/v1/posts/{test_post_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_conditional_get(
+        authorized_client: AsyncClient,
+        create_dummy_posts
+):
+    response = await authorized_client.get("/v1/posts/", params={"limit": 5})
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await authorized_client.get(
+        "/v1/posts/", params={"limit": 5}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    # 새 게시글 작성 -> 목록 변경
+    payload = {"title": "새 글", "content": "목록 변경", "category": PostCategory.GENERAL}
+    created = await authorized_client.post("/v1/posts/", json=payload)
+    assert created.status_code == 201
+
+    response = await authorized_client.get(
+        "/v1/posts/", params={"limit": 5}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_conditional_get_skips_list_query(
+        authorized_client: AsyncClient,
+        create_dummy_posts,
+        db_session,
+        monkeypatch
+):
+    params = {"limit": 5, "with_flags": True}
+    response = await authorized_client.get("/v1/posts/", params=params)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    first_id = response.json()[0]["id"]
+
+    get_posts_list = PostRepository.get_posts_list
+
+    async def failing_list(self, **kwargs):
+        raise AssertionError("list query must not run before 304")
+
+    # 변경 없음 -> 버전 조회만으로 304 (목록 조회 없음)
+    monkeypatch.setattr(PostRepository, "get_posts_list", failing_list)
+    response = await authorized_client.get(
+        "/v1/posts/", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    # updated_at이 바뀌지 않는 조회수 변경도 ETag에 반영
+    monkeypatch.setattr(PostRepository, "get_posts_list", get_posts_list)
+    await db_session.execute(
+        update(Post)
+        .where(Post.id == first_id)
+        .values(views=Post.views + 1, updated_at=Post.updated_at)
+    )
+    await db_session.commit()
+
+    response = await authorized_client.get(
+        "/v1/posts/", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    # 좋아요(liked_by_me) 변경도 반영
+    etag = response.headers["etag"]
+    like = await authorized_client.put(f"/v1/posts/{first_id}/like")
+    assert like.status_code == 200
+
+    response = await authorized_client.get(
+        "/v1/posts/", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()[0]["liked_by_me"] is True
+
+
+@pytest.mark.asyncio
+async def test_like_ops_flush(
+        authorized_client: AsyncClient,
+        test_post_id,
+        test_user_payload,
+        db_session
+):
+    user_id = await db_session.scalar(
+        select(User.id).where(User.email == test_user_payload["email"])
+    )
+    repo = LikeRepository(db_session)
+
+    updated_at = await db_session.scalar(select(Post.updated_at).where(Post.id == test_post_id))
+
+    # 좋아요 반영 -> likes 행 생성 + likes_count +1
+    assert await repo.apply_like_ops(ops={test_post_id: {user_id: True}}) == 1
+    # 같은 작업 재반영은 중복 삽입 없이 무시 (좋아요 수 변화 없음)
+    assert await repo.apply_like_ops(ops={test_post_id: {user_id: True}}) == 0
+    await db_session.commit()
+
+    post_db = await db_session.get(Post, test_post_id)
+    assert post_db.likes_count == 1
+    assert post_db.updated_at == updated_at
+    assert await repo.get_liker_ids(post_id=test_post_id) == [user_id]
+
+    # 취소 반영
+    await repo.apply_like_ops(ops={test_post_id: {user_id: False}})
+    await db_session.commit()
+
+    await db_session.refresh(post_db)
+    assert post_db.likes_count == 0
+    assert await db_session.scalar(select(Like).where(Like.post_id == test_post_id)) is None
+
+
+@pytest.mark.asyncio
+async def test_like_write_behind_toggle_and_flush(
+        authorized_client: AsyncClient,
+        other_authorized_client: AsyncClient,
+        test_post_id,
+        test_user_payload,
+        test_redis_client,
+        db_session,
+        scheduler_env,
+        monkeypatch
+):
+    monkeypatch.setattr(settings, "USE_LIKE_WRITE_BEHIND", True)
+    user_id, other_id = [
+        await db_session.scalar(select(User.id).where(User.email == email))
+        for email in (test_user_payload["email"], "other@test.com")
+    ]
+    pending_key = post_likes_pending_key(test_post_id)
+
+    # 토글: Redis 집합/좋아요 수/미반영 작업만 갱신, DB는 그대로
+    response = await authorized_client.put(f"/v1/posts/{test_post_id}/like")
+    assert response.json() == {"liked": True, "likes_count": 1}
+    assert await db_session.scalar(select(Like).where(Like.post_id == test_post_id)) is None
+    assert await test_redis_client.sismember(POST_LIKES_DIRTY_KEY, test_post_id)
+
+    # 적재된 게시글의 토글도 카테고리 랭킹에 반영 (trending의 카테고리 기록 없이)
+    category_board = trending_key(PostCategory.GENERAL.value)
+    await test_redis_client.hdel(TRENDING_CATEGORIES_KEY, test_post_id)
+    score = await test_redis_client.zscore(category_board, test_post_id)
+
+    # 두 번 토글하면 최종 상태(취소)만 남음
+    assert (await other_authorized_client.put(f"/v1/posts/{test_post_id}/like")).json()["liked"] is True
+    assert await test_redis_client.zscore(category_board, test_post_id) == score + settings.TRENDING_LIKE_WEIGHT
+    response = await other_authorized_client.put(f"/v1/posts/{test_post_id}/like")
+    assert response.json() == {"liked": False, "likes_count": 1}
+    assert await test_redis_client.hgetall(pending_key) == {str(user_id): "1", str(other_id): "0"}
+
+    # 꺼낸 뒤 새 작업이 기록되면 되돌릴 때 새 작업 유지 (HSETNX)
+    store = LikeStore(test_redis_client)
+    ops = await store.drain(batch_size=1000)
+    assert ops[test_post_id] == {user_id: True, other_id: False}
+    assert await test_redis_client.exists(pending_key) == 0
+
+    response = await other_authorized_client.put(f"/v1/posts/{test_post_id}/like")
+    assert response.json() == {"liked": True, "likes_count": 2}
+    await store.restore(ops=ops)
+    assert await test_redis_client.hgetall(pending_key) == {str(user_id): "1", str(other_id): "1"}
+
+    # DB 반영 실패 -> 작업 유지
+    apply_like_ops = LikeRepository.apply_like_ops
+    async def failing_apply(self, *, ops):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(LikeRepository, "apply_like_ops", failing_apply)
+    assert await scheduler.flush_like_ops_to_db(batch_size=1000, max_batches=1) == 0
+    assert await test_redis_client.hgetall(pending_key) == {str(user_id): "1", str(other_id): "1"}
+
+    # 정상 반영 -> likes 행 + likes_count 갱신, 미반영 작업 제거
+    monkeypatch.setattr(LikeRepository, "apply_like_ops", apply_like_ops)
+    assert await scheduler.flush_like_ops_to_db(batch_size=1000, max_batches=10) == 1
+    assert await test_redis_client.exists(pending_key) == 0
+    assert not await test_redis_client.sismember(POST_LIKES_DIRTY_KEY, test_post_id)
+
+    assert await db_session.scalar(select(Post.likes_count).where(Post.id == test_post_id)) == 2
+    liker_ids = await db_session.scalars(select(Like.user_id).where(Like.post_id == test_post_id))
+    assert sorted(liker_ids) == sorted([user_id, other_id])
+
+    await store.forget(post_id=test_post_id)
+
+
+@pytest.mark.asyncio
+async def test_like_toggle_counter_consistency(
+        authorized_client: AsyncClient,
+        other_authorized_client: AsyncClient,
+        test_post_id,
+        db_session
+):
+    # 두 사용자의 토글이 섞여도 likes_count는 likes 행 수와 일치
+    responses = await asyncio.gather(
+        authorized_client.put(f"/v1/posts/{test_post_id}/like"),
+        other_authorized_client.put(f"/v1/posts/{test_post_id}/like"),
+    )
+    assert all(r.status_code == 200 for r in responses)
+    assert all(r.json()["liked"] is True for r in responses)
+
+    unlike = await other_authorized_client.put(f"/v1/posts/{test_post_id}/like")
+    assert unlike.json() == {"liked": False, "likes_count": 1}
+
+    post_db = await db_session.get(Post, test_post_id)
+    like_rows = await db_session.scalar(
+        select(func.count()).select_from(Like).where(Like.post_id == test_post_id)
+    )
+    assert post_db.likes_count == like_rows == 1
+
+    # 존재하지 않는 게시글
+    response = await authorized_client.put("/v1/posts/99999999/like")
+    assert response.status_code == 404
+    response = await authorized_client.post("/v1/posts/99999999/bookmark")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_read_posts_list_with_flags(
+        authorized_client: AsyncClient,
+        other_authorized_client: AsyncClient,
+        create_dummy_posts,
+        async_engine
+):
+    response = await authorized_client.get("/v1/posts/", params={"limit": 5})
+    post_ids = [p["id"] for p in response.json()]
+    assert "liked_by_me" not in response.json()[0]
+
+    await authorized_client.put(f"/v1/posts/{post_ids[0]}/like")
+    await authorized_client.post(f"/v1/posts/{post_ids[1]}/bookmark")
+
+    statements = []
+    def count_statement(*args):
+        statements.append(args[2])
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        response = await authorized_client.get(
+            "/v1/posts/", params={"limit": 5, "with_flags": True}
+        )
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    flags = {p["id"]: (p["liked_by_me"], p["bookmarked_by_me"]) for p in response.json()}
+    assert flags[post_ids[0]] == (True, False)
+    assert flags[post_ids[1]] == (False, True)
+    assert flags[post_ids[2]] == (False, False)
+
+    # 목록 1회 + 좋아요 1회 + 북마크 1회 (인증 사용자 조회 제외)
+    page_statements = [
+        s for s in statements
+        if any(table in s for table in ("FROM posts", "FROM likes", "FROM bookmarks"))
+    ]
+    assert len(page_statements) == 3
+
+    # 다른 사용자 기준 -> 모두 False
+    response = await other_authorized_client.get("/v1/posts/", params={"limit": 5, "with_flags": True})
+    assert response.status_code == 200
+    assert not any(p["liked_by_me"] or p["bookmarked_by_me"] for p in response.json())
+
+    # 내 북마크 목록
+    response = await authorized_client.get("/v1/users/me/bookmarks", params={"with_flags": True})
+    bookmarks = {p["id"]: p for p in response.json()}
+    assert bookmarks[post_ids[1]]["bookmarked_by_me"] is True
+    assert bookmarks[post_ids[1]]["liked_by_me"] is False
+
+
+@pytest.mark.asyncio
+async def test_read_trending_posts(
+        authorized_client: AsyncClient,
+        test_redis_client
+):
+    post_ids = []
+    for title in ["인기 A", "인기 B"]:
+        payload = {"title": title, "content": "trending", "category": PostCategory.EVENT}
+        response = await authorized_client.post("/v1/posts/", json=payload)
+        post_ids.append(response.json()["id"])
+    post_a, post_b = post_ids
+
+    # B: 조회 2회 + 좋아요, A: 조회 1회
+    for post_id in [post_a, post_b, post_b]:
+        response = await authorized_client.get(f"/v1/posts/{post_id}")
+        assert response.status_code == 200
+    like = await authorized_client.put(f"/v1/posts/{post_b}/like")
+    assert like.status_code == 200
+    await asyncio.sleep(0.5)
+
+    response = await authorized_client.get(
+        "/v1/posts/trending", params={"category": PostCategory.EVENT.value}
+    )
+    assert response.status_code == 200
+    ranked = [p["id"] for p in response.json()]
+    assert ranked.index(post_b) < ranked.index(post_a)
+
+    # 카테고리가 다른 랭킹에는 포함되지 않음
+    response = await authorized_client.get(
+        "/v1/posts/trending", params={"category": PostCategory.INFORMATION.value}
+    )
+    assert post_b not in [p["id"] for p in response.json()]
+
+    # 삭제된 게시글은 랭킹에서 제거
+    response = await authorized_client.delete(f"/v1/posts/{post_b}")
+    assert response.status_code == 204
+
+    response = await authorized_client.get("/v1/posts/trending")
+    assert post_b not in [p["id"] for p in response.json()]
+
+    # 감쇠 후 하위 점수 정리
+    board = TrendingBoard(test_redis_client)
+    assert await board.decay(factor=0.1, min_score=0.5, max_size=1000) >= 1
+    assert post_a not in await board.top(category=PostCategory.EVENT, limit=100)
@@ -0,0 +1,57 @@
+import pytest
+
+from app.cache.keys import scheduler_lock_key
+from app.cache.lease_lock import LeaseLock
+from app.core import scheduler
+
+
+@pytest.mark.asyncio
+async def test_lease_lock_single_holder(test_redis_client):
+    key = scheduler_lock_key("test_single_holder")
+    first = LeaseLock(test_redis_client, key=key, ttl_ms=10_000)
+    second = LeaseLock(test_redis_client, key=key, ttl_ms=10_000)
+
+    assert await first.acquire() is True
+    # 임대 중에는 다른 워커가 획득하지 못함
+    assert await second.acquire() is False
+
+    await first.release()
+    assert await second.acquire() is True
+    await second.release()
+
+
+@pytest.mark.asyncio
+async def test_lease_lock_release_keeps_others_lease(test_redis_client):
+    key = scheduler_lock_key("test_foreign_release")
+    holder = LeaseLock(test_redis_client, key=key, ttl_ms=10_000)
+    stale = LeaseLock(test_redis_client, key=key, ttl_ms=10_000)
+
+    assert await holder.acquire() is True
+    # 토큰이 다른 락의 해제는 현재 임대를 지우지 않음 (만료 후 늦게 끝난 워커 등)
+    await stale.release()
+    assert await test_redis_client.get(key) == holder.token
+
+    await holder.release()
+    assert await test_redis_client.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_run_with_lease_skips_when_held(test_redis_client, monkeypatch):
+    monkeypatch.setattr(scheduler, "get_redis", lambda: test_redis_client)
+    job_id = "test_run_with_lease"
+    runs = 0
+
+    async def job() -> int:
+        nonlocal runs
+        runs += 1
+        return 0
+
+    other_worker = LeaseLock(test_redis_client, key=scheduler_lock_key(job_id), ttl_ms=10_000)
+    assert await other_worker.acquire() is True
+    await scheduler.run_with_lease(job_id, job)
+    assert runs == 0
+
+    await other_worker.release()
+    await scheduler.run_with_lease(job_id, job)
+    assert runs == 1
+    assert await test_redis_client.get(scheduler_lock_key(job_id)) is None